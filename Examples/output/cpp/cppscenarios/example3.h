@@ -0,0 +1,74 @@
+// Copyright (c) 2019 ...
+
+#pragma once
+
+// Local headers
+
+// Third party headers
+
+// Standard library headers
+#include <iostream>
+#include <string>
+
+namespace Cornichon::Tabulated::Scenarios
+{
+  /// Test class scenario
+  class AddFromAFile
+  {
+  public:
+    /// Constructor
+    AddFromAFile()
+    {
+      std::clog << "  Feature: Tabulated" << std::endl;
+      std::clog << "    Scenario: Add from a file" << std::endl;
+    }
+
+    /// Gherkin DSL step
+    void GivenAnInitial(unsigned int value)
+    {
+      std::clog << "      Given an initial " << value << std::endl;
+    }
+
+    /// Gherkin DSL step
+    void WhenYouAddA(unsigned int second)
+    {
+      std::clog << "      When you add a " << second << std::endl;
+    }
+
+    /// Gherkin DSL step
+    void ThenTheResultIs(unsigned int sum)
+    {
+      std::clog << "      Then the result is " << sum << std::endl;
+    }
+  };
+
+  /// Test class scenario
+  class PriceFromAFile
+  {
+  public:
+    /// Constructor
+    PriceFromAFile()
+    {
+      std::clog << "  Feature: Tabulated" << std::endl;
+      std::clog << "    Scenario: Price from a file" << std::endl;
+    }
+
+    /// Gherkin DSL step
+    void GivenACosting(const std::string& name, double price)
+    {
+      std::clog << "      Given a " << name << " costing " << price << std::endl;
+    }
+
+    /// Gherkin DSL step
+    void WhenItIs(const std::string& available)
+    {
+      std::clog << "      When it is " << available << std::endl;
+    }
+
+    /// Gherkin DSL step
+    void ThenTheStockIs(const std::string& stock)
+    {
+      std::clog << "      Then the stock is " << stock << std::endl;
+    }
+  };
+}
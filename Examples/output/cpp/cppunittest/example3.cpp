@@ -0,0 +1,52 @@
+// Other bespoke headers
+#include "../cppscenarios/example3.h"
+
+// Third party headers
+#include "CppUnitTest.h"
+
+namespace Cornichon::Tabulated
+{
+  TEST_CLASS(Feature)
+  {
+    static void AddFromAFile(unsigned int value, unsigned int second, unsigned int sum)
+    {
+      Scenarios::AddFromAFile scenario;
+      scenario.GivenAnInitial(value);
+      scenario.WhenYouAddA(second);
+      scenario.ThenTheResultIs(sum);
+    }
+
+    static void PriceFromAFile(const std::string& name, double price, bool available, int stock)
+    {
+      Scenarios::PriceFromAFile scenario;
+      scenario.GivenACosting(name, price);
+      scenario.WhenItIs(available);
+      scenario.ThenTheStockIs(stock);
+    }
+
+    TEST_METHOD(AddFromAFile123)
+    {
+      AddFromAFile(1, 2, 3);
+    }
+
+    TEST_METHOD(AddFromAFile224)
+    {
+      AddFromAFile(2, 2, 4);
+    }
+
+    TEST_METHOD(AddFromAFile102030)
+    {
+      AddFromAFile(10, 20, 30);
+    }
+
+    TEST_METHOD(PriceFromAFileCucumber15True10)
+    {
+      PriceFromAFile("cucumber", 1.5, true, 10);
+    }
+
+    TEST_METHOD(PriceFromAFileGherkin2False1)
+    {
+      PriceFromAFile("gherkin", 2, false, -1);
+    }
+  };
+}
@@ -0,0 +1,126 @@
+// Copyright (c) 2019 ...
+
+// Other bespoke headers
+#include "../cppscenarios/example3.h"
+
+// Third party headers
+#include "gtest/gtest.h"
+
+// Standard headers
+#include <fstream>
+#include <sstream>
+#include <string>
+#include <tuple>
+#include <utility>
+#include <vector>
+
+namespace Cornichon::Tabulated
+{
+  class TestFixture : public ::testing::Test
+  {
+  protected:
+    void SetUp() override
+    {
+    }
+
+    void TearDown() override
+    {
+    }
+  };
+
+  template <typename Type>
+  Type ExampleCell(const std::string& cell)
+  {
+    Type value{};
+    std::istringstream stream(cell);
+    stream >> value;
+    return value;
+  }
+
+  template <>
+  inline bool ExampleCell<bool>(const std::string& cell)
+  {
+    return cell == "true" || cell == "True";
+  }
+
+  template <>
+  inline std::string ExampleCell<std::string>(const std::string& cell)
+  {
+    return cell;
+  }
+
+  template <typename... Types, std::size_t... Indices>
+  std::tuple<Types...> ExampleRow(const std::vector<std::string>& cells, std::index_sequence<Indices...>)
+  {
+    return std::tuple<Types...>(ExampleCell<Types>(cells[Indices])...);
+  }
+
+  template <typename... Types>
+  std::vector<std::tuple<Types...>> LoadExamples(const std::string& path, char delimiter)
+  {
+    std::vector<std::tuple<Types...>> rows;
+    std::ifstream file(path);
+    std::string line;
+    bool header = true;
+    while (std::getline(file, line))
+    {
+      if (line.find_first_not_of(" \t\r") == std::string::npos)
+        continue;
+      if (header)
+      {
+        header = false;
+        continue;
+      }
+      std::vector<std::string> cells;
+      std::istringstream stream(line);
+      std::string cell;
+      while (std::getline(stream, cell, delimiter))
+      {
+        auto first = cell.find_first_not_of(" \t\r");
+        auto last = cell.find_last_not_of(" \t\r");
+        cells.push_back(first == std::string::npos ? "" : cell.substr(first, last - first + 1));
+      }
+      if (cells.size() >= sizeof...(Types))
+        rows.push_back(ExampleRow<Types...>(cells, std::index_sequence_for<Types...>()));
+    }
+    return rows;
+  }
+
+  static void AddFromAFile(unsigned int value, unsigned int second, unsigned int sum)
+  {
+    Scenarios::AddFromAFile scenario;
+    scenario.GivenAnInitial(value);
+    scenario.WhenYouAddA(second);
+    scenario.ThenTheResultIs(sum);
+  }
+
+  static void PriceFromAFile(const std::string& name, double price, bool available, int stock)
+  {
+    Scenarios::PriceFromAFile scenario;
+    scenario.GivenACosting(name, price);
+    scenario.WhenItIs(available);
+    scenario.ThenTheStockIs(stock);
+  }
+
+  class AddFromAFileExamples : public ::testing::TestWithParam<std::tuple<unsigned int, unsigned int, unsigned int>>
+  {
+  };
+
+  TEST_P(AddFromAFileExamples, Examples)
+  {
+    std::apply(AddFromAFile, GetParam());
+  }
+
+  INSTANTIATE_TEST_SUITE_P(Rows, AddFromAFileExamples, ::testing::ValuesIn(LoadExamples<unsigned int, unsigned int, unsigned int>("data/example3.csv", ',')));
+
+  class PriceFromAFileExamples : public ::testing::TestWithParam<std::tuple<std::string, double, bool, int>>
+  {
+  };
+
+  TEST_P(PriceFromAFileExamples, Examples)
+  {
+    std::apply(PriceFromAFile, GetParam());
+  }
+
+  INSTANTIATE_TEST_SUITE_P(Rows, PriceFromAFileExamples, ::testing::ValuesIn(LoadExamples<std::string, double, bool, int>("data/example3.tsv", '\t')));
+}
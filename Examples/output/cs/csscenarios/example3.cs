@@ -0,0 +1,80 @@
+namespace Cornichon.Tabulated.Scenarios
+{
+  /// <summary>
+  /// Test class scenario
+  /// </summary>
+  public class AddFromAFile
+  {
+    /// <summary>
+    /// Constructor
+    /// </summary>
+    public AddFromAFile()
+    {
+      System.Console.WriteLine("  Feature: Tabulated");
+      System.Console.WriteLine("    Scenario: Add from a file");
+    }
+
+    /// <summary>
+    /// Gherkin DSL step
+    /// </summary>
+    public void GivenAnInitial(uint value)
+    {
+      System.Console.WriteLine("      Given an initial " + value);
+    }
+
+    /// <summary>
+    /// Gherkin DSL step
+    /// </summary>
+    public void WhenYouAddA(uint second)
+    {
+      System.Console.WriteLine("      When you add a " + second);
+    }
+
+    /// <summary>
+    /// Gherkin DSL step
+    /// </summary>
+    public void ThenTheResultIs(uint sum)
+    {
+      System.Console.WriteLine("      Then the result is " + sum);
+    }
+  }
+
+  /// <summary>
+  /// Test class scenario
+  /// </summary>
+  public class PriceFromAFile
+  {
+    /// <summary>
+    /// Constructor
+    /// </summary>
+    public PriceFromAFile()
+    {
+      System.Console.WriteLine("  Feature: Tabulated");
+      System.Console.WriteLine("    Scenario: Price from a file");
+    }
+
+    /// <summary>
+    /// Gherkin DSL step
+    /// </summary>
+    public void GivenACosting(string name, double price)
+    {
+      System.Console.WriteLine("      Given a " + name + " costing " + price);
+    }
+
+    /// <summary>
+    /// Gherkin DSL step
+    /// </summary>
+    public void WhenItIs(string available)
+    {
+      System.Console.WriteLine("      When it is " + available);
+    }
+
+    /// <summary>
+    /// Gherkin DSL step
+    /// </summary>
+    public void ThenTheStockIs(string stock)
+    {
+      System.Console.WriteLine("      Then the stock is " + stock);
+    }
+  }
+}
@@ -0,0 +1,83 @@
+namespace Cornichon.Tabulated
+{
+  using NUnit.Framework;
+
+  /// <summary>
+  /// Gherkin DSL feature
+  /// </summary>
+  [TestFixture]
+  public class Feature
+  {
+    /// <summary>
+    /// Gherkin DSL scenario
+    /// </summary>
+    private static void AddFromAFile(uint value, uint second, uint sum)
+    {
+      var scenario = new Scenarios.AddFromAFile();
+      scenario.GivenAnInitial(value);
+      scenario.WhenYouAddA(second);
+      scenario.ThenTheResultIs(sum);
+    }
+
+    /// <summary>
+    /// Gherkin DSL scenario
+    /// </summary>
+    private static void PriceFromAFile(string name, double price, bool available, int stock)
+    {
+      var scenario = new Scenarios.PriceFromAFile();
+      scenario.GivenACosting(name, price);
+      scenario.WhenItIs(available);
+      scenario.ThenTheStockIs(stock);
+    }
+
+    /// <summary>
+    /// Gherkin DSL examples
+    /// </summary>
+    private static System.Collections.Generic.IEnumerable<object[]> AddFromAFileRows()
+    {
+      var lines = System.Linq.Enumerable.Where(System.IO.File.ReadLines("data/example3.csv"), line => line.Trim().Length > 0);
+      foreach (var line in System.Linq.Enumerable.Skip(lines, 1))
+      {
+        var cells = System.Array.ConvertAll(line.Split(','), cell => cell.Trim());
+        if (cells.Length >= 3)
+        {
+          yield return new object[] { uint.Parse(cells[0]), uint.Parse(cells[1]), uint.Parse(cells[2]) };
+        }
+      }
+    }
+
+    /// <summary>
+    /// Gherkin DSL test
+    /// </summary>
+    [TestCaseSource(nameof(AddFromAFileRows))]
+    public void AddFromAFileExamples(uint value, uint second, uint sum)
+    {
+      AddFromAFile(value, second, sum);
+    }
+
+    /// <summary>
+    /// Gherkin DSL examples
+    /// </summary>
+    private static System.Collections.Generic.IEnumerable<object[]> PriceFromAFileRows()
+    {
+      var lines = System.Linq.Enumerable.Where(System.IO.File.ReadLines("data/example3.tsv"), line => line.Trim().Length > 0);
+      foreach (var line in System.Linq.Enumerable.Skip(lines, 1))
+      {
+        var cells = System.Array.ConvertAll(line.Split('\t'), cell => cell.Trim());
+        if (cells.Length >= 4)
+        {
+          yield return new object[] { cells[0], double.Parse(cells[1], System.Globalization.CultureInfo.InvariantCulture), bool.Parse(cells[2]), int.Parse(cells[3]) };
+        }
+      }
+    }
+
+    /// <summary>
+    /// Gherkin DSL test
+    /// </summary>
+    [TestCaseSource(nameof(PriceFromAFileRows))]
+    public void PriceFromAFileExamples(string name, double price, bool available, int stock)
+    {
+      PriceFromAFile(name, price, available, stock);
+    }
+  }
+}
@@ -0,0 +1,78 @@
+namespace Cornichon.Tabulated
+{
+  using Microsoft.VisualStudio.TestTools.UnitTesting;
+
+  /// <summary>
+  /// Gherkin DSL feature
+  /// </summary>
+  [TestClass]
+  public class Feature
+  {
+    /// <summary>
+    /// Gherkin DSL scenario
+    /// </summary>
+    private static void AddFromAFile(uint value, uint second, uint sum)
+    {
+      var scenario = new Scenarios.AddFromAFile();
+      scenario.GivenAnInitial(value);
+      scenario.WhenYouAddA(second);
+      scenario.ThenTheResultIs(sum);
+    }
+
+    /// <summary>
+    /// Gherkin DSL scenario
+    /// </summary>
+    private static void PriceFromAFile(string name, double price, bool available, int stock)
+    {
+      var scenario = new Scenarios.PriceFromAFile();
+      scenario.GivenACosting(name, price);
+      scenario.WhenItIs(available);
+      scenario.ThenTheStockIs(stock);
+    }
+
+    /// <summary>
+    /// Gherkin DSL test
+    /// </summary>
+    [TestMethod]
+    public void AddFromAFile123()
+    {
+      AddFromAFile(1, 2, 3);
+    }
+
+    /// <summary>
+    /// Gherkin DSL test
+    /// </summary>
+    [TestMethod]
+    public void AddFromAFile224()
+    {
+      AddFromAFile(2, 2, 4);
+    }
+
+    /// <summary>
+    /// Gherkin DSL test
+    /// </summary>
+    [TestMethod]
+    public void AddFromAFile102030()
+    {
+      AddFromAFile(10, 20, 30);
+    }
+
+    /// <summary>
+    /// Gherkin DSL test
+    /// </summary>
+    [TestMethod]
+    public void PriceFromAFileCucumber15True10()
+    {
+      PriceFromAFile("cucumber", 1.5, true, 10);
+    }
+
+    /// <summary>
+    /// Gherkin DSL test
+    /// </summary>
+    [TestMethod]
+    public void PriceFromAFileGherkin2False1()
+    {
+      PriceFromAFile("gherkin", 2, false, -1);
+    }
+  }
+}
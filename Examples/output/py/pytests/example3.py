@@ -0,0 +1,39 @@
+import pytest
+from example3_scenarios import *
+
+
+def load_examples(path, delimiter, types):
+    """Load the rows of an Examples data file when the tests are collected"""
+    rows = []
+    with open(path, "r", encoding="utf-8-sig") as f:
+        lines = (line for line in f if len(line.strip()) > 0)
+        next(lines, None)
+        for line in lines:
+            cells = [cell.strip() for cell in line.split(delimiter)]
+            if len(cells) >= len(types):
+                rows.append(tuple(cell in ("true", "True") if type is bool else type(cell) for type, cell in zip(types, cells)))
+    return rows
+
+
+@pytest.mark.parametrize(
+    "value, second, sum",
+    load_examples("data/example3.csv", ",", (int, int, int)),
+)
+def test_add_from_a_file(value, second, sum):
+    """Gherkin DSL test"""
+    scenario = Scenarios.AddFromAFile()
+    scenario.GivenAnInitial(value)
+    scenario.WhenYouAddA(second)
+    scenario.ThenTheResultIs(sum)
+
+
+@pytest.mark.parametrize(
+    "name, price, available, stock",
+    load_examples("data/example3.tsv", "\t", (str, float, bool, int)),
+)
+def test_price_from_a_file(name, price, available, stock):
+    """Gherkin DSL test"""
+    scenario = Scenarios.PriceFromAFile()
+    scenario.GivenACosting(name, price)
+    scenario.WhenItIs(available)
+    scenario.ThenTheStockIs(stock)
@@ -0,0 +1,39 @@
+class Scenarios:
+
+    class AddFromAFile:
+        """Test class scenario"""
+        def __init__(self):
+            """Initialiser"""
+            print("  Feature: Tabulated")
+            print("    Scenario: Add from a file")
+
+        def GivenAnInitial(self, value):
+            """Gherkin DSL step"""
+            print("      Given an initial " + str(value))
+
+        def WhenYouAddA(self, second):
+            """Gherkin DSL step"""
+            print("      When you add a " + str(second))
+
+        def ThenTheResultIs(self, sum):
+            """Gherkin DSL step"""
+            print("      Then the result is " + str(sum))
+
+    class PriceFromAFile:
+        """Test class scenario"""
+        def __init__(self):
+            """Initialiser"""
+            print("  Feature: Tabulated")
+            print("    Scenario: Price from a file")
+
+        def GivenACosting(self, name, price):
+            """Gherkin DSL step"""
+            print("      Given a " + str(name) + " costing " + str(price))
+
+        def WhenItIs(self, available):
+            """Gherkin DSL step"""
+            print("      When it is " + str(available))
+
+        def ThenTheStockIs(self, stock):
+            """Gherkin DSL step"""
+            print("      Then the stock is " + str(stock))
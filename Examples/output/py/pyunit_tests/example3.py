@@ -0,0 +1,44 @@
+import unittest
+from example3_scenarios import *
+
+
+class Tabulated(unittest.TestCase):
+    """Gherkin DSL feature"""
+
+    def AddFromAFile(self, value, second, sum):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.AddFromAFile()
+        scenario.GivenAnInitial(value)
+        scenario.WhenYouAddA(second)
+        scenario.ThenTheResultIs(sum)
+
+    def PriceFromAFile(self, name, price, available, stock):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.PriceFromAFile()
+        scenario.GivenACosting(name, price)
+        scenario.WhenItIs(available)
+        scenario.ThenTheStockIs(stock)
+
+    def test_addFromAFile_1_2_3(self):
+        """Gherkin DSL test"""
+        self.AddFromAFile(1, 2, 3)
+
+    def test_addFromAFile_2_2_4(self):
+        """Gherkin DSL test"""
+        self.AddFromAFile(2, 2, 4)
+
+    def test_addFromAFile_10_20_30(self):
+        """Gherkin DSL test"""
+        self.AddFromAFile(10, 20, 30)
+
+    def test_priceFromAFile_cucumber_15_true_10(self):
+        """Gherkin DSL test"""
+        self.PriceFromAFile("cucumber", 1.5, True, 10)
+
+    def test_priceFromAFile_gherkin_2_false_1(self):
+        """Gherkin DSL test"""
+        self.PriceFromAFile("gherkin", 2, False, -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
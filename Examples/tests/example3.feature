@@ -0,0 +1,13 @@
+Feature: Tabulated
+
+Scenario Outline: Add from a file
+  Given an initial <value>
+  When you add a <second>
+  Then the result is <sum>
+  Examples: @data/example3.csv
+
+Scenario Outline: Price from a file
+  Given a <name> costing <price>
+  When it is <available>
+  Then the stock is <stock>
+  Examples: @data/example3.tsv
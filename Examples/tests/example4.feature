@@ -0,0 +1,31 @@
+@calculator
+Feature: Tagged
+
+Background:
+  Given an initial <value>
+
+@smoke
+Scenario Outline: Add one other
+  When you add a <second>
+  Then the result is <sum>
+  Examples:
+    | value | second | sum |
+    | 1     | 2      | 3   |
+
+@slow @wip
+Scenario Outline: Add nothing
+  Then the result is <value>
+  Examples:
+    | value |
+    | 1     |
+
+@smoke @slow
+# A comment between the tags and the scenario
+Scenario Outline: Add two others
+  When you add a <second>
+  And you add a <third>
+  Then the result is <sum>
+  @large
+  Examples:
+    | value | second | third | sum |
+    | 1     | 2      | 3     | 6   |
@@ -0,0 +1,14 @@
+# language: fr
+Fonctionnalité: Accumulateur
+
+Contexte:
+  Soit un nombre initial <valeur>
+
+Plan du scénario: Ajouter deux autres
+  Quand on ajoute <second>
+  Et qu'on ajoute <troisième>
+  Alors le résultat est <somme>
+  Exemples:
+    | valeur | second | troisième | somme |
+    | 1      | 2      | 3         | 6     |
+    | 2      | 3      | 4         | 9     |
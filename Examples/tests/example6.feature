@@ -0,0 +1,8 @@
+# language: ja
+機能: 計算機
+
+シナリオ: 足し算
+  前提 初期値は1
+  もし2を足す
+  かつ3を足す
+  ならば結果は6
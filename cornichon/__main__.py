@@ -0,0 +1,122 @@
+import argparse
+import os.path
+import sys
+import batch
+import gherkin
+import parsecache
+import registry
+import watch
+
+
+def CacheCommand(args):
+    cache = parsecache.Cache(args.directory)
+    if args.action == "stats":
+        stats = cache.Stats()
+        for key in stats:
+            print("{}: {}".format(key, stats[key]))
+    elif args.action == "clear":
+        print("Removed {} entries from {}".format(cache.Clear(), args.directory))
+    return 0
+
+
+def BuildCommand(args):
+    try:
+        settings = batch.Settings(args.targets, args.assignments)
+        features = batch.Discover(args.sources)
+    except (KeyError, ValueError, ImportError, OSError) as e:
+        print("cornichon build: {}".format(e.args[0] if isinstance(e, KeyError) else e), file=sys.stderr)
+        return 2
+    if args.ninja is not None:
+        fragment = batch.Ninja(features, args.out, args.targets, args.assignments)
+        batch.WriteIfChanged(args.ninja, fragment)
+        print("Declared {} features in {}".format(len(features), args.ninja))
+        return 0
+    manifest = None
+    if not args.no_manifest:
+        manifest = args.manifest or os.path.join(args.out, batch.Manifest)
+    written, errors, unchanged = batch.Build(features, args.out, settings, args.jobs, args.cache, manifest, args.force, args.depfiles)
+    generated = len(features) - len(errors) - len(unchanged)
+    print("Generated {} files from {} features, {} unchanged".format(len(written), generated, len(unchanged)))
+    for path, error in errors:
+        print("{}: {}".format(path, error), file=sys.stderr)
+    return 1 if len(errors) > 0 else 0
+
+
+def WatchCommand(args):
+    try:
+        settings = batch.Settings(args.targets, args.assignments)
+        batch.Discover(args.sources)
+    except (KeyError, ValueError, ImportError, OSError) as e:
+        print("cornichon watch: {}".format(e.args[0] if isinstance(e, KeyError) else e), file=sys.stderr)
+        return 2
+
+    def Report(written, errors, seconds):
+        print("Wrote {} files in {:.1f}ms".format(len(written), seconds * 1000), flush=True)
+        for path, error in errors:
+            print("{}: {}".format(path, error), file=sys.stderr, flush=True)
+
+    monitor = watch.Monitor(args.sources, args.poll)
+    watcher = watch.Watcher(args.sources, args.out, settings, monitor, args.debounce / 1000, args.depfiles)
+    print("Watching {} with {}".format(", ".join(args.sources), type(monitor).__name__.lower()), flush=True)
+    try:
+        watcher.Run(Report)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def OutputsCommand(args):
+    if args.rebuild:
+        registry.Default.Rebuild()
+    for output in gherkin.ListModules():
+        print(output)
+    return 0
+
+
+def Main(argv=None):
+    """The cornichon command line"""
+    parser = argparse.ArgumentParser(prog="cornichon", description="A small Gherkin DSL parser that generates stub code")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    cache = commands.add_parser("cache", help="Inspect or empty the cache of parsed features")
+    cache.add_argument("action", choices=["stats", "clear"])
+    cache.add_argument("--directory", default=".cornichon_cache", help="The cache directory")
+    cache.set_defaults(run=CacheCommand)
+
+    build = commands.add_parser("build", help="Generate the stub code for every feature file beneath the sources")
+    build.add_argument("sources", nargs="+", help="The directories, or feature files, to generate")
+    build.add_argument("--out", required=True, help="The directory to write the stub code to, mirroring the sources")
+    build.add_argument("--target", action="append", required=True, dest="targets", help="An output type to generate")
+    build.add_argument("-j", "--jobs", type=int, help="The number of processes, by default one for each CPU")
+    build.add_argument("--set", action="append", default=[], dest="assignments", metavar="SETTING=VALUE",
+                       help="Change a setting of the output types that have it, such as cases/step=snake")
+    build.add_argument("--cache", help="A directory to cache the parsed features in")
+    build.add_argument("--manifest", help="The record of the features generated, by default in the output directory")
+    build.add_argument("--no-manifest", action="store_true", help="Keep no manifest, for when a build system tracks the changes")
+    build.add_argument("--force", action="store_true", help="Generate every feature, whether it has changed or not")
+    build.add_argument("--depfiles", action="store_true", help="Write a Makefile depfile beside each file, named like example.cpp.d")
+    build.add_argument("--ninja", metavar="FILE", help="Write a Ninja fragment that generates each file rather than generating them")
+    build.set_defaults(run=BuildCommand)
+
+    watching = commands.add_parser("watch", help="Generate the stub code for the features beneath the sources as they change")
+    watching.add_argument("sources", nargs="+", help="The directories, or feature files, to watch")
+    watching.add_argument("--out", required=True, help="The directory to write the stub code to, mirroring the sources")
+    watching.add_argument("--target", action="append", required=True, dest="targets", help="An output type to generate")
+    watching.add_argument("--set", action="append", default=[], dest="assignments", metavar="SETTING=VALUE",
+                          help="Change a setting of the output types that have it, such as cases/step=snake")
+    watching.add_argument("--depfiles", action="store_true", help="Write a Makefile depfile beside each file, named like example.cpp.d")
+    watching.add_argument("--poll", action="store_true", help="Look for changes by polling rather than with inotify")
+    watching.add_argument("--debounce", type=float, default=50, metavar="MS",
+                          help="How long the files must stop changing for before they are generated")
+    watching.set_defaults(run=WatchCommand)
+
+    outputs = commands.add_parser("outputs", help="List the output types, including those added by other packages")
+    outputs.add_argument("--rebuild", action="store_true", help="Scan again for output types rather than use the saved index")
+    outputs.set_defaults(run=OutputsCommand)
+
+    args = parser.parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
@@ -0,0 +1,354 @@
+import concurrent.futures
+import hashlib
+import json
+import os
+import os.path
+import shlex
+import sys
+import common
+import gherkin
+import parsecache
+import registry
+
+
+# Change whenever the manifest changes so that older manifests are ignored
+Version = "1"
+
+Manifest = ".cornichon_manifest.json"
+
+
+def Discover(sources):
+    """The feature files beneath the sources, each with its path relative to the source it was found in,
+    in the order they are written"""
+    features = []
+    for source in sources:
+        if not os.path.isdir(source):
+            features.append((source, os.path.basename(source)))
+            continue
+        directories = [source]
+        while len(directories) > 0:
+            with os.scandir(directories.pop()) as it:
+                for entry in it:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir():
+                        directories.append(entry.path)
+                    elif entry.name.endswith(".feature") and entry.is_file():
+                        features.append((entry.path, os.path.relpath(entry.path, source)))
+    features.sort(key=lambda feature: (feature[1], feature[0]))
+    for i in range(1, len(features)):
+        if features[i - 1][1] == features[i][1]:
+            raise ValueError("{} and {} would write the same files".format(features[i - 1][0], features[i][0]))
+    return features
+
+
+def Assign(settings, help, bits, value):
+    """Set the value at the path of keys if the help documents it, returning whether it did"""
+    for bit in bits[:-1]:
+        if help and bit not in help:
+            return False
+        help = help[bit] if help else {}
+        if not isinstance(help, dict):
+            return False
+        settings = settings.setdefault(bit, {})
+    if help and not isinstance(help.get(bits[-1]), str):
+        return False
+    settings[bits[-1]] = value
+    return True
+
+
+def Settings(targets, assignments=()):
+    """The settings of each output type with the assignments, like cases/step=snake, made to those that have them"""
+    settings = {}
+    extensions = {}
+    for target in targets:
+        mod = gherkin.Import(target)
+        if not hasattr(mod, "Extension"):
+            raise ValueError("{} does not say what files it writes".format(target))
+        if mod.Extension() in extensions:
+            raise ValueError("{} and {} both write {} files".format(extensions[mod.Extension()], target, mod.Extension()))
+        extensions[mod.Extension()] = target
+        settings[target] = mod.Settings()
+
+    for assignment in assignments:
+        key, sep, value = assignment.partition("=")
+        if len(sep) == 0:
+            raise ValueError("{} is not a setting=value".format(assignment))
+        assigned = False
+        for target in targets:
+            help = gherkin.Import(target).HelpSettings()
+            assigned = Assign(settings[target], help, key.split("/"), value) or assigned
+        if not assigned:
+            raise KeyError("{} is not a setting of {}".format(key, ", ".join(targets)))
+
+    for target in targets:
+        common.FrozenSettings(settings[target], gherkin.Import(target).HelpSettings())
+    return settings
+
+
+def Digest(path, text=False):
+    """A hash of the file's bytes, or of its text for the files written in text mode, None if it cannot be read"""
+    try:
+        if text:
+            with open(path, "r", encoding="utf-8") as f:
+                data = f.read().encode("utf-8")
+        else:
+            with open(path, "rb") as f:
+                data = f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+    return hashlib.sha256(data).hexdigest()
+
+
+def Modules(mod):
+    """The files of the plugin, its language's utilities and the core modules, with their templates, that the
+    stub code of an output type is generated by"""
+    core = []
+    with os.scandir(registry.Package) as it:
+        for entry in it:
+            if entry.name.endswith(".py") and entry.is_file():
+                core.append(entry.path)
+    plugin = os.path.realpath(mod.__file__)
+    language = os.path.basename(os.path.dirname(plugin))
+    utils = os.path.join(os.path.dirname(plugin), language + "utils.py")
+    return [path for path in sorted(core) + [plugin, utils] if os.path.isfile(path)]
+
+
+def Signature(settings):
+    """For each output type the fingerprint of its settings and a hash of the code that generates it"""
+    signature = {}
+    for target in settings:
+        generator = hashlib.sha256(target.encode("utf-8"))
+        for path in Modules(gherkin.Import(target)):
+            with open(path, "rb") as f:
+                generator.update(f.read())
+        fingerprint = common.FrozenSettings(settings[target]).Fingerprint()
+        signature[target] = {"settings": fingerprint, "generator": generator.hexdigest()}
+    return signature
+
+
+def Depfile(target, dependencies):
+    """A Makefile rule, as read by Make, Ninja and CMake, saying that the target is made from the dependencies"""
+    def Escape(path):
+        return path.replace("$", "$$").replace("#", "\\#").replace(" ", "\\ ")
+    lines = [Escape(target) + ":"] + [" " + Escape(dependency) for dependency in dependencies]
+    return " \\\n".join(lines) + "\n"
+
+
+def Ninja(features, out, targets, assignments=()):
+    """A Ninja fragment with a build statement for each file generated from the features, each running cornichon
+    for the one feature and reading the files it depends upon from the depfile written beside it"""
+    def Escape(path):
+        return path.replace("$", "$$").replace(" ", "$ ").replace(":", "$:")
+
+    def Quote(bit):
+        # Variables are substituted into the command as they are, so they hold what the shell is to read
+        return shlex.quote(bit).replace("$", "$$")
+    arguments = []
+    for assignment in assignments:
+        arguments += ["--set", assignment]
+    arguments += ["-j", "1", "--no-manifest", "--depfiles"]
+    command = [Quote(bit) for bit in [sys.executable, registry.Package, "build"]]
+    command += ["$feature", "--out", "$outdir", "--target", "$target"]
+    command += [Quote(bit) for bit in arguments]
+    lines = []
+    lines.append("rule cornichon")
+    lines.append("  command = " + " ".join(command))
+    lines.append("  description = cornichon $target $in")
+    lines.append("  depfile = $out.d")
+    # Files left unchanged do not make those built from them out of date
+    lines.append("  restat = 1")
+    for path, relative in features:
+        stub = os.path.splitext(relative)[0]
+        for target in targets:
+            filename = os.path.join(out, stub + gherkin.Import(target).Extension())
+            lines.append("")
+            lines.append("build {}: cornichon {}".format(Escape(filename), Escape(path)))
+            lines.append("  feature = " + Quote(path))
+            lines.append("  outdir = " + Quote(os.path.dirname(filename) or os.curdir))
+            lines.append("  target = " + Quote(target))
+    return "\n".join(lines) + "\n"
+
+
+def Unchanged(path, out, entry, signature, depfiles=False):
+    """Whether the feature, the files it read, the settings and the generators are those the entry was made from,
+    and the files written from them are still as they were written"""
+    if entry is None or entry.get("targets") != signature or entry.get("depfiles", False) != depfiles:
+        return False
+    if Digest(path) != entry.get("feature"):
+        return False
+    for name, digest in entry.get("inputs", {}).items():
+        if Digest(name) != digest:
+            return False
+    for name, digest in entry.get("outputs", {}).items():
+        if Digest(os.path.join(out, name), True) != digest:
+            return False
+    return True
+
+
+def LoadManifest(path):
+    """The entry of each feature, keyed by its relative path, from when it was last generated"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != Version:
+        return {}
+    return manifest.get("features", {})
+
+
+def SaveManifest(path, features):
+    manifest = {"version": Version, "features": dict(sorted(features.items()))}
+    temp = "%s.%d.tmp" % (path, os.getpid())
+    os.makedirs(os.path.dirname(path) or os.curdir, exist_ok=True)
+    with open(temp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(temp, path)
+
+
+def WriteIfChanged(filename, text):
+    """Write the text to the file unless it already holds it, so that its modification time only changes when
+    its content does, returning whether it was written. The file is replaced in one step so that it is never
+    seen half written."""
+    data = text.replace("\n", os.linesep).encode("utf-8")
+    try:
+        # Files of another size cannot be the same so are not read
+        if os.stat(filename).st_size == len(data):
+            with open(filename, "rb") as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(filename) or os.curdir, exist_ok=True)
+    temp = "%s.%d.tmp" % (filename, os.getpid())
+    try:
+        with open(temp, "wb") as f:
+            f.write(data)
+        os.replace(temp, filename)
+    except BaseException:
+        try:
+            os.remove(temp)
+        except OSError:
+            pass
+        raise
+    return True
+
+
+class Job:
+    """The output types and settings each feature is generated for, and the cache it is parsed through"""
+    def __init__(self, settings, cache=None, out=None, signature=None, depfiles=False):
+        self.settings = settings
+        self.cache = cache
+        self.out = out
+        self.signature = signature
+        self.depfiles = depfiles
+        self.modules = {}
+
+    def Generate(self, feature, entry=None):
+        """The files generated from the feature, parsed once for the output types sharing a tag expression, and the
+        manifest entry describing them. The feature is not parsed when the entry shows that nothing has changed."""
+        path, relative = feature
+        if self.signature is not None and Unchanged(path, self.out, entry, self.signature, self.depfiles):
+            return path, None, None, entry
+        stub = os.path.splitext(relative)[0]
+        try:
+            targets = list(self.settings)
+            digest = Digest(path)
+            # The scenarios selected by the tag expression are all that the settings change about the parse
+            parses = {}
+            files = []
+            for target in targets:
+                mod = gherkin.Import(target)
+                settings = self.settings[target]
+                tags = settings.get("tags", "")
+                if tags not in parses:
+                    if self.cache is not None:
+                        parses[tags] = self.cache.Parse(path, settings)
+                    else:
+                        parses[tags] = gherkin.ParsedFeature(*gherkin.Parse(path, settings))
+                if hasattr(mod, "ScenariosFile") and "scenarios file" in settings:
+                    settings = dict(settings)
+                    settings["scenarios file"] = mod.ScenariosFile(os.path.basename(stub))
+                files.append((stub + mod.Extension(), mod.Generate(parses[tags], settings)))
+        except (OSError, ValueError) as e:
+            # Features that can't be read or parsed, UnicodeDecodeError being a ValueError, other errors are bugs
+            return path, [], "{}: {}".format(type(e).__name__, e), None
+        # Examples data files are read for the types of their columns
+        data = set()
+        for parsed in parses.values():
+            data.update([scenario.examples.path for scenario in parsed.scenarios if scenario.examples.path is not None])
+        data = sorted(data)
+        if self.depfiles:
+            for target, (name, stubCode) in zip(targets, list(files)):
+                if target not in self.modules:
+                    self.modules[target] = Modules(gherkin.Import(target))
+                dependencies = [path] + data + self.modules[target]
+                files.append((name + ".d", Depfile(os.path.join(self.out, name), dependencies)))
+        entry = {}
+        entry["feature"] = digest
+        entry["inputs"] = {name: Digest(name) for name in data}
+        entry["targets"] = self.signature
+        entry["depfiles"] = self.depfiles
+        entry["outputs"] = {name: hashlib.sha256(stubCode.encode("utf-8")).hexdigest() for name, stubCode in files}
+        return path, files, None, entry
+
+
+# The job of a worker process
+job = None
+
+
+def Start(settings, cache, out=None, signature=None, depfiles=False):
+    global job
+    job = Job(settings, None if cache is None else parsecache.Cache(cache), out, signature, depfiles)
+
+
+def Generate(feature, entry=None):
+    return job.Generate(feature, entry)
+
+
+def Build(features, out, settings, jobs=None, cache=None, manifest=None, force=False, depfiles=False):
+    """Generate the files for each feature into the output directory, fanned out over a pool of processes,
+    and write them in the order of the features. With a manifest the features unchanged since they were
+    last generated are skipped unless forced. The files written, less those that already held their stub
+    code, the features that fail with their errors and the features skipped are returned. With depfiles each
+    file has a depfile beside it listing the feature, its Examples data files and the modules it was generated by."""
+    signature = None
+    previous = {}
+    if manifest is not None:
+        signature = Signature(settings)
+        previous = {} if force else LoadManifest(manifest)
+    entries = [previous.get(feature[1]) for feature in features]
+
+    if jobs == 1 or len(features) < 2:
+        Start(settings, cache, out, signature, depfiles)
+        results = map(Generate, features, entries)
+        pool = None
+    else:
+        workers = jobs or os.cpu_count() or 1
+        pool = concurrent.futures.ProcessPoolExecutor(workers, initializer=Start, initargs=(settings, cache, out, signature, depfiles))
+        results = pool.map(Generate, features, entries, chunksize=max(1, len(features) // (workers * 4)))
+
+    written = []
+    errors = []
+    unchanged = []
+    current = {}
+    try:
+        for feature, (path, files, error, entry) in zip(features, results):
+            if error is not None:
+                errors.append((path, error))
+                continue
+            current[feature[1]] = entry
+            if files is None:
+                unchanged.append(path)
+                continue
+            for name, stubCode in files:
+                filename = os.path.join(out, name)
+                if WriteIfChanged(filename, stubCode):
+                    written.append(filename)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if manifest is not None:
+            SaveManifest(manifest, current)
+    return written, errors, unchanged
@@ -1,4 +1,10 @@
-import gherkin
+import collections.abc
+import functools
+import hashlib
+import itertools
+import json
+import operator
+import re
 
 
 def ExtractParams(line, delim1, delim2):
@@ -19,21 +25,127 @@ def Argument(arg, type, templates):
     return templates[type].format(arg)
 
 
+class TokenChars(dict):
+    """Translation table keeping only alphanumerics, spaces and underscores, filled in as characters are met"""
+    def __missing__(self, key):
+        char = chr(key)
+        self[key] = key if char.isalnum() or char in " _" else None
+        return self[key]
+
+
+tokenChars = TokenChars()
+
+
+@functools.lru_cache(maxsize=65536)
 def Tokenise(line, case=""):
-    line = ''.join([i for i in line if (i.isalnum() or i in [" ", "_"])])
-    while line.find("  ") != -1:
-        line = line.replace("  ", " ")
+    """Tokenise some text in the given case, the hits and misses are given by Tokenise.cache_info()"""
+    words = line.translate(tokenChars).split()
 
     if case == "Camel":
-        return ''.join([Upper(i) for i in line.split()])
+        return ''.join([Upper(i) for i in words])
     elif case == "camel":
-        return Lower(''.join([Upper(i) for i in line.split()]))
+        return Lower(''.join([Upper(i) for i in words]))
     elif case == "snake":
-        return '_'.join([Lower(i) for i in line.split()])
+        return '_'.join([Lower(i) for i in words])
     elif case == "Snake":
-        return Upper('_'.join([Lower(i) for i in line.split()]))
+        return Upper('_'.join([Lower(i) for i in words]))
+
+    return ''.join(words)
+
+
+def Rstrip(chunks):
+    """Yield the chunks as if they had been joined and right stripped"""
+    pending = ""
+    for chunk in chunks:
+        stripped = chunk.rstrip()
+        if len(stripped) == 0:
+            pending += chunk
+            continue
+        yield pending + stripped
+        pending = chunk[len(stripped):]
+
+
+def Truncate(chunks, number):
+    """Yield the chunks as if they had been joined and the last number of characters dropped"""
+    pending = ""
+    for chunk in chunks:
+        pending += chunk
+        if len(pending) > number:
+            yield pending[:-number]
+            pending = pending[-number:]
+
+
+def Frozen(value):
+    """A hashable copy of a value, functions and classes by identity and other objects by class and attributes"""
+    if isinstance(value, FrozenSettings):
+        return value
+    if isinstance(value, dict):
+        return tuple(sorted([(key, Frozen(value[key])) for key in value], key=lambda item: item[0]))
+    if isinstance(value, (list, tuple)):
+        return tuple([Frozen(item) for item in value])
+    if callable(value):
+        # Not by name, as lambdas and functions defined in other functions share theirs
+        return value
+    if hasattr(value, "__dict__"):
+        return (type(value).__module__, type(value).__qualname__, Frozen(vars(value)))
+    return value
+
+
+Placeholder = re.compile(r'\[\[([^\[\]]*)\]\]')
+
 
-    return line.replace(" ", "")
+class Template:
+    """A template split once into its text and [[...]] placeholders so that it renders with a single join"""
+    __slots__ = ("parts", "names", "values")
+
+    def __init__(self, text):
+        self.parts = Placeholder.split(text)
+        self.names = self.parts[1::2]
+        self.values = operator.itemgetter(*self.names) if len(self.names) > 0 else None
+        if len(self.names) == 1:
+            getter = self.values
+            self.values = lambda values: (getter(values),)
+
+    def Parts(self, values):
+        """The text and placeholders with those that have values filled in and the others left as they are"""
+        parts = self.parts[:]
+        if self.values is None:
+            return parts
+        try:
+            parts[1::2] = self.values(values)
+        except KeyError:
+            parts[1::2] = [values[name] if name in values else "[[%s]]" % name for name in self.names]
+        return parts
+
+    def Render(self, values):
+        return ''.join(self.Parts(values))
+
+
+@functools.lru_cache(maxsize=None)
+def Compile(text):
+    return Template(text)
+
+
+def Compiled(name, text, templates=None):
+    """The template, or the override of that name in the templates setting, compiled once"""
+    if templates and name in templates:
+        text = templates[name]
+    return Compile(text)
+
+
+def Render(name, text, values, templates=None):
+    return Compiled(name, text, templates).Render(values)
+
+
+def Surround(name, text, values, templates=None):
+    """The template rendered before and after its [[TestBody]], of which an override must keep exactly one"""
+    template = Compiled(name, text, templates)
+    count = template.names.count("TestBody")
+    if count != 1:
+        raise ValueError("Template {} has {} [[TestBody]] placeholders rather than one".format(name, count))
+    parts = template.Parts(values)
+    i = 2 * template.names.index("TestBody") + 1
+    return ''.join(parts[:i]), ''.join(parts[i + 1:])
 
 
 def FeatureName(feature, case):
@@ -59,6 +171,9 @@ def Settings():
         settings["values"][type] = "{}"
 
     settings["values"]["string"] = "\"{}\""
+    settings["data directory"] = ""
+    settings["tags"] = ""
+    settings["templates"] = {}
     return settings
 
 
@@ -72,9 +187,74 @@ def HelpSettings():
         settings["values"][type] = "The template used to wrap the value of a parameter"
     for case in ["class", "param", "step", "scenario", "test"]:
         settings["cases"][case] = "When tokenising some text use one of camel, Camel, snake or Snake case"
+    settings["data directory"] = "The directory the tests load Examples data files from when they run"
+    settings["tags"] = "A tag expression such as @smoke and not @slow selecting the scenarios to parse, all of them if empty"
+    settings["templates"] = {}
     return settings
 
 
+class FrozenSettings(collections.abc.Mapping):
+    """Settings that cannot be changed so that they can be hashed and used as a cache key, read like the dicts
+    they are made from. Keys not in the help are rejected, except beneath a help that is an empty dict."""
+    __slots__ = ("values", "key", "hash", "fingerprint")
+
+    def __init__(self, settings, help=None, level="settings"):
+        values = {}
+        for key in settings:
+            name = '{}["{}"]'.format(level, key)
+            if help and key not in help:
+                raise KeyError("{} is not a setting".format(name))
+            sub = help[key] if help else None
+            value = settings[key]
+            if isinstance(value, collections.abc.Mapping):
+                if sub is not None and not isinstance(sub, dict):
+                    raise TypeError("{} should be a string".format(name))
+                value = FrozenSettings(value, sub, name)
+            elif not isinstance(value, str):
+                raise TypeError("{} should be a string".format(name))
+            elif sub is not None and not isinstance(sub, str):
+                raise TypeError("{} should be a dict".format(name))
+            values[key] = value
+        self.values = values
+        self.key = tuple(sorted(values.items(), key=lambda item: item[0]))
+        self.hash = hash(self.key)
+        self.fingerprint = None
+
+    def __getitem__(self, key):
+        return self.values[key]
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __hash__(self):
+        return self.hash
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenSettings):
+            return self.hash == other.hash and self.key == other.key
+        return super().__eq__(other)
+
+    def __repr__(self):
+        return "FrozenSettings({!r})".format(self.Thaw())
+
+    def __reduce__(self):
+        return (FrozenSettings, (self.Thaw(),))
+
+    def Thaw(self):
+        """A copy as nested dicts that can be changed"""
+        return {key: value.Thaw() if isinstance(value, FrozenSettings) else value for key, value in self.values.items()}
+
+    def Fingerprint(self):
+        """A hash of the settings that is the same from run to run, unlike hash()"""
+        if self.fingerprint is None:
+            text = json.dumps(self.Thaw(), sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+            self.fingerprint = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return self.fingerprint
+
+
 def UnmodifiedArg(val, type):
     return val
 
@@ -83,65 +263,65 @@ def ArgumentList(args, types, formats, argModifier, sep=", "):
     if len(args) == 0:
         return ""
 
-    line = ""
+    bits = []
     for i in range(len(args)):
         type = types[i]
         bit = formats[type].format(argModifier(args[i], type))
         if len(bit.strip()) == 0:
             continue
-        line = "{}{}{}".format(line, sep, bit)
+        bits.append(bit)
 
-    return line[len(sep):]
+    return sep.join(bits)
 
 
 class PrintTestBody:
-    def Scenario(self, scenario, settings):
-        lines = scenario.lines.split('\n')
-        if scenario.examples.Exists():
-            fullArgs = scenario.examples.ArgumentsList(settings["types"])
-            return self.ScenarioDecl(lines[0], fullArgs, settings)
-        return self.TestDecl(lines[0])
-
-    def TestBody(self, scenarios, settings):
-        concat = ""
-        # Create the scenarios
-        for scenario in scenarios:
-            concat += self.Scenario(scenario, settings)
-            steps = ""
-            template = self.step
-            for step in scenario.Steps():
-                lines = step[1].split('\n')
-                st = gherkin.Step(step[0], step[1])
-                method = st.Tokenise(settings["cases"]["step"])
-                arguments = st.ParameterList(scenario.examples.types)
-                buffer = template
-                buffer = buffer.replace("[[method]]", method)
-                buffer = buffer.replace("[[arguments]]", arguments)
-                steps += buffer
-            concat += self.Body(scenario, steps)
-        concat = concat.rstrip() + "\n"
-        concat += self.Examples(scenarios, settings)
-        return concat.rstrip()
-
-    def Examples(self, scenarios, settings):
-        concat = ""
-        for scenario in scenarios:
-            lines = scenario.lines.split('\n')
-            sc = lines[0]
-            if scenario.examples.Exists():
-                lines = scenario.examples.lines.split('\n')
-                for line in lines[2:]:
-                    if len(line.strip()) == 0:
-                        continue
-                    arguments = scenario.examples.ArgumentsInstance(settings["values"], line, self.argModifier)
-                    if "" == arguments:
-                        continue
-                    concat += self.Example(sc, arguments)
-        return concat
+    def Scenario(self, scenario):
+        if scenario.outline:
+            return self.ScenarioDecl(scenario)
+        return self.TestDecl(scenario)
+
+    def Declaration(self, scenario):
+        """Yield the declaration of the test, printers whose declarations hold every example yielding them in parts"""
+        yield self.Scenario(scenario)
+
+    def Render(self, scenario):
+        template = Compiled(self.prefix + "/step", self.step, self.templates)
+        steps = ''.join([template.Render({"method": step.method, "arguments": step.parameters}) for step in scenario.steps])
+        yield from self.Declaration(scenario)
+        yield self.Body(scenario, steps)
+
+    def Scenarios(self, feature):
+        key = ("scenario", Frozen(self))
+        for scenario in feature.scenarios:
+            yield from scenario.Rendered(key, self.Render)
+
+    def Stream(self, feature):
+        """Yield the test body scenario by scenario and then example by example"""
+        scenarios = Rstrip(self.Scenarios(feature))
+        return Rstrip(itertools.chain(scenarios, ["\n"], self.Examples(feature)))
+
+    def TestBody(self, feature):
+        return ''.join(self.Stream(feature))
+
+    # Printers that load Examples data files when the tests run set this
+    DataExample = None
+
+    def RenderExamples(self, scenario):
+        if scenario.data is not None and self.DataExample is not None:
+            yield self.DataExample(scenario)
+        elif scenario.outline:
+            for example in scenario.Examples(self.argModifier):
+                yield self.Example(scenario, example)
+
+    def Examples(self, feature):
+        key = ("examples", Frozen(self))
+        for scenario in feature.scenarios:
+            yield from scenario.Rendered(key, self.RenderExamples)
 
 
 class PrintScenario:
-    def __init__(self):
+    def __init__(self, templates=None):
+        self.templates = templates
         self.stringify = '"%s"'
         self.contractions = {' + ""': '', ' "" + ': ' '}
         self.line = "\n      %s;"
@@ -164,29 +344,16 @@ class PrintScenario:
         lines = "%s%s %s" % ('  ', 'Feature:', feature)
         return self.Description(lines)
 
-    def Documentation(self, scenario, feature, settings):
-        lines = scenario.lines.split('\n')
-        lines = "%s%s %s" % ('    ', 'Scenario:', scenario.lines)
+    def Documentation(self, scenario, feature):
+        lines = "%s%s %s" % ('    ', 'Scenario:', scenario.text)
         description = self.Description(lines)
         return feature + "\n" + description
 
-    def Steps(self, scenario, settings):
-        concat = ""
-        steps = []
-        # parse the sections
-        for s in scenario.Steps():
-            lines = s[1].split('\n')
-            step = gherkin.Step(s[0], s[1])
-            stepName = step.Tokenise(settings["cases"]["step"])
-            if 0 != steps.count(stepName):
-                continue
-            steps.append(stepName)
-            arguments = step.ArgumentList(scenario.examples.types, settings["types"])
-            buffer = self.step
-            buffer = buffer.replace("[[stepName]]", stepName)
-            buffer = buffer.replace("[[arguments]]", arguments)
-            lines = "      %s %s" % (s[0], s[1])
-            description = self.Description(step.Sub(lines, self.sub))
-            buffer = buffer.replace("[[description]]", description)
-            concat += buffer
-        return concat.rstrip()
+    def Steps(self, scenario):
+        template = Compiled(self.prefix + "/step", self.step, self.templates)
+        concat = []
+        for step in scenario.uniqueSteps:
+            lines = "      %s %s" % (step.keyword, step.text)
+            description = self.Description(step.step.Sub(lines, self.sub))
+            concat.append(template.Render({"stepName": step.method, "arguments": step.arguments, "description": description}))
+        return ''.join(concat).rstrip()
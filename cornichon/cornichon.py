@@ -1,15 +1,27 @@
 """A small Gherkin DSL parser that generates stub code against various test frameworks"""
+import os.path
+import batch
+import common
 import gherkin
+import parsecache
 
 
 def Settings(output):
     """Get the default settings for the output type"""
     mod = gherkin.Import(output)
     settings = mod.Settings()
-    gherkin.Import(output, True)
     return settings
 
 
+def FrozenSettings(output, settings=None):
+    """Get the settings for the output type, the defaults or those given, checked against its help and frozen so
+    that they can be hashed and fingerprinted"""
+    mod = gherkin.Import(output)
+    if settings is None:
+        settings = mod.Settings()
+    return common.FrozenSettings(settings, mod.HelpSettings())
+
+
 def PrintSettings(settings, level="settings"):
     """Utility that prints all the given settings"""
     for key in settings:
@@ -26,7 +38,6 @@ def HelpSettings(output):
     """Utility that prints all the help for individual settings"""
     mod = gherkin.Import(output)
     settings = mod.HelpSettings()
-    gherkin.Import(output, True)
     PrintSettings(settings)
 
 
@@ -36,10 +47,79 @@ def ListModules():
         print(mod)
 
 
+def Cache(directory=".cornichon_cache", size=64 * 1024 * 1024):
+    """Get an on-disk cache of parsed features, bounded in bytes, to pass to Parse"""
+    return parsecache.Cache(directory, size)
+
+
+def Parse(input, settings, cache=None):
+    """Parse the Gherkin DSL once so that it can be generated for several output types"""
+    if isinstance(input, gherkin.ParsedFeature):
+        return input
+    if cache is not None:
+        return cache.Parse(input, settings)
+    scenarios, feature = gherkin.Parse(input, settings)
+    return gherkin.ParsedFeature(scenarios, feature)
+
+
+class Incremental:
+    """Regenerate features as they are edited, reparsing and rerendering only the scenarios that changed"""
+    def __init__(self):
+        self.features = {}
+
+    def Parse(self, input, settings):
+        """Parse the Gherkin DSL reusing the scenarios unchanged since it was last parsed"""
+        if isinstance(input, gherkin.ParsedFeature):
+            return input
+        # Features read from a path each keep their own scenarios
+        key = input if isinstance(input, str) else None
+        cache = self.features.setdefault(key, {})
+        directory = None
+        if key is not None:
+            # Read rather than memory mapped as the scenarios kept would hold the file open
+            directory = os.path.dirname(input)
+            with open(input, "rb") as f:
+                input = f.read()
+        scenarios, feature = gherkin.Parse(input, settings, cache, directory)
+        return gherkin.ParsedFeature(scenarios, feature)
+
+    def Generate(self, input, settings, output):
+        """Generate the stub code, the same as Generate, splicing in the unchanged scenarios as last rendered"""
+        return Generate(self.Parse(input, settings), settings, output)
+
+
 def Generate(input, settings, output):
-    """Generate the stub code for the output type"""
-    parsed = gherkin.Parse(input, settings)
+    """Generate the stub code for the output type from the Gherkin DSL or a parsed feature"""
+    parsed = Parse(input, settings)
     mod = gherkin.Import(output)
     stubCode = mod.Generate(parsed, settings)
-    gherkin.Import(output, True)
     return stubCode
+
+
+def GenerateTo(input, settings, output, fp):
+    """Write the stub code for the output type to the file object as it is generated"""
+    parsed = Parse(input, settings)
+    mod = gherkin.Import(output)
+    if hasattr(mod, "Stream"):
+        for chunk in mod.Stream(parsed, settings):
+            fp.write(chunk)
+    else:
+        fp.write(mod.Generate(parsed, settings))
+
+
+def GenerateAll(input, outputs):
+    """Generate the stub code for each output type, keyed by output type, parsing once for each tag expression
+    as the scenarios selected are all that the settings change about the parse"""
+    stubCodes = {}
+    parsed = {}
+    for output in outputs:
+        tags = outputs[output].get("tags", "")
+        if tags not in parsed:
+            parsed[tags] = Parse(input, outputs[output])
+        stubCodes[output] = Generate(parsed[tags], outputs[output], output)
+    return stubCodes
+
+
+def WriteIfChanged(filename, stubCode):
+    """Write the stub code to the file only if it differs from what is there, returning whether it was written"""
+    return batch.WriteIfChanged(filename, stubCode)
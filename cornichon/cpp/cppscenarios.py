@@ -1,6 +1,7 @@
 import common
+import itertools
 import cpputils
-import gherkin
+import lowered
 
 
 def Settings():
@@ -13,9 +14,14 @@ def HelpSettings():
     return settings
 
 
+def Extension():
+    return ".h"
+
+
 class PrintScenario(common.PrintScenario):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, templates=None):
+        super().__init__(templates)
+        self.prefix = "cpp/cppscenarios"
         self.line = "\n      std::clog << %s << std::endl;"
         self.contractions = {' << ""': '', ' "" << ': ' '}
         self.sub = '" << %s << "'
@@ -29,13 +35,41 @@ class PrintScenario(common.PrintScenario):
 """[1:]
 
 
-def Generate(parsed, settings):
-    scenarios = parsed[0]
-    feature = parsed[1]
-    featureName = common.FeatureName(feature, settings["cases"]["namespace"])
+def Class(scenario, printer, featureDesc):
+    buffer = """
+  /// Test class scenario
+  class [[featureName]]
+  {
+  public:
+    /// Constructor
+    [[featureName]]()
+    {
+[[documentation]]
+    }
+
+[[steps]]
+  };
+
+"""[1:]
+
+    values = {}
+    values["featureName"] = scenario.className
+    values["documentation"] = printer.Documentation(scenario, featureDesc)
+    values["steps"] = printer.Steps(scenario)
+    yield common.Render("cpp/cppscenarios/class", buffer, values, printer.templates)
+
+
+def Classes(printer, feature, featureDesc):
+    key = (__name__, common.Frozen(printer), featureDesc)
+    for scenario in feature.scenarios:
+        yield from scenario.Rendered(key, Class, printer, featureDesc)
 
-    printer = PrintScenario()
-    featureDesc = printer.FeatureDesc(feature)
+
+def Stream(parsed, settings):
+    feature = lowered.Lower(parsed, settings)
+
+    printer = PrintScenario(settings.get("templates"))
+    featureDesc = printer.FeatureDesc(feature.text)
 
     concat = """
 #pragma once
@@ -52,34 +86,14 @@ namespace [[fullnamespace]]
 {
 """[1:]
 
-    namespace = common.Tokenise(featureName, settings["cases"]["namespace"])
-    namespace = cpputils.NameSpace(settings, namespace + "::Scenarios")
-    concat = concat.replace("[[fullnamespace]]", namespace.Begin())
+    namespace = cpputils.NameSpace(settings, feature.namespace + "::Scenarios")
+    concat = common.Render("cpp/cppscenarios", concat, {"fullnamespace": namespace.Begin()}, printer.templates)
 
-    for scenario in scenarios:
-        buffer = """
-  /// Test class scenario
-  class [[featureName]]
-  {
-  public:
-    /// Constructor
-    [[featureName]]()
-    {
-[[documentation]]
-    }
-
-[[steps]]
-  };
-
-"""[1:]
+    yield from common.Truncate(itertools.chain([concat], Classes(printer, feature, featureDesc)), 2)
+    yield common.Render("cpp/cppscenarios/end", """
+[[endnamespace]]
+""", {"endnamespace": namespace.End()}, printer.templates)
 
-        buffer = buffer.replace("[[featureName]]", common.Tokenise(scenario.lines, settings["cases"]["class"]))
-        documentation = printer.Documentation(scenario, featureDesc, settings)
-        buffer = buffer.replace("[[documentation]]", documentation)
-        buffer = buffer.replace("[[steps]]", printer.Steps(scenario, settings))
-        concat += buffer
 
-    concat = concat[:-2] + """
-[[endnamespace]]
-""".replace("[[endnamespace]]", namespace.End())
-    return concat
+def Generate(parsed, settings):
+    return ''.join(Stream(parsed, settings))
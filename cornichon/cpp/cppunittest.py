@@ -1,5 +1,6 @@
 import common
 import cpputils
+import lowered
 
 
 def Settings():
@@ -16,9 +17,16 @@ def HelpSettings():
     return settings
 
 
-def Generate(parsed, settings):
-    scenarios = parsed[0]
-    feature = parsed[1]
+def Extension():
+    return ".cpp"
+
+
+def ScenariosFile(stub):
+    return stub + ".h"
+
+
+def Stream(parsed, settings):
+    feature = lowered.Lower(parsed, settings)
     buffer = """
 // Other bespoke headers
 #include "[[scenarios file]]"
@@ -35,23 +43,24 @@ namespace [[fullnamespace]]
 [[endnamespace]]
 """[1:]
 
-    buffer = buffer.replace("[[scenarios file]]", settings["scenarios file"])
+    values = {}
+    values["scenarios file"] = settings["scenarios file"]
 
-    namespace = common.FeatureName(feature, settings["cases"]["namespace"])
-    namespace = cpputils.NameSpace(settings, namespace)
-    buffer = buffer.replace("[[fullnamespace]]", namespace.Begin())
-    buffer = buffer.replace("[[endnamespace]]", namespace.End())
+    namespace = cpputils.NameSpace(settings, feature.namespace)
+    values["fullnamespace"] = namespace.Begin()
+    values["endnamespace"] = namespace.End()
 
     # Print the class
-    featureName = common.FeatureName(feature, settings["cases"]["class"])
-    buffer = buffer.replace("[[featureName]]", featureName)
-    className = common.Tokenise("Feature", settings["cases"]["class"])
-    buffer = buffer.replace("[[className]]", className)
+    values["className"] = feature.fixtureName
+    head, tail = common.Surround("cpp/cppunittest", buffer, values, settings.get("templates"))
 
     decl = "    static void {0}({1})\n"
     testdecl = "    TEST_METHOD({0})\n"
     cpp = cpputils.Cpp(settings, decl, testdecl, "    ")
-    testBody = cpp.TestBody(scenarios, settings)
-    buffer = buffer.replace("[[TestBody]]", testBody)
+    yield head
+    yield from cpp.Stream(feature)
+    yield tail
+
 
-    return buffer
+def Generate(parsed, settings):
+    return ''.join(Stream(parsed, settings))
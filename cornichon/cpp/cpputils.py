@@ -1,5 +1,4 @@
 import common
-import gherkin
 
 
 def Settings():
@@ -26,6 +25,88 @@ def HelpSettings():
     return settings
 
 
+# The C++ types of the Examples columns loaded from data files
+Types = {
+    "bool": "bool",
+    "int": "int",
+    "uint": "unsigned int",
+    "float": "double",
+    "string": "std::string",
+}
+
+LoaderHeaders = """
+
+// Standard headers
+#include <fstream>
+#include <sstream>
+#include <string>
+#include <tuple>
+#include <utility>
+#include <vector>
+"""[1:]
+
+Loader = """
+
+  template <typename Type>
+  Type ExampleCell(const std::string& cell)
+  {
+    Type value{};
+    std::istringstream stream(cell);
+    stream >> value;
+    return value;
+  }
+
+  template <>
+  inline bool ExampleCell<bool>(const std::string& cell)
+  {
+    return cell == "true" || cell == "True";
+  }
+
+  template <>
+  inline std::string ExampleCell<std::string>(const std::string& cell)
+  {
+    return cell;
+  }
+
+  template <typename... Types, std::size_t... Indices>
+  std::tuple<Types...> ExampleRow(const std::vector<std::string>& cells, std::index_sequence<Indices...>)
+  {
+    return std::tuple<Types...>(ExampleCell<Types>(cells[Indices])...);
+  }
+
+  template <typename... Types>
+  std::vector<std::tuple<Types...>> LoadExamples(const std::string& path, char delimiter)
+  {
+    std::vector<std::tuple<Types...>> rows;
+    std::ifstream file(path);
+    std::string line;
+    bool header = true;
+    while (std::getline(file, line))
+    {
+      if (line.find_first_not_of(" \\t\\r") == std::string::npos)
+        continue;
+      if (header)
+      {
+        header = false;
+        continue;
+      }
+      std::vector<std::string> cells;
+      std::istringstream stream(line);
+      std::string cell;
+      while (std::getline(stream, cell, delimiter))
+      {
+        auto first = cell.find_first_not_of(" \\t\\r");
+        auto last = cell.find_last_not_of(" \\t\\r");
+        cells.push_back(first == std::string::npos ? "" : cell.substr(first, last - first + 1));
+      }
+      if (cells.size() >= sizeof...(Types))
+        rows.push_back(ExampleRow<Types...>(cells, std::index_sequence_for<Types...>()));
+    }
+    return rows;
+  }
+"""[1:]
+
+
 def ArgModifier(val, type):
     if type == "bool":
         return common.Lower(val)
@@ -57,47 +138,40 @@ class NameSpace:
 class Cpp(common.PrintTestBody):
     def __init__(self, settings, decl, testdecl, indent):
         self.settings = settings
+        self.templates = settings.get("templates")
+        self.prefix = "cpp"
         self.decl = decl
         self.testdecl = testdecl
         self.indent = indent
         self.argModifier = ArgModifier
         self.step = self.indent + '  scenario.[[method]]([[arguments]]);\n'
-
-    def ScenarioDecl(self, line, fullArgs, settings):
-        scenarioName = common.Tokenise(line, self.settings["cases"]["scenario"])
-        return self.decl.format(scenarioName, fullArgs)
-
-    def TestDecl(self, line):
-        scenarioName = common.Tokenise(line, self.settings["cases"]["test"])
-        return self.testdecl.format(scenarioName)
-
-    def Body(self, scenario, steps):
-        buffer = """
+        self.body = common.Compiled(self.prefix + "/body", """
 [[indent]]{
 [[indent]]  Scenarios::[[className]] scenario;
 [[steps]]
 [[indent]]}
 
-"""[1:]
-        buffer = buffer.replace("[[steps]]", steps.rstrip())
-        buffer = buffer.replace("[[indent]]", self.indent)
-        lines = scenario.lines.split('\n')
-        className = common.Tokenise(lines[0], self.settings["cases"]["class"])
-        buffer = buffer.replace("[[className]]", className)
-        return buffer
-
-    def Example(self, line, arguments):
-        buffer = """
+"""[1:], self.templates)
+        self.example = common.Compiled(self.prefix + "/example", """
 [[testName]][[indent]]{
 [[indent]]  [[scenario]]([[arguments]]);
 [[indent]]}
-"""
-        scenario = common.Tokenise(line, self.settings["cases"]["scenario"])
-        testName = " ".join([scenario, arguments])
-        testName = common.Tokenise(testName, self.settings["cases"]["test"])
-        testName = self.testdecl.format(testName)
-        buffer = buffer.replace("[[testName]]", testName)
-        buffer = buffer.replace("[[indent]]", self.indent)
-        buffer = buffer.replace("[[scenario]]", scenario)
-        buffer = buffer.replace("[[arguments]]", arguments)
-        return buffer
+""", self.templates)
+
+    def ScenarioDecl(self, scenario):
+        return self.decl.format(scenario.scenarioName, scenario.parameters)
+
+    def TestDecl(self, scenario):
+        return self.testdecl.format(scenario.testName)
+
+    def Body(self, scenario, steps):
+        values = {"steps": steps.rstrip(), "indent": self.indent, "className": scenario.className}
+        return self.body.Render(values)
+
+    def Example(self, scenario, example):
+        values = {}
+        values["testName"] = self.testdecl.format(example.testName)
+        values["indent"] = self.indent
+        values["scenario"] = scenario.scenarioName
+        values["arguments"] = example.arguments
+        return self.example.Render(values)
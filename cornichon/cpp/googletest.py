@@ -1,5 +1,6 @@
 import common
 import cpputils
+import lowered
 
 
 def Settings():
@@ -16,11 +17,41 @@ def HelpSettings():
     return settings
 
 
-def Generate(parsed, settings):
-    scenarios = parsed[0]
-    feature = parsed[1]
-    featureName = common.FeatureName(feature, settings["cases"]["namespace"])
-    namespace = common.Tokenise(featureName, settings["cases"]["namespace"])
+def Extension():
+    return ".cpp"
+
+
+def ScenariosFile(stub):
+    return stub + ".h"
+
+
+class GoogleTest(cpputils.Cpp):
+    def DataExample(self, scenario):
+        """A value-parameterised test over the rows of the Examples data file"""
+        buffer = """
+[[indent]]class [[examplesName]] : public ::testing::TestWithParam<std::tuple<[[types]]>>
+[[indent]]{
+[[indent]]};
+
+[[indent]]TEST_P([[examplesName]], Examples)
+[[indent]]{
+[[indent]]  std::apply([[scenario]], GetParam());
+[[indent]]}
+
+[[indent]]INSTANTIATE_TEST_SUITE_P(Rows, [[examplesName]], ::testing::ValuesIn(LoadExamples<[[types]]>("[[data]]", [[delimiter]])));
+"""
+        values = {}
+        values["indent"] = self.indent
+        values["examplesName"] = scenario.examplesName
+        values["scenario"] = scenario.scenarioName
+        values["types"] = ", ".join([cpputils.Types[type] for type in scenario.types])
+        values["data"] = scenario.data
+        values["delimiter"] = "'\\t'" if scenario.delimiter == '\t' else "','"
+        return common.Render("cpp/googletest/data example", buffer, values, self.templates)
+
+
+def Stream(parsed, settings):
+    feature = lowered.Lower(parsed, settings)
 
     buffer = """
 // Other bespoke headers
@@ -28,7 +59,7 @@ def Generate(parsed, settings):
 
 // Third party headers
 #include "gtest/gtest.h"
-
+[[headers]]
 namespace [[fullnamespace]]
 {
   class TestFixture : public ::testing::Test
@@ -42,21 +73,34 @@ namespace [[fullnamespace]]
     {
     }
   };
-
+[[loader]]
 [[TestBody]]
 [[endnamespace]]
 """[1:]
 
-    buffer = buffer.replace("[[scenarios file]]", settings["scenarios file"])
+    values = {}
+    values["scenarios file"] = settings["scenarios file"]
 
-    ns = cpputils.NameSpace(settings, namespace)
-    buffer = buffer.replace("[[fullnamespace]]", ns.Begin())
-    buffer = buffer.replace("[[endnamespace]]", ns.End())
+    # Only features with Examples data files need to load them
+    if any(scenario.data is not None for scenario in feature.scenarios):
+        values["headers"] = cpputils.LoaderHeaders
+        values["loader"] = cpputils.Loader
+    else:
+        values["headers"] = ""
+        values["loader"] = ""
+
+    ns = cpputils.NameSpace(settings, feature.namespace)
+    values["fullnamespace"] = ns.Begin()
+    values["endnamespace"] = ns.End()
+    head, tail = common.Surround("cpp/googletest", buffer, values, settings.get("templates"))
 
     decl = "  static void {0}({1})\n"
     testdecl = "  TEST_F(TestFixture, {0})\n"
-    cpp = cpputils.Cpp(settings, decl, testdecl, "  ")
-    testBody = cpp.TestBody(scenarios, settings)
-    buffer = buffer.replace("[[TestBody]]", testBody)
+    cpp = GoogleTest(settings, decl, testdecl, "  ")
+    yield head
+    yield from cpp.Stream(feature)
+    yield tail
+
 
-    return buffer
+def Generate(parsed, settings):
+    return ''.join(Stream(parsed, settings))
@@ -1,5 +1,6 @@
 import common
 import csutils
+import lowered
 
 
 def Settings():
@@ -14,9 +15,57 @@ def HelpSettings():
     return settings
 
 
-def Generate(parsed, settings):
-    scenarios = parsed[0]
-    feature = parsed[1]
+def Extension():
+    return ".cs"
+
+
+class NUnit(csutils.CSharp):
+    def DataExample(self, scenario):
+        """A test with a TestCaseSource over the rows of the Examples data file"""
+        buffer = """
+    /// <summary>
+    /// Gherkin DSL examples
+    /// </summary>
+    private static System.Collections.Generic.IEnumerable<object[]> [[rowsName]]()
+    {
+      var lines = System.Linq.Enumerable.Where(System.IO.File.ReadLines("[[data]]"), line => line.Trim().Length > 0);
+      foreach (var line in System.Linq.Enumerable.Skip(lines, 1))
+      {
+        var cells = System.Array.ConvertAll(line.Split([[delimiter]]), cell => cell.Trim());
+        if (cells.Length >= [[number]])
+        {
+          yield return new object[] { [[cells]] };
+        }
+      }
+    }
+
+    /// <summary>
+    /// Gherkin DSL test
+    /// </summary>
+    [TestCaseSource(nameof([[rowsName]]))]
+    public void [[examplesName]]([[parameters]])
+    {
+      [[scenario]]([[arguments]]);
+    }
+"""
+        cells = []
+        for i in range(len(scenario.types)):
+            cells.append(csutils.Parsers[scenario.types[i]].format("cells[%d]" % i))
+        values = {}
+        values["rowsName"] = scenario.rowsName
+        values["data"] = scenario.data
+        values["delimiter"] = "'\\t'" if scenario.delimiter == '\t' else "','"
+        values["number"] = str(len(scenario.types))
+        values["cells"] = ", ".join(cells)
+        values["examplesName"] = scenario.examplesName
+        values["parameters"] = scenario.parameters
+        values["scenario"] = scenario.scenarioName
+        values["arguments"] = ", ".join(scenario.header)
+        return common.Render("cs/nunit/data example", buffer, values, self.templates)
+
+
+def Stream(parsed, settings):
+    feature = lowered.Lower(parsed, settings)
     buffer = """
 namespace [[rootnamespace]][[namespace]]
 {
@@ -33,16 +82,19 @@ namespace [[rootnamespace]][[namespace]]
 }
 """[1:]
 
-    namespace = common.FeatureName(feature, settings["cases"]["namespace"])
-    buffer = buffer.replace("[[rootnamespace]]", settings["rootnamespace"])
-    buffer = buffer.replace("[[namespace]]", namespace)
+    values = {}
+    values["rootnamespace"] = settings["rootnamespace"]
+    values["namespace"] = feature.namespace
 
     # Print the class
-    className = common.Tokenise("Feature", settings["cases"]["class"])
-    buffer = buffer.replace("[[className]]", className)
+    values["className"] = feature.fixtureName
+    head, tail = common.Surround("cs/nunit", buffer, values, settings.get("templates"))
 
-    cs = csutils.CSharp(settings, "Test")
-    testBody = cs.TestBody(scenarios, settings)
-    buffer = buffer.replace("[[TestBody]]", testBody)
+    cs = NUnit(settings, "Test")
+    yield head
+    yield from cs.Stream(feature)
+    yield tail
 
-    return buffer
+
+def Generate(parsed, settings):
+    return ''.join(Stream(parsed, settings))
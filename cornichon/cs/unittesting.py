@@ -1,5 +1,6 @@
 import common
 import csutils
+import lowered
 
 
 def Settings():
@@ -14,9 +15,12 @@ def HelpSettings():
     return settings
 
 
-def Generate(parsed, settings):
-    scenarios = parsed[0]
-    feature = parsed[1]
+def Extension():
+    return ".cs"
+
+
+def Stream(parsed, settings):
+    feature = lowered.Lower(parsed, settings)
     buffer = """
 namespace [[rootnamespace]][[namespace]]
 {
@@ -33,16 +37,19 @@ namespace [[rootnamespace]][[namespace]]
 }
 """[1:]
 
-    namespace = common.FeatureName(feature, settings["cases"]["namespace"])
-    buffer = buffer.replace("[[rootnamespace]]", settings["rootnamespace"])
-    buffer = buffer.replace("[[namespace]]", namespace)
+    values = {}
+    values["rootnamespace"] = settings["rootnamespace"]
+    values["namespace"] = feature.namespace
 
     # Print the class
-    className = common.Tokenise("Feature", settings["cases"]["class"])
-    buffer = buffer.replace("[[className]]", className)
+    values["className"] = feature.fixtureName
+    head, tail = common.Surround("cs/unittesting", buffer, values, settings.get("templates"))
 
     cs = csutils.CSharp(settings, "TestMethod")
-    testBody = cs.TestBody(scenarios, settings)
-    buffer = buffer.replace("[[TestBody]]", testBody)
+    yield head
+    yield from cs.Stream(feature)
+    yield tail
 
-    return buffer
+
+def Generate(parsed, settings):
+    return ''.join(Stream(parsed, settings))
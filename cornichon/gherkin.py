@@ -1,36 +1,69 @@
+import array
+import codecs
+import functools
+import hashlib
 import importlib
+import importlib.metadata
+import importlib.util
+import itertools
+import mmap
 import os
 import os.path
+import re
 import sys
+import threading
 import common
+import dialects
+import registry
+
+
+Plugins = {}
+PluginLock = threading.Lock()
 
 
 def Import(output, unload=False):
-    bits = output.split("/")
-    subdir = os.path.join(os.path.dirname(os.path.realpath(__file__)), bits[0])
+    """Get the plugin for the output type, loaded once under its fully qualified name"""
     if unload:
-        sys.path.remove(subdir)
-        del sys.modules[bits[1]]
+        # Plugins stay loaded for the next caller
         return None
-    sys.path.insert(0, subdir)
-    return importlib.import_module(bits[1])
+    mod = Plugins.get(output)
+    if mod is not None:
+        return mod
+    with PluginLock:
+        mod = Plugins.get(output)
+        if mod is not None:
+            return mod
+        found = registry.Default.Find(output)
+        if found is None:
+            raise ModuleNotFoundError("No output type named '{}'".format(output), name=output)
+        kind, target = found
+        # The plugins import their language's utilities by their short names
+        subdir = os.path.join(registry.Package, output.split("/")[0])
+        if subdir not in sys.path and os.path.isdir(subdir):
+            sys.path.append(subdir)
+        if kind == "file":
+            mod = LoadFile("cornichon." + output.replace("/", "."), target)
+        else:
+            mod = importlib.metadata.EntryPoint(output, target, registry.Group).load()
+        Plugins[output] = mod
+        return mod
+
+
+def LoadFile(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    try:
+        spec.loader.exec_module(mod)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return mod
 
 
 def ListModules():
-    list = []
-    direc = os.path.dirname(__file__)
-    for sub in os.listdir(direc):
-        if sub == "__pycache__":
-            continue
-        path = os.path.join(direc, sub)
-        if not os.path.isdir(path):
-            continue
-        skip = ["__pycache__", sub + "utils.py"]
-        for item in os.listdir(path):
-            if item in skip:
-                continue
-            list.append(sub + "/" + os.path.splitext(item)[0])
-    return list
+    """The output types, those shipped with cornichon and those added by other packages' entry points"""
+    return sorted(registry.Default.Outputs())
 
 
 def Type(value):
@@ -52,6 +85,44 @@ def Type(value):
     return "string"
 
 
+Booleans = frozenset(["true", "True", "false", "False"])
+Integer = re.compile(r'[+-]?\d(?:_?\d)*', re.ASCII)
+Float = re.compile(r'[+-]?(?:(?:(?:\d(?:_?\d)*)?\.\d(?:_?\d)*|\d(?:_?\d)*\.?)(?:[eE][+-]?\d(?:_?\d)*)?|inf|infinity|nan)', re.ASCII | re.IGNORECASE)
+Unsigned = re.compile(r'(?:0|[1-9][0-9]*)(?:\n(?:0|[1-9][0-9]*))*', re.ASCII)
+
+
+def ValueType(value):
+    """The same as Type but matching patterns rather than raising exceptions"""
+    if value in Booleans:
+        return "bool"
+    # Leave the unusual to int and float themselves
+    if len(value) > 64 or not value.isascii() or value != value.strip():
+        return Type(value)
+    if Integer.fullmatch(value):
+        if value.strip("+-0_") == "":
+            return "uint" if value == "0" else "float"
+        return "int" if value[0] == "-" else "uint"
+    if Float.fullmatch(value):
+        return "float"
+    return "string"
+
+
+def ColumnType(values):
+    """The worst type of a column of values, stopping as soon as it is a string"""
+    if len(values) > 0 and Unsigned.fullmatch('\n'.join(values)):
+        return "uint"
+    type = "none"
+    seen = set()
+    for value in values:
+        if value in seen:
+            continue
+        seen.add(value)
+        type = Worst(type, ValueType(value))
+        if type == "string":
+            break
+    return type
+
+
 def WorseComb(type, other, types, first):
     if type == types[0]:
         if other in types[1:]:
@@ -78,11 +149,15 @@ def Worst(other, type):
 
 
 class Step:
+    __slots__ = ("words", "params", "names", "argumentLists", "parameterLists")
+
     def __init__(self, action, rest):
         self.words = [action]
         self.params = []
-        lines = rest.split('\n')
-        line = lines[0]
+        self.names = {}
+        self.argumentLists = {}
+        self.parameterLists = {}
+        line = rest.partition('\n')[0]
         line = self.ExtractParams(line, '"', '"')
         line = self.ExtractParams(line, '<', '>')
         if len(line) > 0:
@@ -102,17 +177,25 @@ class Step:
         return line
 
     def Tokenise(self, case):
-        line = " ".join(self.words)
-        return common.Tokenise(line, case)
+        if case not in self.names:
+            line = " ".join(self.words)
+            self.names[case] = common.Tokenise(line, case)
+        return self.names[case]
 
     def ArgumentList(self, types, settings):
-        return common.ArgumentList(self.params, types, settings, common.UnmodifiedArg)
+        key = (tuple(types), tuple(sorted(settings.items())))
+        if key not in self.argumentLists:
+            self.argumentLists[key] = common.ArgumentList(self.params, types, settings, common.UnmodifiedArg)
+        return self.argumentLists[key]
 
     def ParameterList(self, types):
-        settings = {}
-        for type in ["bool", "int", "uint", "float", "string"]:
-            settings[type] = "{}"
-        return common.ArgumentList(self.params, types, settings, common.UnmodifiedArg)
+        key = tuple(types)
+        if key not in self.parameterLists:
+            settings = {}
+            for type in ["bool", "int", "uint", "float", "string"]:
+                settings[type] = "{}"
+            self.parameterLists[key] = common.ArgumentList(self.params, types, settings, common.UnmodifiedArg)
+        return self.parameterLists[key]
 
     def Sub(self, lines, template):
         for i in range(len(self.params)):
@@ -122,122 +205,614 @@ class Step:
         return lines
 
 
+def GetStep(action, rest):
+    """Get the Step for a keyword and its text, only the first line of which matters"""
+    return ParseStep(action, rest.partition('\n')[0])
+
+
+@functools.lru_cache(maxsize=16384)
+def ParseStep(action, line):
+    """Parse each unique step once, sharing it and its derived names and argument lists"""
+    return Step(action, line)
+
+
 class Examples:
-    def __init__(self, lines):
-        self.lines = lines
+    __slots__ = ("text", "data", "path", "types", "header", "columns", "argumentsLists")
+
+    def __init__(self, text, directory=""):
+        self.text = text
+        # Examples: @rows.csv names a data file relative to the feature
+        heading = text.partition('\n')[0] if isinstance(text, str) else text.heading
+        heading = heading.strip()
+        self.data = heading[1:].strip() if heading.startswith('@') else None
+        self.path = None if self.data is None else os.path.join(directory, self.data)
         self.types = []
+        self.header = []
+        self.columns = []
+        self.argumentsLists = {}
+
+    @property
+    def lines(self):
+        return str(self.text)
+
+    def Lines(self):
+        if isinstance(self.text, Span):
+            return self.text.Lines()
+        return iter(self.text.split('\n'))
 
     def Exists(self):
-        return self.lines != ''
+        return isinstance(self.text, Span) or self.text != ''
 
     def Types(self):
-        if self.lines == '':
+        """Parse the table once into its header, the cells of each column and the type of each column"""
+        if not self.Exists():
             return
-
-        lines = self.lines.split('\n')
-        number = lines[1].count("|") - 1
-        self.types = ["none" for i in range(number)]
-        for line in lines[2:]:
-            vals = line.split("|")
-            if len(vals) < number + 1:
+        if self.data is not None:
+            return self.DataTypes()
+
+        lines = self.Lines()
+        heading = next(lines)
+        header = next(lines, '')
+        if not header.strip().startswith("|"):
+            raise ValueError("Examples have no table: Examples:%s" % heading.rstrip())
+        self.header = Examples.Arguments(header)
+        number = len(self.header)
+        self.columns = [[] for i in range(number)]
+        for line in lines:
+            if len(line.strip()) == 0:
+                continue
+            args = Examples.Arguments(line)
+            # Rows that don't fill the header are ignored
+            if len(args) < number:
+                continue
+            for i in range(number):
+                self.columns[i].append(args[i])
+
+        self.types = [ColumnType(column) for column in self.columns]
+
+    def Delimiter(self):
+        return '\t' if self.data.lower().endswith('.tsv') else ','
+
+    def DataLines(self):
+        """Stream the rows of the data file, its header first"""
+        delimiter = self.Delimiter()
+        with open(self.path, "r", encoding="utf-8-sig") as f:
+            for line in f:
+                if len(line.strip()) == 0:
+                    continue
+                yield [cell.strip() for cell in line.split(delimiter)]
+
+    def DataTypes(self):
+        """Stream the data file once for its header and the type of each column, keeping none of its rows"""
+        lines = self.DataLines()
+        self.header = next(lines, [])
+        number = len(self.header)
+        self.types = ["none"] * number
+        for args in lines:
+            # Rows that don't fill the header are ignored
+            if len(args) < number:
                 continue
-
             for i in range(number):
-                self.types[i] = Worst(self.types[i], Type(vals[i + 1].strip()))
+                if self.types[i] != "string":
+                    self.types[i] = Worst(self.types[i], ValueType(args[i]))
+
+    def DataRows(self):
+        number = len(self.header)
+        lines = self.DataLines()
+        next(lines, None)
+        for args in lines:
+            if len(args) >= number:
+                yield tuple(args[:number])
 
     @staticmethod
     def Arguments(line):
-        args = []
-        args = line.strip()[1:-2].split("|")
+        args = line.strip()[1:-1].split("|")
         for i in range(len(args)):
             args[i] = args[i].strip()
         return args
 
     def Header(self):
-        if self.lines == "":
-            return []
-
-        lines = self.lines.split('\n')
-        for line in lines[1:]:
-            args = Examples.Arguments(line)
-            return args
+        return self.header
 
-        return []
+    def Rows(self):
+        if self.data is not None:
+            return self.DataRows()
+        return zip(*self.columns)
 
     def ArgumentsList(self, settings):
-        if self.lines == "":
-            return ""
-
-        args = self.Header()
-        if args == []:
+        if self.header == []:
             return ""
 
-        return common.ArgumentList(args, self.types, settings, common.UnmodifiedArg)
+        # Shared between the output types generated from the same parse
+        key = tuple(sorted(settings.items()))
+        if key not in self.argumentsLists:
+            self.argumentsLists[key] = common.ArgumentList(self.header, self.types, settings, common.UnmodifiedArg)
+        return self.argumentsLists[key]
 
-    def ArgumentsInstance(self, settings, line, argModifier):
-        args = Examples.Arguments(line)
+    def ArgumentsInstance(self, settings, args, argModifier):
+        if isinstance(args, str):
+            args = Examples.Arguments(args)
         return common.ArgumentList(args, self.types, settings, argModifier)
 
 
+# Scenarios without Examples share the one empty table
+NoExamples = Examples("")
+
+
 class Scenario:
-    def __init__(self, lines, background):
+    __slots__ = ("lines", "background", "steps", "examples", "tags", "lowered")
+
+    def __init__(self, lines, background, tags=[]):
         self.lines = lines
+        # Shared by reference between all the scenarios of the feature
         self.background = background
         self.steps = []
-        self.examples = Examples("")
+        self.examples = NoExamples
+        # Its own tags and those of its Examples, not those of the feature
+        self.tags = list(tags)
+        # The lowered scenarios keyed by settings, only kept when parsing incrementally
+        self.lowered = None
 
     def Steps(self):
-        steps = []
-        steps.extend(self.background)
-        steps.extend(self.steps)
-        return steps
+        return itertools.chain(self.background, self.steps)
+
+    def __getstate__(self):
+        return (self.lines, self.background, self.steps, self.examples, self.tags)
+
+    def __setstate__(self, state):
+        self.lines, self.background, self.steps, self.examples, self.tags = state
+        self.lowered = None
 
 
-def GetScenarios(sections):
+class Feature(str):
+    """The text of the feature along with its tags"""
+    def __new__(cls, text, tags=[]):
+        feature = super().__new__(cls, text)
+        feature.tags = list(tags)
+        return feature
+
+    def __reduce__(self):
+        return (Feature, (str(self), self.tags))
+
+
+class ParsedFeature:
+    __slots__ = ("scenarios", "feature", "types", "lowered")
+
+    def __init__(self, scenarios, feature):
+        self.scenarios = scenarios
+        self.feature = feature
+        self.types = [scenario.examples.types for scenario in scenarios]
+        # The lowered features keyed by the settings they were lowered for
+        self.lowered = {}
+
+    def __getitem__(self, index):
+        return [self.scenarios, self.feature][index]
+
+    def __reduce__(self):
+        return (ParsedFeature, (self.scenarios, self.feature))
+
+
+def Fingerprint(sections):
+    """A digest of the sections of a scenario, its background included, telling when it has been edited"""
+    digest = hashlib.sha1()
+    for section in sections:
+        for part in section:
+            if isinstance(part, Span):
+                part.Digest(digest)
+            else:
+                digest.update(part.encode("utf-8", "surrogatepass"))
+            digest.update(b'\0')
+    return digest.digest()
+
+
+Steps = frozenset(['Given', 'When', 'Then', 'But', 'And'])
+
+
+def GetScenarios(sections, directory="", cache=None):
     scenarios = []
     feature = None
     background = []
+    regions = []
+    tags = []
+    featureTags = []
     for section in sections:
-        if 1 == ['Given', 'When', 'Then', 'But', 'And'].count(section[0]):
+        if section[0] in Steps:
+            step = (sys.intern(section[-1]), sys.intern(section[1]))
             if scenarios == []:
-                background.append(section)
+                background.append(step)
             else:
-                scenarios[-1].steps.append(section)
+                scenarios[-1].steps.append(step)
+                regions[-1].append(section)
+        elif '@' == section[0]:
+            tags = section[1].split()
         elif 'Feature:' == section[0]:
-            feature = section[1]
+            feature = Feature(section[1], tags)
+            featureTags = tags
+            tags = []
         elif 'Examples:' == section[0]:
-            scenarios[-1].examples = Examples(section[1])
+            if scenarios == []:
+                raise ValueError("Examples come before any scenario")
+            scenarios[-1].examples = Examples(section[1], directory)
+            scenarios[-1].tags.extend(tags)
+            regions[-1].append(('@', ' '.join(tags)))
+            regions[-1].append(section)
+            tags = []
         elif 'Scenario:' == section[0]:
-            scenarios.append(Scenario(section[1], background))
+            scenarios.append(Scenario(section[1], background, tags))
+            regions.append(list(background) + [('@', ' '.join(featureTags + tags)), section])
+            tags = []
+
+    if feature is None:
+        raise ValueError("There is no feature section")
+
+    parse = scenarios
+    if cache is not None:
+        # Reuse the scenarios that are unchanged since the last parse, those
+        # with an Examples data file are always parsed as the file may change
+        parse = []
+        kept = {}
+        for i in range(len(scenarios)):
+            if scenarios[i].examples.data is not None:
+                parse.append(scenarios[i])
+                continue
+            fingerprint = Fingerprint(regions[i])
+            if fingerprint in cache:
+                scenarios[i] = cache[fingerprint]
+            else:
+                scenarios[i].lowered = {}
+                parse.append(scenarios[i])
+            kept[fingerprint] = scenarios[i]
+        cache.clear()
+        cache.update(kept)
 
-    for scenario in scenarios:
+    for scenario in parse:
         scenario.examples.Types()
 
     return [scenarios, feature]
 
 
-def GetSections(input, settings):
+class Buffer:
+    """The lines of a feature held as byte offsets into bytes or a memory mapped file"""
+    __slots__ = ("data", "offsets")
+
+    def __init__(self, data):
+        self.data = data
+        pos = len(codecs.BOM_UTF8) if data[:len(codecs.BOM_UTF8)] == codecs.BOM_UTF8 else 0
+        self.offsets = array.array('q', [pos])
+        while True:
+            pos = data.find(b'\n', pos) + 1
+            if pos == 0:
+                break
+            self.offsets.append(pos)
+        if self.offsets[-1] != len(data):
+            self.offsets.append(len(data))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return Buffer.Decode(self.data[self.offsets[i]:self.offsets[i + 1]])
+
+    @staticmethod
+    def Decode(line):
+        line = line.decode("utf-8")
+        if line[-2:] == '\r\n':
+            return line[:-2] + '\n'
+        return line
+
+    def Span(self, heading, start, end, skipped):
+        return Span(self, heading, self.offsets[start], self.offsets[end] - self.offsets[start], skipped)
+
+
+class Span:
+    """A section body held as an offset and length into a buffer, only decoded when asked for"""
+    __slots__ = ("buffer", "heading", "offset", "length", "skipped")
+
+    def __init__(self, buffer, heading, offset, length, skipped):
+        self.buffer = buffer
+        self.heading = heading
+        self.offset = offset
+        self.length = length
+        self.skipped = skipped
+
+    def Body(self):
+        data = self.buffer.data
+        pos = self.offset
+        end = self.offset + self.length
+        while pos < end:
+            stop = data.find(b'\n', pos, end) + 1
+            if stop == 0:
+                stop = end
+            line = Buffer.Decode(data[pos:stop])
+            pos = stop
+            if self.skipped > 0 and Skipped(line):
+                continue
+            yield line
+
+    def Lines(self):
+        yield self.heading[:-1]
+        for line in self.Body():
+            yield line.rstrip('\n')
+
+    def __str__(self):
+        return self.heading + ''.join(self.Body())
+
+    def Digest(self, digest):
+        digest.update(self.heading.encode("utf-8", "surrogatepass"))
+        digest.update(self.buffer.data[self.offset:self.offset + self.length])
+
+    def __reduce__(self):
+        # Only pickle the bytes of the span, a memory mapped file can't be pickled
+        data = bytes(self.buffer.data[self.offset:self.offset + self.length])
+        return (Span, (Buffer(data), self.heading, 0, self.length, self.skipped))
+
+
+def Lines(input):
+    """Get the lines of a list of lines, a path, bytes or a memory mapped file"""
+    if isinstance(input, str):
+        with open(input, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return Buffer(b'')
+            return Buffer(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    if isinstance(input, (bytes, bytearray, mmap.mmap)):
+        return Buffer(input)
+    if not isinstance(input, (list, tuple)):
+        return list(input)
+    return input
+
+
+class Dialect:
+    """The keywords of a dialect keyed on their leading word, or on their first character when they run into their text"""
+    def __init__(self, keywords):
+        self.words = {}
+        self.prefixes = {}
+        for kind in keywords:
+            section = dialects.Sections[kind]
+            for keyword in keywords[kind]:
+                if section.endswith(':'):
+                    words = (keyword + ':').split()
+                elif keyword.endswith(' '):
+                    words = keyword.split()
+                else:
+                    self.prefixes.setdefault(keyword[0], []).append((keyword, section))
+                    continue
+                self.words.setdefault(words[0], []).append((words, section, keyword.strip()))
+        # The longest keywords are tried first
+        for candidates in self.words.values():
+            candidates.sort(key=lambda candidate: -len(candidate[0]))
+        for candidates in self.prefixes.values():
+            candidates.sort(key=lambda candidate: -len(candidate[0]))
+        self.starts = frozenset([word[0] for word in self.words] + list(self.prefixes) + ['@'])
+
+
+@functools.lru_cache(maxsize=None)
+def GetDialect(language):
+    if language not in dialects.Dialects:
+        raise ValueError("Unknown Gherkin language: %s" % language)
+    return Dialect(dialects.Dialects[language])
+
+
+Language = re.compile(r'#\s*language\s*:\s*(\S+)')
+
+# Bare background lines, in any dialect, are dropped from section bodies
+BackgroundLines = frozenset([keyword + ':' for keywords in dialects.Dialects.values() for keyword in keywords["background"]])
+
+
+def Tags(stripped):
+    """The tags of a tag line, up to any comment"""
+    tags = []
+    for word in stripped.split():
+        if word[0] == '#':
+            break
+        if word[0] == '@':
+            tags.append(word)
+    return tags
+
+
+def Keyword(stripped, dialect=None):
+    """Get the section, normalised heading and keyword as written if the left stripped line starts a section"""
+    if dialect is None:
+        dialect = GetDialect("en")
+    if stripped[:1] not in dialect.starts:
+        return None
+    if stripped[0] == '@':
+        return '@', ' '.join(Tags(stripped)) + '\n', '@'
+    for prefix, section in dialect.prefixes.get(stripped[0], []):
+        if stripped.startswith(prefix):
+            return section, ' '.join(stripped[len(prefix):].split()) + '\n', prefix
+    bits = stripped.split()
+    for words, section, keyword in dialect.words.get(bits[0], []):
+        if bits[:len(words)] != words:
+            continue
+        rest = bits[len(words):]
+        if section == 'Scenario Outline:' and len(rest) == 0:
+            return None
+        if section == 'Background:' and len(rest) > 0:
+            return None
+        return section, ' '.join(rest) + '\n', keyword
+    return None
+
+
+def TagLine(input, i, dialect):
+    """Whether the line of tags is where tags can be, just before a feature, scenario or Examples, rather than
+    in a description"""
+    for word in input[i].split():
+        if word[0] == '#':
+            break
+        if word[0] != '@':
+            return False
+    for j in range(i + 1, len(input)):
+        stripped = input[j].lstrip()
+        if stripped.strip() == '' or stripped[0] in '#@':
+            continue
+        keyword = Keyword(stripped, dialect)
+        return keyword is not None and keyword[0] in ['Feature:', 'Scenario:', 'Scenario Outline:', 'Examples:']
+    return False
+
+
+def Skipped(line):
+    """Whether the line is dropped from the body of a section"""
+    stripped = line.strip()
+    return stripped[:1] == '#' or stripped in BackgroundLines
+
+
+def Lex(input):
+    """Yield a token of section, heading, start line, end line, number of skipped lines and keyword as written for each section"""
+    dialect = GetDialect("en")
+    token = None
     section = ''
+    written = ''
+    for i in range(len(input)):
+        stripped = input[i].lstrip()
+        if token is None and stripped[:1] == '#':
+            language = Language.match(stripped)
+            if language is not None:
+                dialect = GetDialect(language.group(1))
+        keyword = Keyword(stripped, dialect)
+        if keyword is not None and keyword[0] == '@' and not TagLine(input, i, dialect):
+            keyword = None
+        if keyword is None or keyword[0] == 'Background:':
+            if token is not None and (keyword is not None or stripped[:1] == '#'):
+                token[4] += 1
+            continue
+        if token is not None:
+            token[3] = i
+            yield token
+        keyword, heading, keywordAsWritten = keyword
+        if keyword == 'Scenario Outline:':
+            keyword = 'Scenario:'
+        elif keyword == 'And':
+            keyword = section
+            keywordAsWritten = written
+        elif keyword != '@':
+            section = keyword
+            written = keywordAsWritten
+        token = [keyword, heading, i, i + 1, 0, keywordAsWritten]
+    if token is not None:
+        token[3] = len(input)
+        yield token
+
+
+def TagExpression(text):
+    """Compile a tag expression such as "@smoke and not (@slow or @wip)" into a test of a set of tags"""
+    words = re.findall(r'\(|\)|[^\s()]+', text)
+    pos = 0
+
+    def Peek():
+        return words[pos] if pos < len(words) else None
+
+    def Next():
+        nonlocal pos
+        word = Peek()
+        if word is None:
+            raise ValueError("Tag expression ends early: %s" % text)
+        pos += 1
+        return word
+
+    def Or():
+        tests = [And()]
+        while Peek() == 'or':
+            Next()
+            tests.append(And())
+        return tests[0] if len(tests) == 1 else lambda tags: any(test(tags) for test in tests)
+
+    def And():
+        tests = [Not()]
+        while Peek() == 'and':
+            Next()
+            tests.append(Not())
+        return tests[0] if len(tests) == 1 else lambda tags: all(test(tags) for test in tests)
+
+    def Not():
+        word = Next()
+        if word == 'not':
+            test = Not()
+            return lambda tags: not test(tags)
+        if word == '(':
+            test = Or()
+            if Next() != ')':
+                raise ValueError("Tag expression is missing a ): %s" % text)
+            return test
+        if word[0] != '@':
+            raise ValueError("Tag expression expected a tag but has %s: %s" % (word, text))
+        return lambda tags: word in tags
+
+    if len(words) == 0:
+        return lambda tags: True
+    test = Or()
+    if pos != len(words):
+        raise ValueError("Tag expression has %s left over: %s" % (' '.join(words[pos:]), text))
+    return test
+
+
+def ScenarioTags(tokens):
+    """The tags of each scenario token, its own, those of its Examples and those of the feature"""
+    scenarioTags = {}
+    tags = []
+    featureTags = []
+    scenario = None
+    for n in range(len(tokens)):
+        keyword = tokens[n][0]
+        if keyword == '@':
+            tags.extend(tokens[n][1].split())
+            continue
+        if keyword == 'Feature:':
+            featureTags = tags
+        elif keyword == 'Scenario:':
+            scenario = n
+            scenarioTags[n] = set(featureTags + tags)
+        elif keyword == 'Examples:' and scenario is not None:
+            scenarioTags[scenario].update(tags)
+        tags = []
+    return scenarioTags
+
+
+def GetSections(input, settings):
+    input = Lines(input)
+    expression = settings.get("tags", "")
+    selected = TagExpression(expression)
     sections = []
-    for line in input:
-        if line.lstrip()[:1] == '#':
+    tags = []
+    excluded = False
+    tokens = list(Lex(input))
+    # The Examples of a scenario come after it so its tags are gathered first
+    scenarioTags = ScenarioTags(tokens) if expression.strip() != "" else {}
+    for n in range(len(tokens)):
+        keyword, heading, start, end, skipped, written = tokens[n]
+        if keyword == '@':
+            tags.extend(heading.split())
             continue
-        bits = line.split()
-        if len(bits) > 0 and bits[0] in ['Feature:', 'Scenario:', 'Examples:', 'Given', 'When', 'Then', 'But', 'And']:
-            if bits[0] != 'And':
-                section = bits[0]
-            line = ' '.join(bits[1:]) + '\n'
-            sections.append([section, line])
-        elif len(bits) > 2 and ' '.join(bits[:2]) == 'Scenario Outline:':
-            line = ' '.join(bits[2:]) + '\n'
-            sections.append(['Scenario:', line])
-        elif line.strip() == 'Background:':
+        if keyword == 'Scenario:':
+            # Drop the sections of the scenarios not selected up to the next scenario
+            excluded = not selected(scenarioTags.get(n, set()))
+        if excluded:
+            tags = []
             continue
-        else:
-            sections[-1][1] += line
+        if len(tags) > 0:
+            if keyword in ['Feature:', 'Scenario:', 'Examples:']:
+                sections.append(['@', ' '.join(tags) + '\n'])
+            tags = []
+        if keyword == 'Examples:' and isinstance(input, Buffer):
+            # Tables can be huge so leave them in the buffer
+            sections.append([keyword, input.Span(heading, start + 1, end, skipped)])
+            continue
+        body = input[start + 1:end]
+        if skipped > 0:
+            body = [line for line in body if not Skipped(line)]
+        if keyword in Steps:
+            # Steps keep their keyword as written
+            sections.append([keyword, heading + ''.join(body), written])
+            continue
+        sections.append([keyword, heading + ''.join(body)])
     return sections
 
 
-def Parse(input, settings):
+def Parse(input, settings, cache=None, directory=None):
+    """Parse the feature, given a cache it reuses the scenarios unchanged since the last parse with that cache"""
     sections = GetSections(input, settings)
-    return GetScenarios(sections)
+    # Examples data files are found relative to a feature read from a path
+    if directory is None:
+        directory = os.path.dirname(input) if isinstance(input, str) else ""
+    return GetScenarios(sections, directory, cache)
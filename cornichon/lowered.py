@@ -0,0 +1,131 @@
+import posixpath
+
+import common
+import gherkin
+
+
+def Key(settings):
+    """The parts of the settings that a lowered feature depends on"""
+    key = []
+    for part in ["cases", "types", "values"]:
+        key.append(tuple(sorted(settings[part].items())))
+    key.append(settings["data directory"])
+    return tuple(key)
+
+
+def Lower(parsed, settings):
+    """Lower the parsed feature once for each distinct cases, types and values of the settings"""
+    if not isinstance(parsed, gherkin.ParsedFeature):
+        parsed = gherkin.ParsedFeature(parsed[0], parsed[1])
+    key = Key(settings)
+    if key not in parsed.lowered:
+        parsed.lowered[key] = Feature(parsed, settings)
+    return parsed.lowered[key]
+
+
+def LowerScenario(scenario, key, settings):
+    """Lower the scenario, keeping it for each key when it is parsed incrementally"""
+    if scenario.lowered is None:
+        return Scenario(scenario, settings)
+    if key not in scenario.lowered:
+        scenario.lowered[key] = Scenario(scenario, settings)
+    return scenario.lowered[key]
+
+
+class Step:
+    __slots__ = ("keyword", "text", "step", "method", "parameters", "arguments")
+
+    def __init__(self, section, types, settings):
+        self.keyword = section[0]
+        self.text = section[1]
+        self.step = gherkin.GetStep(section[0], section[1])
+        self.method = self.step.Tokenise(settings["cases"]["step"])
+        # The parameters passed to the step and the arguments it declares
+        self.parameters = self.step.ParameterList(types)
+        self.arguments = self.step.ArgumentList(types, settings["types"])
+
+
+class Example:
+    __slots__ = ("scenario", "arguments", "name")
+
+    def __init__(self, scenario, arguments):
+        self.scenario = scenario
+        self.arguments = arguments
+        self.name = None
+
+    @property
+    def testName(self):
+        if self.name is None:
+            line = " ".join([self.scenario.scenarioName, self.arguments])
+            # Each row has its own name so caching it would only fill the cache with every row
+            self.name = common.Tokenise.__wrapped__(line, self.scenario.cases["test"])
+        return self.name
+
+
+class Scenario:
+    __slots__ = ("text", "className", "scenarioName", "testName", "outline", "parameters",
+                 "steps", "uniqueSteps", "examples", "cases", "values",
+                 "data", "delimiter", "header", "types", "rowsName", "examplesName", "chunks")
+
+    def __init__(self, scenario, settings):
+        cases = settings["cases"]
+        line = scenario.lines.partition('\n')[0]
+        self.text = scenario.lines
+        self.className = common.Tokenise(line, cases["class"])
+        self.scenarioName = common.Tokenise(line, cases.get("scenario", cases["class"]))
+        self.testName = common.Tokenise(line, cases.get("test", cases["class"]))
+        self.examples = scenario.examples
+        self.outline = self.examples.Exists()
+        self.parameters = self.examples.ArgumentsList(settings["types"]) if self.outline else ""
+        self.steps = []
+        self.uniqueSteps = []
+        methods = set()
+        for section in scenario.Steps():
+            step = Step(section, self.examples.types, settings)
+            self.steps.append(step)
+            if step.method not in methods:
+                methods.add(step.method)
+                self.uniqueSteps.append(step)
+        self.cases = dict(cases)
+        self.values = dict(settings["values"])
+        # The rendered chunks keyed by what rendered them, only kept when parsed incrementally
+        self.chunks = None if scenario.lowered is None else {}
+        # Outlines with an Examples data file can load its rows when the tests run
+        self.data = None
+        self.header = self.examples.header
+        self.types = self.examples.types
+        if self.examples.data is not None:
+            self.data = posixpath.join(settings["data directory"], self.examples.data)
+            self.delimiter = self.examples.Delimiter()
+            self.rowsName = common.Tokenise(line + " rows", cases.get("scenario", cases["class"]))
+            self.examplesName = common.Tokenise(line + " examples", cases.get("test", cases["class"]))
+
+    def Examples(self, argModifier):
+        """Yield the examples with their arguments modified for the output language, a row at a time so that
+        none of them are kept"""
+        for args in self.examples.Rows():
+            arguments = self.examples.ArgumentsInstance(self.values, args, argModifier)
+            if "" == arguments:
+                continue
+            yield Example(self, arguments)
+
+    def Rendered(self, key, render, *args):
+        """The chunks render gives for the scenario, kept by key when the scenario is kept"""
+        if self.chunks is None:
+            return render(self, *args)
+        if key not in self.chunks:
+            self.chunks[key] = list(render(self, *args))
+        return self.chunks[key]
+
+
+class Feature:
+    __slots__ = ("text", "name", "namespace", "fixtureName", "scenarios")
+
+    def __init__(self, parsed, settings):
+        cases = settings["cases"]
+        self.text = parsed.feature
+        self.name = common.FeatureName(self.text, cases["class"])
+        self.namespace = common.FeatureName(self.text, cases.get("namespace", cases["class"]))
+        self.fixtureName = common.Tokenise("Feature", cases["class"])
+        key = Key(settings)
+        self.scenarios = [LowerScenario(scenario, key, settings) for scenario in parsed.scenarios]
@@ -0,0 +1,148 @@
+import hashlib
+import mmap
+import os
+import os.path
+import pickle
+import gherkin
+
+
+# Change whenever the parsed features change so that older entries are missed
+Version = "3"
+
+Extension = ".parsed"
+
+
+class Cache:
+    """Parsed features pickled in a directory keyed by a hash of their bytes, the least recently used evicted first"""
+    def __init__(self, directory=".cornichon_cache", size=64 * 1024 * 1024):
+        self.directory = directory
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        # The bytes in the directory, counted once and then kept up to date as entries are stored
+        self.total = None
+
+    @staticmethod
+    def Key(data, tags=""):
+        digest = hashlib.sha256()
+        digest.update(Version.encode())
+        digest.update(b'\0')
+        # The scenarios parsed depend on the tag expression
+        digest.update(tags.encode())
+        digest.update(b'\0')
+        digest.update(data)
+        return digest.hexdigest()
+
+    def Path(self, key):
+        return os.path.join(self.directory, key + Extension)
+
+    def Parse(self, input, settings):
+        """Load the parsed feature if its bytes have been parsed before, otherwise parse and store it"""
+        directory = ""
+        if isinstance(input, str):
+            directory = os.path.dirname(input)
+            with open(input, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    input = b''
+                else:
+                    input = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if isinstance(input, (bytes, bytearray, mmap.mmap)):
+            data = input
+        else:
+            input = gherkin.Lines(input)
+            data = '\0'.join(input).encode("utf-8", "surrogatepass")
+
+        key = Cache.Key(data, settings.get("tags", ""))
+        parsed = self.Load(key)
+        if parsed is not None:
+            self.hits += 1
+            # Only a parse leaves its Examples in the mapped file
+            if isinstance(input, mmap.mmap):
+                input.close()
+            return parsed
+
+        self.misses += 1
+        scenarios, feature = gherkin.Parse(input, settings, directory=directory)
+        parsed = gherkin.ParsedFeature(scenarios, feature)
+        # Examples data files can change without the feature changing
+        if all(scenario.examples.data is None for scenario in scenarios):
+            self.Store(key, parsed)
+        return parsed
+
+    def Load(self, key):
+        path = self.Path(key)
+        try:
+            with open(path, "rb") as f:
+                parsed = pickle.load(f)
+            # Mark it as recently used
+            os.utime(path)
+            return parsed
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+
+    def Store(self, key, parsed):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.Path(key)
+        temp = "%s.%d.tmp" % (path, os.getpid())
+        with open(temp, "wb") as f:
+            pickle.dump(parsed, f, pickle.HIGHEST_PROTOCOL)
+            size = f.tell()
+        if self.total is None:
+            self.total = sum([entry[1] for entry in self.Entries()])
+        else:
+            try:
+                self.total -= os.stat(path).st_size
+            except OSError:
+                pass
+        os.replace(temp, path)
+        self.total += size
+        # Only scan the directory once it is over its size
+        if self.total > self.size:
+            self.Evict()
+
+    def Entries(self):
+        """The path, size and last use of each entry, least recently used first"""
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(Extension) or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                entries.append((entry.path, stat.st_size, stat.st_mtime))
+        entries.sort(key=lambda entry: entry[2])
+        return entries
+
+    def Evict(self):
+        entries = self.Entries()
+        total = sum([entry[1] for entry in entries])
+        for path, size, used in entries:
+            if total <= self.size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+        self.total = total
+
+    def Stats(self):
+        entries = self.Entries()
+        stats = {}
+        stats["directory"] = self.directory
+        stats["entries"] = len(entries)
+        stats["bytes"] = sum([entry[1] for entry in entries])
+        stats["limit"] = self.size
+        return stats
+
+    def Clear(self):
+        """Remove every entry, returning how many there were"""
+        entries = self.Entries()
+        for entry in entries:
+            try:
+                os.remove(entry[0])
+            except OSError:
+                pass
+        self.total = None
+        return len(entries)
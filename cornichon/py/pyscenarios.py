@@ -1,6 +1,6 @@
 import common
+import lowered
 import pyutils
-import gherkin
 
 
 def Settings():
@@ -13,9 +13,14 @@ def HelpSettings():
     return settings
 
 
+def Extension():
+    return "_scenarios.py"
+
+
 class PrintScenario(common.PrintScenario):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, templates=None):
+        super().__init__(templates)
+        self.prefix = "py/pyscenarios"
         self.line = "\n            print(%s)"
         self.sub = '" + str(%s) + "'
         self.step = """
@@ -26,19 +31,8 @@ class PrintScenario(common.PrintScenario):
 """[1:] % ('"""Gherkin DSL step"""')
 
 
-def Generate(parsed, settings):
-    scenarios = parsed[0]
-    feature = parsed[1]
-    lines = "%s%s %s" % ('  ', 'Feature:', feature)
-
-    printer = PrintScenario()
-    featureDesc = printer.Description(lines)
-    concat = """
-class Scenarios:
-"""[1:]
-
-    for scenario in scenarios:
-        buffer = """
+def Class(scenario, printer, featureDesc):
+    buffer = """
     class [[Scenario]]:
         [[comment1]]
         def __init__(self):
@@ -48,15 +42,34 @@ class Scenarios:
 [[steps]]
 """
 
-        buffer = buffer.replace("[[comment1]]", '"""Test class scenario"""')
-        buffer = buffer.replace("[[comment2]]", '"""Initialiser"""')
-        buffer = buffer.replace("[[steps]]", printer.Steps(scenario, settings))
-        scenarioName = common.Tokenise(scenario.lines, settings["cases"]["class"])
-        buffer = buffer.replace("[[Scenario]]", scenarioName)
-        lines = "%s%s %s" % ('    ', 'Scenario:', scenario.lines)
-        desc = printer.Description(lines)
-        documentation = featureDesc + "\n" + desc
-        buffer = buffer.replace("[[documentation]]", documentation)
-        concat += buffer
-
-    return concat.replace("(self, )", "(self)")
+    values = {}
+    values["comment1"] = '"""Test class scenario"""'
+    values["comment2"] = '"""Initialiser"""'
+    values["steps"] = printer.Steps(scenario)
+    values["Scenario"] = scenario.className
+    values["documentation"] = printer.Documentation(scenario, featureDesc)
+    yield common.Render("py/pyscenarios/class", buffer, values, printer.templates)
+
+
+def Classes(printer, feature, featureDesc):
+    key = (__name__, common.Frozen(printer), featureDesc)
+    for scenario in feature.scenarios:
+        yield from scenario.Rendered(key, Class, printer, featureDesc)
+
+
+def Stream(parsed, settings):
+    feature = lowered.Lower(parsed, settings)
+
+    printer = PrintScenario(settings.get("templates"))
+    featureDesc = printer.FeatureDesc(feature.text)
+    concat = """
+class Scenarios:
+"""[1:]
+
+    yield concat
+    for buffer in Classes(printer, feature, featureDesc):
+        yield buffer.replace("(self, )", "(self)")
+
+
+def Generate(parsed, settings):
+    return ''.join(Stream(parsed, settings))
@@ -1,4 +1,5 @@
 import common
+import lowered
 import pyutils
 
 
@@ -16,83 +17,107 @@ def HelpSettings():
     return settings
 
 
+def Extension():
+    return "_test.py"
+
+
+def ScenariosFile(stub):
+    return stub + "_scenarios"
+
+
 class Python(pyutils.Python):
     def __init__(self, settings):
         super().__init__(settings)
         self.settings = settings
+        self.prefix = "py/pytests"
         self.testdecl = """
 
 def test_{0}({1}):
     %s
 """[1:] % '"""Gherkin DSL test"""'
         self.step = '    scenario.[[method]]([[arguments]])\n'
+        self.body = common.Compiled(self.prefix + "/body", """
+    scenario = Scenarios.[[className]]()
+[[steps]]
+
+"""[1:], self.templates)
 
-    def PreScenarioDecl(self, fullArgs, examples, settings):
-        concat = """
+    def PreScenarioDecl(self, scenario):
+        """Yield the parametrize decorator a row at a time as a table can have any number of rows"""
+        if scenario.data is not None:
+            yield self.DataScenarioDecl(scenario)
+            return
+        yield """
 @pytest.mark.parametrize(
     "%s",
     [
-""" % fullArgs
-        lines = examples.lines.split('\n')
-        for line in lines[2:]:
-            if len(line.strip()) == 0:
-                continue
-            arguments = examples.ArgumentsInstance(settings["values"], line, self.argModifier)
-            if "" == arguments:
-                continue
-            concat += """
+""" % scenario.parameters
+        for example in scenario.Examples(self.argModifier):
+            yield """
         (
             %s,
         ),
-"""[1:] % arguments
-        return concat + """
+"""[1:] % example.arguments
+        yield """
     ],
 )
 """[1:]
 
-    def TestDecl(self, line, fullArgs):
-        scenarioName = common.Tokenise(line, self.settings["cases"]["test"])
-        return self.testdecl.format(scenarioName, fullArgs)
+    def DataScenarioDecl(self, scenario):
+        """Parametrize over the rows of the Examples data file, loaded lazily when the tests run"""
+        types = ", ".join([pyutils.Types[type] for type in scenario.types])
+        if len(scenario.types) == 1:
+            types += ","
+        delimiter = scenario.delimiter.replace('\t', '\\t')
+        return """
+@pytest.mark.parametrize(
+    "%s",
+    load_examples("%s", "%s", (%s)),
+)
+""" % (scenario.parameters, scenario.data, delimiter, types)
 
-    def Scenario(self, scenario, settings):
-        lines = scenario.lines.split('\n')
-        if scenario.examples.Exists():
-            fullArgs = scenario.examples.ArgumentsList(settings["types"])
-            concat = self.PreScenarioDecl(fullArgs, scenario.examples, settings)
-            return concat + self.TestDecl(lines[0], fullArgs)[1:]
-        return self.TestDecl(lines[0], "")
+    def TestDecl(self, scenario, fullArgs):
+        return self.testdecl.format(scenario.testName, fullArgs)
 
-    def Examples(self, scenarios, settings):
-        return ""
+    def Declaration(self, scenario):
+        if scenario.outline:
+            yield from self.PreScenarioDecl(scenario)
+            yield self.TestDecl(scenario, scenario.parameters)[1:]
+        else:
+            yield self.TestDecl(scenario, "")
 
-    def Body(self, scenario, steps):
-        buffer = """
-    scenario = Scenarios.[[className]]()
-[[steps]]
+    def Scenario(self, scenario):
+        return ''.join(self.Declaration(scenario))
 
-"""[1:]
-        lines = scenario.lines.split('\n')
-        className = common.Tokenise(lines[0], self.settings["cases"]["class"])
-        buffer = buffer.replace("[[className]]", className)
-        buffer = buffer.replace("[[steps]]", steps.rstrip())
-        return buffer
+    def Examples(self, feature):
+        return []
 
 
-def Generate(parsed, settings):
-    scenarios = parsed[0]
-    feature = parsed[1]
+def Stream(parsed, settings):
+    feature = lowered.Lower(parsed, settings)
 
     buffer = """
 import pytest
 from [[scenarios file]] import *
-
+[[loader]]
 [[TestBody]]
 """[1:]
 
-    buffer = buffer.replace("[[scenarios file]]", settings["scenarios file"])
+    values = {}
+    values["scenarios file"] = settings["scenarios file"]
+
+    # Only features with Examples data files need to load them
+    if any(scenario.data is not None for scenario in feature.scenarios):
+        values["loader"] = pyutils.Loader
+    else:
+        values["loader"] = ""
+    head, tail = common.Surround("py/pytests", buffer, values, settings.get("templates"))
 
     py = Python(settings)
-    testBody = py.TestBody(scenarios, settings)
-    buffer = buffer.replace("[[TestBody]]", testBody)
+    yield head
+    yield from py.Stream(feature)
+    yield tail
 
-    return buffer
+
+def Generate(parsed, settings):
+    return ''.join(Stream(parsed, settings))
@@ -1,4 +1,5 @@
 import common
+import lowered
 import pyutils
 
 
@@ -16,9 +17,16 @@ def HelpSettings():
     return settings
 
 
-def Generate(parsed, settings):
-    scenarios = parsed[0]
-    feature = parsed[1]
+def Extension():
+    return "_test.py"
+
+
+def ScenariosFile(stub):
+    return stub + "_scenarios"
+
+
+def Stream(parsed, settings):
+    feature = lowered.Lower(parsed, settings)
 
     buffer = """
 import unittest
@@ -35,13 +43,17 @@ if __name__ == '__main__':
     unittest.main()
 """[1:]
 
-    className = common.FeatureName(feature, settings["cases"]["class"])
-    buffer = buffer.replace("[[className]]", className)
-    buffer = buffer.replace("[[comment]]", '"""Gherkin DSL feature"""')
-    buffer = buffer.replace("[[scenarios file]]", settings["scenarios file"])
+    values = {}
+    values["className"] = feature.name
+    values["comment"] = '"""Gherkin DSL feature"""'
+    values["scenarios file"] = settings["scenarios file"]
+    head, tail = common.Surround("py/pyunit_tests", buffer, values, settings.get("templates"))
 
     py = pyutils.Python(settings)
-    testBody = py.TestBody(scenarios, settings)
-    buffer = buffer.replace("[[TestBody]]", testBody)
+    yield head
+    yield from py.Stream(feature)
+    yield tail
+
 
-    return buffer
+def Generate(parsed, settings):
+    return ''.join(Stream(parsed, settings))
@@ -1,5 +1,4 @@
 import common
-import gherkin
 
 
 def Settings():
@@ -15,6 +14,32 @@ def HelpSettings():
     return settings
 
 
+# The Python types of the Examples columns loaded from data files
+Types = {
+    "bool": "bool",
+    "int": "int",
+    "uint": "int",
+    "float": "float",
+    "string": "str",
+}
+
+Loader = """
+
+
+def load_examples(path, delimiter, types):
+    %s
+    rows = []
+    with open(path, "r", encoding="utf-8-sig") as f:
+        lines = (line for line in f if len(line.strip()) > 0)
+        next(lines, None)
+        for line in lines:
+            cells = [cell.strip() for cell in line.split(delimiter)]
+            if len(cells) >= len(types):
+                rows.append(tuple(cell in ("true", "True") if type is bool else type(cell) for type, cell in zip(types, cells)))
+    return rows
+"""[1:] % '"""Load the rows of an Examples data file when the tests are collected"""'
+
+
 def ArgModifier(val, type):
     if type == "bool":
         return common.Upper(val)
@@ -26,50 +51,45 @@ def ArgModifier(val, type):
 class Python(common.PrintTestBody):
     def __init__(self, settings):
         self.settings = settings
+        self.templates = settings.get("templates")
+        self.prefix = "py"
         self.argModifier = ArgModifier
         self.testdecl = """
     def test_{0}(self):
         %s
 """[1:] % '"""Gherkin DSL test"""'
         self.step = '        scenario.[[method]]([[arguments]])\n'
+        self.body = common.Compiled(self.prefix + "/body", """
+        scenario = Scenarios.[[className]]()
+[[steps]]
 
-    def ScenarioDecl(self, line, fullArgs, settings):
-        scenarioName = common.Tokenise(line, self.settings["cases"]["scenario"])
+"""[1:], self.templates)
+        self.example = common.Compiled(self.prefix + "/example", """
+[[testName]]        self.[[scenario]]([[arguments]])
+""", self.templates)
+
+    def ScenarioDecl(self, scenario):
         decl = """
     def {0}({1}):
         {2}
 """[1:]
+        fullArgs = scenario.parameters
         if len(fullArgs) > 0:
             fullArgs = "self, " + fullArgs
         else:
             fullArgs = "self"
-        return decl.format(scenarioName, fullArgs, '"""Gherkin DSL scenario"""')
+        return decl.format(scenario.scenarioName, fullArgs, '"""Gherkin DSL scenario"""')
 
-    def TestDecl(self, line):
-        scenarioName = common.Tokenise(line, self.settings["cases"]["test"])
-        return self.testdecl.format(scenarioName)
+    def TestDecl(self, scenario):
+        return self.testdecl.format(scenario.testName)
 
     def Body(self, scenario, steps):
-        buffer = """
-        scenario = Scenarios.[[className]]()
-[[steps]]
+        values = {"className": scenario.className, "steps": steps.rstrip()}
+        return self.body.Render(values)
 
-"""[1:]
-        lines = scenario.lines.split('\n')
-        className = common.Tokenise(lines[0], self.settings["cases"]["class"])
-        buffer = buffer.replace("[[className]]", className)
-        buffer = buffer.replace("[[steps]]", steps.rstrip())
-        return buffer
-
-    def Example(self, line, arguments):
-        buffer = """
-[[testName]]        self.[[scenario]]([[arguments]])
-"""
-        scenario = common.Tokenise(line, self.settings["cases"]["scenario"])
-        testName = " ".join([scenario, arguments])
-        testName = common.Tokenise(testName, self.settings["cases"]["test"])
-        testName = self.testdecl.format(testName)
-        buffer = buffer.replace("[[testName]]", testName)
-        buffer = buffer.replace("[[scenario]]", scenario)
-        buffer = buffer.replace("[[arguments]]", arguments)
-        return buffer
+    def Example(self, scenario, example):
+        values = {}
+        values["testName"] = self.testdecl.format(example.testName)
+        values["scenario"] = scenario.scenarioName
+        values["arguments"] = example.arguments
+        return self.example.Render(values)
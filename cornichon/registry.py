@@ -0,0 +1,167 @@
+import hashlib
+import importlib.metadata
+import json
+import os
+import os.path
+import sys
+import sysconfig
+import threading
+
+
+# Change whenever the index changes so that older indexes are rebuilt
+Version = "1"
+
+# The entry point group that other packages add output types to, named like "cpp/googletest"
+Group = "cornichon.outputs"
+
+Package = os.path.dirname(os.path.realpath(__file__))
+
+
+def SearchPath():
+    """The directories searched for entry points, less cornichon's own directories added to sys.path"""
+    paths = []
+    for path in sys.path:
+        path = os.path.abspath(path)
+        if path != Package and not path.startswith(Package + os.sep):
+            paths.append(path)
+    return paths
+
+
+def DefaultPath():
+    """The index is kept in CORNICHON_INDEX, otherwise in the user's cache directory in a file of its own for each
+    copy of cornichon, interpreter and search path so that scripts and virtual environments keep their own"""
+    if "CORNICHON_INDEX" in os.environ:
+        return os.environ["CORNICHON_INDEX"]
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    key = json.dumps([Package, sys.executable, SearchPath()])
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache, "cornichon", "outputs-%s.json" % digest)
+
+
+def Installed(path):
+    """Whether the directory holds installed distributions, the only places entry points are found"""
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name.endswith((".dist-info", ".egg-info")):
+                    return True
+    except OSError:
+        pass
+    return False
+
+
+def Stamp(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class Index:
+    """The output types, listed once by scanning the plugin directories and entry points and saved to a file.
+    The saved index is used until sys.path or a directory it was built from changes, a plugin file being
+    added or a package installed changing the modification time of its directory."""
+    def __init__(self, path=None):
+        # By default the path follows the search path
+        self.path = path
+        self.outputs = None
+        self.stamps = None
+        self.sysPath = None
+        self.lock = threading.Lock()
+
+    def Outputs(self):
+        """The output types, each mapped to a plugin file or an entry point's object reference"""
+        outputs = self.outputs
+        if outputs is not None and self.sysPath == SearchPath():
+            return outputs
+        with self.lock:
+            if self.outputs is None or self.sysPath != SearchPath():
+                self.Load() or self.Build()
+            return self.outputs
+
+    def Rebuild(self):
+        """Scan again for output types, for those added where the index does not look"""
+        with self.lock:
+            self.Build()
+            return self.outputs
+
+    def Path(self):
+        return DefaultPath() if self.path is None else self.path
+
+    def Find(self, output):
+        return self.Outputs().get(output)
+
+    def Load(self):
+        try:
+            with open(self.Path(), "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(index, dict) or index.get("version") != Version:
+            return False
+        # Another copy of cornichon has its own plugin files
+        if index.get("package") != Package:
+            return False
+        if index.get("executable") != sys.executable or index.get("path") != SearchPath():
+            return False
+        stamps = index.get("stamps", {})
+        for path in stamps:
+            if Stamp(path) != stamps[path]:
+                return False
+        self.outputs = {name: tuple(entry) for name, entry in index["outputs"].items()}
+        self.stamps = stamps
+        self.sysPath = index["path"]
+        return True
+
+    def Build(self):
+        outputs = {}
+        sysPath = SearchPath()
+        stamps = {Package: Stamp(Package)}
+        # Packages are installed into the site directories or alongside other distributions
+        for path in sysPath:
+            if Installed(path):
+                stamps[path] = Stamp(path)
+        for key in ["purelib", "platlib"]:
+            path = sysconfig.get_path(key)
+            stamps[path] = Stamp(path)
+        for entry in importlib.metadata.entry_points(group=Group):
+            outputs.setdefault(entry.name, ("entry point", entry.value))
+        # The plugins shipped with cornichon take precedence
+        with os.scandir(Package) as it:
+            for sub in it:
+                if sub.name == "__pycache__" or not sub.is_dir():
+                    continue
+                stamps[sub.path] = Stamp(sub.path)
+                skip = sub.name + "utils.py"
+                with os.scandir(sub.path) as items:
+                    for item in items:
+                        name, ext = os.path.splitext(item.name)
+                        if ext != ".py" or item.name == skip or not item.is_file():
+                            continue
+                        outputs[sub.name + "/" + name] = ("file", item.path)
+        self.outputs = outputs
+        self.stamps = stamps
+        self.sysPath = sysPath
+        self.Save()
+
+    def Save(self):
+        index = {}
+        index["version"] = Version
+        index["package"] = Package
+        index["executable"] = sys.executable
+        index["path"] = self.sysPath
+        index["stamps"] = self.stamps
+        index["outputs"] = {name: list(entry) for name, entry in sorted(self.outputs.items())}
+        path = self.Path()
+        temp = "%s.%d.tmp" % (path, os.getpid())
+        try:
+            os.makedirs(os.path.dirname(path) or os.curdir, exist_ok=True)
+            with open(temp, "w", encoding="utf-8") as f:
+                json.dump(index, f, indent=1)
+            os.replace(temp, path)
+        except OSError:
+            # An index that cannot be saved is rebuilt by the next process
+            pass
+
+
+Default = Index()
@@ -1,4 +1,5 @@
 import common
+import lowered
 import vbutils
 
 
@@ -14,9 +15,53 @@ def HelpSettings():
     return settings
 
 
-def Generate(parsed, settings):
-    scenarios = parsed[0]
-    feature = parsed[1]
+def Extension():
+    return ".vb"
+
+
+class NUnit(vbutils.VBasic):
+    def DataExample(self, scenario):
+        """A test with a TestCaseSource over the rows of the Examples data file"""
+        buffer = """
+    ' <summary>
+    ' Gherkin DSL examples
+    ' </summary>
+    Private Shared Iterator Function [[rowsName]]() As System.Collections.Generic.IEnumerable(Of Object())
+      Dim lines = System.Linq.Enumerable.Where(System.IO.File.ReadLines("[[data]]"), Function(line) line.Trim().Length > 0)
+      For Each line In System.Linq.Enumerable.Skip(lines, 1)
+        Dim cells = System.Array.ConvertAll(line.Split([[delimiter]]), Function(cell) cell.Trim())
+        If cells.Length >= [[number]] Then
+          Yield New Object() {[[cells]]}
+        End If
+      Next
+    End Function
+
+    ' <summary>
+    ' Gherkin DSL test
+    ' </summary>
+    <TestCaseSource(NameOf([[rowsName]]))>
+    Public Sub [[examplesName]]([[parameters]])
+      [[scenario]]([[arguments]])
+    End Sub
+"""
+        cells = []
+        for i in range(len(scenario.types)):
+            cells.append(vbutils.Parsers[scenario.types[i]].format("cells(%d)" % i))
+        values = {}
+        values["rowsName"] = scenario.rowsName
+        values["data"] = scenario.data
+        values["delimiter"] = "ControlChars.Tab" if scenario.delimiter == '\t' else '","c'
+        values["number"] = str(len(scenario.types))
+        values["cells"] = ", ".join(cells)
+        values["examplesName"] = scenario.examplesName
+        values["parameters"] = scenario.parameters
+        values["scenario"] = scenario.scenarioName
+        values["arguments"] = ", ".join(scenario.header)
+        return common.Render("vb/nunit/data example", buffer, values, self.templates)
+
+
+def Stream(parsed, settings):
+    feature = lowered.Lower(parsed, settings)
     buffer = """
 Imports NUnit.Framework
 
@@ -32,16 +77,19 @@ Namespace [[rootnamespace]][[namespace]]
 End Namespace
 """[1:]
 
-    namespace = common.FeatureName(feature, settings["cases"]["namespace"])
-    buffer = buffer.replace("[[rootnamespace]]", settings["rootnamespace"])
-    buffer = buffer.replace("[[namespace]]", namespace)
+    values = {}
+    values["rootnamespace"] = settings["rootnamespace"]
+    values["namespace"] = feature.namespace
 
     # Print the class
-    className = common.Tokenise("Feature", settings["cases"]["class"])
-    buffer = buffer.replace("[[className]]", className)
+    values["className"] = feature.fixtureName
+    head, tail = common.Surround("vb/nunit", buffer, values, settings.get("templates"))
 
-    vb = vbutils.VBasic(settings, "Test")
-    testBody = vb.TestBody(scenarios, settings)
-    buffer = buffer.replace("[[TestBody]]", testBody)
+    vb = NUnit(settings, "Test")
+    yield head
+    yield from vb.Stream(feature)
+    yield tail
 
-    return buffer
+
+def Generate(parsed, settings):
+    return ''.join(Stream(parsed, settings))
@@ -1,4 +1,5 @@
 import common
+import lowered
 import vbutils
 
 
@@ -14,9 +15,12 @@ def HelpSettings():
     return settings
 
 
-def Generate(parsed, settings):
-    scenarios = parsed[0]
-    feature = parsed[1]
+def Extension():
+    return ".vb"
+
+
+def Stream(parsed, settings):
+    feature = lowered.Lower(parsed, settings)
     buffer = """
 Imports Microsoft.VisualStudio.TestTools.UnitTesting
 
@@ -32,16 +36,19 @@ Namespace [[rootnamespace]][[namespace]]
 End Namespace
 """[1:]
 
-    namespace = common.FeatureName(feature, settings["cases"]["namespace"])
-    buffer = buffer.replace("[[rootnamespace]]", settings["rootnamespace"])
-    buffer = buffer.replace("[[namespace]]", namespace)
+    values = {}
+    values["rootnamespace"] = settings["rootnamespace"]
+    values["namespace"] = feature.namespace
 
     # Print the class
-    className = common.Tokenise("Feature", settings["cases"]["class"])
-    buffer = buffer.replace("[[className]]", className)
+    values["className"] = feature.fixtureName
+    head, tail = common.Surround("vb/unittesting", buffer, values, settings.get("templates"))
 
     vb = vbutils.VBasic(settings, "TestMethod")
-    testBody = vb.TestBody(scenarios, settings)
-    buffer = buffer.replace("[[TestBody]]", testBody)
+    yield head
+    yield from vb.Stream(feature)
+    yield tail
 
-    return buffer
+
+def Generate(parsed, settings):
+    return ''.join(Stream(parsed, settings))
@@ -1,6 +1,7 @@
 import common
+import itertools
+import lowered
 import vbutils
-import gherkin
 
 
 def Settings():
@@ -13,9 +14,14 @@ def HelpSettings():
     return settings
 
 
+def Extension():
+    return ".scenarios.vb"
+
+
 class PrintScenario(common.PrintScenario):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, templates=None):
+        super().__init__(templates)
+        self.prefix = "vb/vbscenarios"
         self.line = "\n      System.Console.WriteLine(%s)"
         self.sub = '" + %s.ToString() + "'
         self.step = """
@@ -29,24 +35,8 @@ class PrintScenario(common.PrintScenario):
 """[1:]
 
 
-def Generate(parsed, settings):
-    scenarios = parsed[0]
-    feature = parsed[1]
-    featureName = common.FeatureName(feature, settings["cases"]["class"])
-
-    printer = PrintScenario()
-    featureDesc = printer.FeatureDesc(feature)
-
-    concat = """
-Namespace [[rootnamespace]][[namespace]].Scenarios
-"""[1:]
-
-    namespace = common.FeatureName(feature, settings["cases"]["namespace"])
-    concat = concat.replace("[[rootnamespace]]", settings["rootnamespace"])
-    concat = concat.replace("[[namespace]]", namespace)
-
-    for scenario in scenarios:
-        buffer = """
+def Class(scenario, printer, featureDesc):
+    buffer = """
   ' <summary>
   ' Test class scenario
   ' </summary>
@@ -63,13 +53,37 @@ Namespace [[rootnamespace]][[namespace]].Scenarios
 
 """[1:]
 
-        buffer = buffer.replace("[[featureName]]", common.Tokenise(scenario.lines, settings["cases"]["class"]))
-        documentation = printer.Documentation(scenario, featureDesc, settings)
-        buffer = buffer.replace("[[documentation]]", documentation)
-        buffer = buffer.replace("[[steps]]", printer.Steps(scenario, settings))
-        concat += buffer
+    values = {}
+    values["featureName"] = scenario.className
+    values["documentation"] = printer.Documentation(scenario, featureDesc)
+    values["steps"] = printer.Steps(scenario)
+    yield common.Render("vb/vbscenarios/class", buffer, values, printer.templates)
+
+
+def Classes(printer, feature, featureDesc):
+    key = (__name__, common.Frozen(printer), featureDesc)
+    for scenario in feature.scenarios:
+        yield from scenario.Rendered(key, Class, printer, featureDesc)
 
-    concat = concat[:-2] + """
+
+def Stream(parsed, settings):
+    feature = lowered.Lower(parsed, settings)
+
+    printer = PrintScenario(settings.get("templates"))
+    featureDesc = printer.FeatureDesc(feature.text)
+
+    concat = """
+Namespace [[rootnamespace]][[namespace]].Scenarios
+"""[1:]
+
+    values = {"rootnamespace": settings["rootnamespace"], "namespace": feature.namespace}
+    concat = common.Render("vb/vbscenarios", concat, values, printer.templates)
+
+    yield from common.Truncate(itertools.chain([concat], Classes(printer, feature, featureDesc)), 2)
+    yield """
 End Namespace
 """
-    return concat
+
+
+def Generate(parsed, settings):
+    return ''.join(Stream(parsed, settings))
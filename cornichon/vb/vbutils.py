@@ -1,5 +1,4 @@
 import common
-import gherkin
 
 
 def Settings():
@@ -24,6 +23,16 @@ def HelpSettings():
     return settings
 
 
+# Parse the cells of the Examples columns loaded from data files
+Parsers = {
+    "bool": "Boolean.Parse({})",
+    "int": "Integer.Parse({})",
+    "uint": "UInteger.Parse({})",
+    "float": "Double.Parse({}, System.Globalization.CultureInfo.InvariantCulture)",
+    "string": "{}",
+}
+
+
 def ArgModifier(val, type):
     if type == "bool":
         return common.Lower(val)
@@ -35,6 +44,8 @@ def ArgModifier(val, type):
 class VBasic(common.PrintTestBody):
     def __init__(self, settings, decorator):
         self.settings = settings
+        self.templates = settings.get("templates")
+        self.prefix = "vb"
         self.argModifier = ArgModifier
         self.testdecl = """
     ' <summary>
@@ -44,44 +55,36 @@ class VBasic(common.PrintTestBody):
     Public Sub {0}()
 """[1:] % decorator
         self.step = '      scenario.[[method]]([[arguments]])\n'
+        self.body = common.Compiled(self.prefix + "/body", """
+      Dim scenario As Scenarios.[[className]] = New Scenarios.[[className]]()
+[[steps]]
+    End Sub
+
+"""[1:], self.templates)
+        self.example = common.Compiled(self.prefix + "/example", """
+[[testName]]      [[scenario]]([[arguments]])
+    End Sub
+""", self.templates)
 
-    def ScenarioDecl(self, line, fullArgs, settings):
-        scenarioName = common.Tokenise(line, self.settings["cases"]["scenario"])
+    def ScenarioDecl(self, scenario):
         decl = """
     ' <summary>
     ' Gherkin DSL scenario
     ' </summary>
     Private Shared Sub {0}({1})
 """[1:]
-        return decl.format(scenarioName, fullArgs)
+        return decl.format(scenario.scenarioName, scenario.parameters)
 
-    def TestDecl(self, line):
-        scenarioName = common.Tokenise(line, self.settings["cases"]["test"])
-        return self.testdecl.format(scenarioName)
+    def TestDecl(self, scenario):
+        return self.testdecl.format(scenario.testName)
 
     def Body(self, scenario, steps):
-        buffer = """
-      Dim scenario As Scenarios.[[className]] = New Scenarios.[[className]]()
-[[steps]]
-    End Sub
+        values = {"className": scenario.className, "steps": steps.rstrip()}
+        return self.body.Render(values)
 
-"""[1:]
-        lines = scenario.lines.split('\n')
-        className = common.Tokenise(lines[0], self.settings["cases"]["class"])
-        buffer = buffer.replace("[[className]]", className)
-        buffer = buffer.replace("[[steps]]", steps.rstrip())
-        return buffer
-
-    def Example(self, line, arguments):
-        buffer = """
-[[testName]]      [[scenario]]([[arguments]])
-    End Sub
-"""
-        scenario = common.Tokenise(line, self.settings["cases"]["scenario"])
-        testName = " ".join([scenario, arguments])
-        testName = common.Tokenise(testName, self.settings["cases"]["test"])
-        testName = self.testdecl.format(testName)
-        buffer = buffer.replace("[[testName]]", testName)
-        buffer = buffer.replace("[[scenario]]", scenario)
-        buffer = buffer.replace("[[arguments]]", arguments)
-        return buffer
+    def Example(self, scenario, example):
+        values = {}
+        values["testName"] = self.testdecl.format(example.testName)
+        values["scenario"] = scenario.scenarioName
+        values["arguments"] = example.arguments
+        return self.example.Render(values)
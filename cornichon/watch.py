@@ -0,0 +1,279 @@
+import ctypes
+import os
+import os.path
+import select
+import struct
+import sys
+import time
+import batch
+import cornichon
+
+
+# The inotify events of a file being written, moved or removed and of a directory being added or removed
+IN_ATTRIB = 0x4
+IN_CLOSE_WRITE = 0x8
+IN_MOVED_FROM = 0x40
+IN_MOVED_TO = 0x80
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_DELETE_SELF = 0x400
+IN_Q_OVERFLOW = 0x4000
+IN_ISDIR = 0x40000000
+Mask = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+
+Event = struct.Struct("iIII")
+
+
+def Directories(sources):
+    """The directories beneath the sources, those of the sources that are files being their directories"""
+    directories = []
+    pending = [source if os.path.isdir(source) else os.path.dirname(source) or os.curdir for source in sources]
+    while len(pending) > 0:
+        directory = pending.pop()
+        directories.append(directory)
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if not entry.name.startswith(".") and entry.is_dir():
+                        pending.append(entry.path)
+        except OSError:
+            pass
+    return directories
+
+
+class Poller:
+    """Finds the files that changed by comparing their modification times and sizes with those last seen"""
+    def __init__(self, sources, interval=0.25):
+        self.sources = sources
+        self.interval = interval
+        self.extra = set()
+        self.stats = self.Scan()
+
+    def Watch(self, paths):
+        """Also look for changes to these files, such as Examples data files outside the sources"""
+        self.extra.update(paths)
+        self.stats.update(self.Stat(self.extra))
+
+    def Stat(self, paths):
+        stats = {}
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                stats[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                pass
+        return stats
+
+    def Scan(self):
+        stats = self.Stat(self.extra)
+        for directory in Directories(self.sources):
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.name.startswith(".") or not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                        stats[entry.path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                pass
+        return stats
+
+    def Wait(self, timeout=None):
+        """The paths changed, added or removed since the last call, waiting up to the timeout for one"""
+        start = time.monotonic()
+        while True:
+            stats = self.Scan()
+            changed = set([path for path in stats if self.stats.get(path) != stats[path]])
+            changed.update([path for path in self.stats if path not in stats])
+            self.stats = stats
+            remaining = None if timeout is None else timeout - (time.monotonic() - start)
+            if len(changed) > 0 or (remaining is not None and remaining <= 0):
+                return changed
+            time.sleep(self.interval if remaining is None else min(self.interval, remaining))
+
+    def Close(self):
+        pass
+
+
+class Inotify:
+    """Is told by the Linux kernel of the files that changed beneath the watched directories"""
+    def __init__(self, sources):
+        self.libc = ctypes.CDLL(None, use_errno=True)
+        self.libc.inotify_init1.argtypes = [ctypes.c_int]
+        self.libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+        self.directories = {}
+        try:
+            for directory in Directories(sources):
+                self.Add(directory)
+        except OSError:
+            self.Close()
+            raise
+
+    @staticmethod
+    def Available():
+        return sys.platform.startswith("linux") and hasattr(ctypes.CDLL(None), "inotify_init1")
+
+    def Add(self, directory):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), Mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()), directory)
+        self.directories[wd] = directory
+
+    def Watch(self, paths):
+        """Also watch the directories of these files, such as Examples data files outside the sources"""
+        watched = set(self.directories.values())
+        for path in paths:
+            directory = os.path.dirname(path) or os.curdir
+            if directory not in watched and os.path.isdir(directory):
+                self.Add(directory)
+                watched.add(directory)
+
+    def Wait(self, timeout=None):
+        """The paths changed, added or removed, waiting up to the timeout for one, or None when events were lost"""
+        if len(select.select([self.fd], [], [], timeout)[0]) == 0:
+            return set()
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, cookie, length = Event.unpack_from(data, offset)
+                name = data[offset + Event.size:offset + Event.size + length].rstrip(b'\0')
+                offset += Event.size + length
+                if mask & IN_Q_OVERFLOW:
+                    changed = None
+                if changed is None or wd not in self.directories:
+                    continue
+                path = os.path.join(self.directories[wd], os.fsdecode(name)) if len(name) > 0 else self.directories[wd]
+                if mask & IN_DELETE_SELF:
+                    del self.directories[wd]
+                elif mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    # Files may have been added to a directory before it was watched
+                    for directory in Directories([path]):
+                        self.Add(directory)
+                changed.add(path)
+            if changed is None:
+                return None
+
+    def Close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def Monitor(sources, poll=False):
+    """Inotify where there is one, otherwise polling"""
+    if not poll and Inotify.Available():
+        try:
+            return Inotify(sources)
+        except OSError:
+            # Out of inotify watches
+            pass
+    return Poller(sources)
+
+
+class Watcher:
+    """Regenerate the features beneath the sources whenever they or the Examples data files they read change,
+    keeping the plugins loaded and the parsed scenarios in memory between changes"""
+    def __init__(self, sources, out, settings, monitor=None, debounce=0.05, depfiles=False):
+        self.sources = sources
+        self.out = out
+        self.debounce = debounce
+        self.incremental = cornichon.Incremental()
+        self.job = batch.Job(settings, self.incremental, out, None, depfiles)
+        self.features = {}
+        self.inputs = {}
+        self.monitor = Monitor(sources) if monitor is None else monitor
+
+    def Discover(self):
+        """The features that were added, forgetting those that were removed"""
+        features = dict(batch.Discover(self.sources))
+        for path in list(self.features):
+            if path not in features:
+                del self.features[path]
+                self.incremental.features.pop(path, None)
+        added = [path for path in features if path not in self.features]
+        self.features = features
+        return added
+
+    def Affected(self, changed):
+        """The features to generate again for the paths that changed"""
+        if changed is None:
+            self.Discover()
+            return set(self.features)
+        affected = set()
+        discover = False
+        for path in changed:
+            if path in self.features:
+                if os.path.isfile(path):
+                    affected.add(path)
+                else:
+                    discover = True
+            elif path.endswith(".feature") or os.path.isdir(path) or not os.path.exists(path):
+                discover = True
+            for feature in self.inputs.get(os.path.normpath(path), ()):
+                # The scenarios reading the data file are parsed again for the types of its columns
+                self.incremental.features.pop(feature, None)
+                affected.add(feature)
+        if discover:
+            affected.update(self.Discover())
+        return set([path for path in affected if path in self.features])
+
+    def Generate(self, paths):
+        """Generate the features, writing the files that changed, returning those files and the features that failed"""
+        written = []
+        errors = []
+        for path in sorted(paths):
+            path, files, error, entry = self.job.Generate((path, self.features[path]))
+            if error is not None:
+                errors.append((path, error))
+                continue
+            for name, stubCode in files:
+                filename = os.path.join(self.out, name)
+                if batch.WriteIfChanged(filename, stubCode):
+                    written.append(filename)
+            for name in entry["inputs"]:
+                self.inputs.setdefault(os.path.normpath(name), set()).add(path)
+            self.monitor.Watch(entry["inputs"])
+        return written, errors
+
+    def Wait(self, timeout=None):
+        """The paths changed once they stop changing for the debounce interval, as editors save in several steps"""
+        changed = self.monitor.Wait(timeout)
+        if changed is not None and len(changed) == 0:
+            return changed
+        while True:
+            more = self.monitor.Wait(self.debounce)
+            if more is not None and len(more) == 0:
+                return changed
+            changed = None if changed is None or more is None else changed | more
+
+    def Run(self, report, stop=None):
+        """Generate every feature then those affected by each change, until stopped, reporting the files written,
+        the features that failed and the time taken in seconds"""
+        self.Discover()
+        start = time.perf_counter()
+        written, errors = self.Generate(self.features)
+        report(written, errors, time.perf_counter() - start)
+        try:
+            while stop is None or not stop.is_set():
+                changed = self.Wait(None if stop is None else 0.1)
+                if changed is not None and len(changed) == 0:
+                    continue
+                start = time.perf_counter()
+                try:
+                    affected = self.Affected(changed)
+                except (OSError, ValueError) as e:
+                    report([], [(self.sources[0], "{}: {}".format(type(e).__name__, e))], time.perf_counter() - start)
+                    continue
+                if len(affected) > 0:
+                    written, errors = self.Generate(affected)
+                    report(written, errors, time.perf_counter() - start)
+        finally:
+            self.monitor.Close()
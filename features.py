@@ -13,30 +13,19 @@ for filename in os.listdir('Examples/tests'):
     inFileName = os.path.join('Examples/tests', filename)
     stub, ext = os.path.splitext(filename)
     if ext == '.feature':
-        # Read the Gherkin DSL
         print(filename)
-        f = open(inFileName, "r")
-        gherkin = f.readlines()
-        f.close()
 
         # Only need to call Settings for the test framework as it builds
         # on those settings for the scenarios
         settings = cornichon.Settings("cpp/cppunittest")
         settings["rootnamespace"] = "Cornichon::"
         settings["scenarios file"] = "../cppscenarios/" + stub + ".h"
+        stubCodes = cornichon.GenerateAll(inFileName, {"cpp/cppunittest": settings, "cpp/cppscenarios": settings})
 
-        # Generate the tests
+        # Generate the tests, leaving those that are unchanged alone
         ofilename = 'Examples/output/cpp/cppunittest/' + stub + ".cpp"
-        if os.path.exists(ofilename):
-            ofilename = 'Examples/output/cpp/cppunittest/' + stub + ".fpp"
-        fp = open(ofilename, "w")
-        fp.write(cornichon.Generate(gherkin, settings, "cpp/cppunittest"))
-        fp.close()
+        cornichon.WriteIfChanged(ofilename, stubCodes["cpp/cppunittest"])
 
         # Generate the test scenarios
         ofilename = 'Examples/output/cpp/cppscenarios/' + stub + ".h"
-        if os.path.exists(ofilename):
-            ofilename = 'Examples/output/cpp/cppscenarios/' + stub + ".f"
-        fp = open(ofilename, "w")
-        fp.write(header + cornichon.Generate(gherkin, settings, "cpp/cppscenarios"))
-        fp.close()
+        cornichon.WriteIfChanged(ofilename, header + stubCodes["cpp/cppscenarios"])
@@ -35,6 +35,11 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/zebmason/Cornichon",
     packages=packages,
+    entry_points={
+        "console_scripts": [
+            "cornichon = cornichon.__main__:Main",
+        ],
+    },
     classifiers=[
         "Framework :: Pytest",
         "Topic :: Software Development :: Code Generators",
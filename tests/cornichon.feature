@@ -10,6 +10,7 @@ Scenario Outline: cppunittest
     | name |
     | example |
     | example2 |
+    | example3 |
 
 Scenario Outline: cppscenarios
   When the generator is cppscenarios
@@ -18,6 +19,7 @@ Scenario Outline: cppscenarios
     | name |
     | example |
     | example2 |
+    | example3 |
 
 Scenario Outline: unnested
   When the generator is cppscenarios
@@ -33,6 +35,7 @@ Scenario Outline: googletest
     | name |
     | example |
     | example2 |
+    | example3 |
 
 Scenario Outline: pyunit_tests
   When the generator is pyunit_tests
@@ -41,6 +44,7 @@ Scenario Outline: pyunit_tests
     | name |
     | example |
     | example2 |
+    | example3 |
 
 Scenario Outline: pyscenarios
   When the generator is pyscenarios
@@ -49,6 +53,7 @@ Scenario Outline: pyscenarios
     | name |
     | example |
     | example2 |
+    | example3 |
 
 Scenario Outline: pytests
   When the generator is pytests
@@ -57,6 +62,7 @@ Scenario Outline: pytests
     | name |
     | example |
     | example2 |
+    | example3 |
 
 Scenario Outline: pytestscenarios
   When the generator is pyscenarios
@@ -65,6 +71,7 @@ Scenario Outline: pytestscenarios
     | name |
     | example |
     | example2 |
+    | example3 |
 
 Scenario Outline: unittesting
   When the generator is unittesting
@@ -73,6 +80,7 @@ Scenario Outline: unittesting
     | name |
     | example |
     | example2 |
+    | example3 |
 
 Scenario Outline: nunit
   When the generator is nunit
@@ -81,6 +89,7 @@ Scenario Outline: nunit
     | name |
     | example |
     | example2 |
+    | example3 |
 
 Scenario Outline: csscenarios
   When the generator is csscenarios
@@ -89,6 +98,7 @@ Scenario Outline: csscenarios
     | name |
     | example |
     | example2 |
+    | example3 |
 
 Scenario Outline: vbunittesting
   When the generator is unittesting
@@ -97,6 +107,7 @@ Scenario Outline: vbunittesting
     | name |
     | example |
     | example2 |
+    | example3 |
 
 Scenario Outline: vbnunit
   When the generator is nunit
@@ -105,6 +116,7 @@ Scenario Outline: vbnunit
     | name |
     | example |
     | example2 |
+    | example3 |
 
 Scenario Outline: vbscenarios
   When the generator is vbscenarios
@@ -113,3 +125,215 @@ Scenario Outline: vbscenarios
     | name |
     | example |
     | example2 |
+    | example3 |
+
+Scenario Outline: parsed
+  When the feature is parsed once
+  Then every generator gives the same as the saved
+  Examples:
+    | name |
+    | example |
+    | example2 |
+
+Scenario Outline: fanned
+  When every generator is fanned out
+  Then each output is the same as generated alone from the lines
+  Examples:
+    | name |
+    | example |
+    | example2 |
+
+Scenario Outline: buffered
+  When the feature is parsed from a <source>
+  Then every generator gives the same as the saved
+  Examples:
+    | name     | source |
+    | example  | path   |
+    | example  | bytes  |
+    | example  | mmap   |
+    | example2 | path   |
+    | example2 | bytes  |
+    | example2 | mmap   |
+
+Scenario Outline: pickled
+  When the feature is parsed from a <source> and pickled
+  Then every generator gives the same as the saved
+  Examples:
+    | name     | source |
+    | example  | lines  |
+    | example  | mmap   |
+    | example2 | lines  |
+    | example2 | mmap   |
+
+Scenario Outline: lowered
+  When the feature is parsed once
+  Then it is lowered once for each settings
+  Examples:
+    | name |
+    | example |
+    | example2 |
+
+Scenario Outline: streamed
+  When the feature is parsed once
+  Then every generator streams the same as it generates
+  Examples:
+    | name |
+    | example |
+    | example2 |
+
+Scenario Outline: incremental
+  When the feature is parsed once
+  And scenario <index> is edited
+  Then regenerating incrementally is the same as in full
+  Examples:
+    | name     | index |
+    | example  | 0     |
+    | example  | 1     |
+    | example2 | 1     |
+
+Scenario Outline: cached
+  When the feature is parsed through a cache
+  Then it is loaded from the cache the second time
+  Examples:
+    | name     |
+    | example  |
+    | example2 |
+
+Scenario Outline: evicted
+  When the feature is parsed through a cache of <size> bytes
+  Then the cache command gives <entries> entries
+  Examples:
+    | name    | size    | entries |
+    | example | 10      | 0       |
+    | example | 1000000 | 1       |
+
+Scenario Outline: scanned
+  When <count> features are parsed through a cache of <size> bytes
+  Then the cache directory is scanned <scans> times
+  Examples:
+    | name    | count | size    | scans |
+    | example | 50    | 1000000 | 1     |
+    | example | 50    | 10      | 51    |
+
+Scenario Outline: loaded
+  When the <language> <output> plugin is loaded from several threads
+  Then every thread gets the same plugin
+  Examples:
+    | name    | language | output |
+    | example | cs       | nunit  |
+    | example | vb       | nunit  |
+
+Scenario Outline: registered
+  When a package adds the output type <output>
+  Then it is listed and loaded from the saved index
+  Examples:
+    | name    | output      |
+    | example | acme/checks |
+
+Scenario Outline: separated
+  When the index is kept in the cache directory <cache>
+  Then each search path and interpreter has an index of its own
+  Examples:
+    | name    | cache |
+    | example | xdg   |
+
+Scenario Outline: overridden
+  When the <template> template of <output> is overridden
+  Then the generated stub code uses the override
+  Examples:
+    | name    | output           | template            |
+    | example | cpp/cppunittest  | cpp/example         |
+    | example | cs/nunit         | cs/nunit            |
+    | example | py/pyscenarios   | py/pyscenarios/step |
+
+Scenario Outline: unmarked
+  When the template of <output> is overridden with <count> test bodies
+  Then generating names the template in the error
+  Examples:
+    | name    | output          | count |
+    | example | cpp/googletest  | 0     |
+    | example | py/pytests      | 2     |
+    | example | vb/unittesting  | 0     |
+
+Scenario Outline: frozen
+  When the settings for <output> are frozen
+  Then they generate the same stub code and can be hashed
+  Examples:
+    | name     | output          |
+    | example  | cpp/cppunittest |
+    | example2 | cs/nunit        |
+    | example3 | py/pytests      |
+
+Scenario Outline: rejected
+  When the settings for <output> have <path> set
+  Then freezing them is rejected
+  Examples:
+    | name    | output          | path              |
+    | example | cpp/cppunittest | nested namespace  |
+    | example | vb/nunit        | cases/stepname    |
+    | example | py/pyscenarios  | types/int/default |
+
+Scenario Outline: built
+  When the example features and a malformed one are built for <targets> with <jobs> jobs
+  Then the stub code of each feature is written and the malformed one is reported
+  Examples:
+    | name    | targets                         | jobs |
+    | example | cpp/googletest,cpp/cppscenarios | 2    |
+    | example | py/pytests,py/pyscenarios       | 1    |
+
+Scenario Outline: rebuilt
+  When the example features are built for <targets> with <jobs> jobs, one changed and built again
+  Then only the changed feature is generated again
+  Examples:
+    | name    | targets                         | jobs |
+    | example | cpp/googletest,cpp/cppscenarios | 2    |
+    | example | py/pytests,py/pyscenarios       | 1    |
+
+Scenario Outline: kept
+  When the example features are built for <targets> twice and a file is edited
+  Then only the edited file is written again
+  Examples:
+    | name    | targets                         |
+    | example | cpp/googletest,cpp/cppscenarios |
+    | example | cs/nunit,cs/csscenarios         |
+
+Scenario Outline: depended
+  When the feature is built for <target> with depfiles and a Ninja fragment
+  Then the depfile lists the feature, its data and the plugin and the fragment builds it
+  Examples:
+    | name     | target         |
+    | example  | cpp/googletest |
+    | example3 | cpp/googletest |
+    | example3 | py/pytests     |
+
+Scenario Outline: unmapped
+  When <count> features with Examples are watched
+  Then none of the features is held open
+  Examples:
+    | name    | count |
+    | example | 300   |
+
+Scenario Outline: watched
+  When the example features are watched by <monitor> and one is edited
+  Then only the edited feature is generated again
+  Examples:
+    | name    | monitor |
+    | example | polling |
+    | example | inotify |
+
+Scenario Outline: mixed
+  When the generators are fanned out selecting <first> and <second>
+  Then each output is the same as generated alone from the lines
+  Examples:
+    | name    | first  | second      |
+    | example | @smoke | not @smoke  |
+    | example |        | @smoke      |
+
+Scenario Outline: bounded
+  When an outline with <rows> rows is streamed for <output>
+  Then the memory used is bounded by a scenario rather than the rows
+  Examples:
+    | name    | rows  | output         |
+    | example | 20000 | cpp/googletest |
+    | example | 20000 | py/pytests     |
+    | example | 20000 | cs/nunit       |
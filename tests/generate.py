@@ -18,16 +18,13 @@ def Process(stub):
     # on those settings for the scenarios
     settings = cornichon.Settings("py/pyunit_tests")
     settings["scenarios file"] = 'scenarios_' + stub
+    stubCodes = cornichon.GenerateAll(gherkin, {"py/pyunit_tests": settings, "py/pyscenarios": settings})
 
-    # Overwrite the tests
-    fp = open('test_' + stub + '.py', "w")
-    fp.write(cornichon.Generate(gherkin, settings, "py/pyunit_tests"))
-    fp.close()
+    # Overwrite the tests if they have changed
+    cornichon.WriteIfChanged('test_' + stub + '.py', stubCodes["py/pyunit_tests"])
 
-    # Overwrite the test scenarios
-    fp = open('scenarios_' + stub + '.py', "w")
-    fp.write(cornichon.Generate(gherkin, settings, "py/pyscenarios"))
-    fp.close()
+    # Overwrite the test scenarios if they have changed
+    cornichon.WriteIfChanged('scenarios_' + stub + '.py', stubCodes["py/pyscenarios"])
 
 
 features = ['cornichon', 'units', 'gherkin']
@@ -10,6 +10,23 @@ Scenario Outline: types
     | int    | -90   |
     | float  | 1.45  |
     | string | is so |
+    | float  | 00    |
+    | float  | -0    |
+    | float  | 1e5   |
+    | float  | -inf  |
+    | string | 1__0  |
+
+Scenario Outline: columns
+  Given a column <values>
+  Then it has corresponding <type>
+  Examples:
+    | type   | values         |
+    | uint   | 1,20,0         |
+    | int    | 1,-20,0        |
+    | float  | 1,-2.5,0       |
+    | string | true,1         |
+    | string | 1,a,2.5,-1     |
+    | bool   | true,False     |
 
 Scenario Outline: worst
   Given a first type <first>
@@ -23,3 +40,92 @@ Scenario Outline: worst
     | string | string | uint   |
     | string | string | int    |
     | string | string | float  |
+
+Scenario Outline: lexed
+  Given a feature file called <name>
+  Then it has <number> sections
+  Examples:
+    | name     | number |
+    | example  | 11     |
+    | example2 | 9      |
+
+Scenario Outline: tabulated
+  Given a feature file called <name>
+  Then scenario <index> has columns <header> of types <types>
+  Examples:
+    | name    | index | header                 | types               |
+    | example | 0     | value,second,sum       | uint,uint,uint      |
+    | example | 1     | value,second,third,sum | uint,uint,uint,uint |
+
+Scenario Outline: data
+  Given a feature file called <name>
+  Then scenario <index> reads columns <header> of types <types> from <rows> rows
+  Examples:
+    | name     | index | header                     | types                 | rows |
+    | example3 | 0     | value,second,sum           | uint,uint,uint        | 3    |
+    | example3 | 1     | name,price,available,stock | string,float,bool,int | 2    |
+
+Scenario Outline: stepped
+  Given a step <keyword> with text <text>
+  Then it is parsed once into method <method> with <number> parameters
+  Examples:
+    | keyword | text                   | method          | number |
+    | Given   | an initial <value>     | GivenAnInitial  | 1      |
+    | When    | you add "5" and "6"    | WhenYouAddAnd   | 2      |
+
+Scenario Outline: tagged
+  Given a feature file called <name>
+  Then the tags <expression> select scenarios <selected>
+  Examples:
+    | name     | expression                        | selected |
+    | example4 |                                   | 0,1,2    |
+    | example4 | @smoke                            | 0,2      |
+    | example4 | @smoke and not @slow              | 0        |
+    | example4 | @calculator and (@wip or @large)  | 1,2      |
+    | example4 | not @smoke or @wip and @slow      | 1        |
+
+Scenario Outline: described
+  Given a description line <line>
+  Then it is kept as a description selected by <expression> rather than read as tags
+  Examples:
+    | line              | expression           |
+    | @everyone         | @smoke               |
+    | @home and @office | @smoke and not @home |
+    | @a @b             | @smoke and not @a    |
+
+Scenario Outline: untagged
+  Then the tag expression <expression> is rejected
+  Examples:
+    | expression |
+    | @a and     |
+    | (@a        |
+    | @a @b      |
+    | or         |
+
+Scenario Outline: dialects
+  Given a feature file called <name>
+  Then scenario <index> is <title> with steps <steps>
+  Examples:
+    | name     | index | title               | steps                  |
+    | example5 | 0     | Ajouter deux autres | Soit,Quand,Quand,Alors |
+    | example6 | 0     | 足し算              | 前提,もし,もし,ならば  |
+
+Scenario Outline: synonyms
+  When the <keyword> keyword is written as <synonym>
+  Then the feature is parsed the same
+  Examples:
+    | keyword          | synonym           |
+    | Feature          | Business Need     |
+    | Feature          | Ability           |
+    | Scenario         | Example           |
+    | Scenario Outline | Scenario Template |
+    | Examples         | Scenarios         |
+
+Scenario Outline: malformed
+  Given a feature with <flaw>
+  Then parsing it is rejected with <error>
+  Examples:
+    | flaw           | error                             |
+    | no feature     | There is no feature section       |
+    | examples first | Examples come before any scenario |
+    | no table       | Examples have no table            |
@@ -1,12 +1,33 @@
+import atexit
+import concurrent.futures
+import io
 import unittest
+import mmap
 import os
+import pickle
+import queue
+import shutil
 import os.path
+import subprocess
 import sys
+import tempfile
+import tracemalloc
+import threading
+
+# Keep the index of output types out of the user's cache directory
+indexDir = tempfile.TemporaryDirectory()
+atexit.register(indexDir.cleanup)
+os.environ["CORNICHON_INDEX"] = os.path.join(indexDir.name, "outputs.json")
 
 curdir = os.path.dirname(os.path.realpath(__file__))
 subdir = os.path.join(curdir, '../cornichon')
 sys.path.insert(0, subdir)
+import batch
 import cornichon
+import gherkin
+import lowered
+import registry
+import watch
 
 
 class Scenarios:
@@ -19,11 +40,9 @@ class Scenarios:
 
         def ThenTheGeneratedTestIsTheSameAsTheSaved(self):
             """Gherkin DSL step"""
+            # Read from the path so that Examples data files are found beside it
             inFileName = os.path.join('../Examples/tests', self.name + '.feature')
-            f = open(inFileName, "r")
-            gherkin = f.readlines()
-            f.close()
-            contents = self.header + cornichon.Generate(gherkin, self.settings, self.output)
+            contents = self.header + cornichon.Generate(inFileName, self.settings, self.output)
             filePath = '../Examples/output/%s/%s%s' % (self.folder, self.name, self.ext)
             self.DiffScenario(contents, filePath)
 
@@ -89,11 +108,9 @@ class Scenarios:
 
         def ThenTheGeneratedTestIsTheSameAs(self, namespace):
             """Gherkin DSL step"""
+            # Read from the path so that Examples data files are found beside it
             inFileName = os.path.join('../Examples/tests', self.name + '.feature')
-            f = open(inFileName, "r")
-            gherkin = f.readlines()
-            f.close()
-            contents = self.header + cornichon.Generate(gherkin, self.settings, self.output)
+            contents = self.header + cornichon.Generate(inFileName, self.settings, self.output)
             filePath = '../Examples/output/%s/%s%s' % (self.folder, namespace, self.ext)
             self.DiffScenario(contents, filePath)
 
@@ -209,3 +226,635 @@ class Scenarios:
             self.ext = ".vb"
             self.header = ""
             self.settings = cornichon.Settings(self.output)
+
+    class Parsed(Scenarios):
+        """Test class scenario"""
+        def WhenTheFeatureIsParsedOnce(self):
+            """Gherkin DSL step"""
+            inFileName = os.path.join('../Examples/tests', self.name + '.feature')
+            f = open(inFileName, "r")
+            self.gherkin = f.readlines()
+            f.close()
+            self.parsed = cornichon.Parse(self.gherkin, {})
+
+        def ThenEveryGeneratorGivesTheSameAsTheSaved(self):
+            """Gherkin DSL step"""
+            for output in gherkin.ListModules():
+                settings = cornichon.Settings(output)
+                expected = cornichon.Generate(self.gherkin, settings, output)
+                self.assertEqual(expected, cornichon.Generate(self.parsed, settings, output))
+
+    class Fanned(Scenarios):
+        """Test class scenario"""
+        def WhenEveryGeneratorIsFannedOut(self):
+            """Gherkin DSL step"""
+            inFileName = os.path.join('../Examples/tests', self.name + '.feature')
+            f = open(inFileName, "r")
+            self.gherkin = f.readlines()
+            f.close()
+            self.outputs = {}
+            for output in gherkin.ListModules():
+                self.outputs[output] = cornichon.Settings(output)
+            self.stubCodes = cornichon.GenerateAll(self.gherkin, self.outputs)
+
+        def ThenEachOutputIsTheSameAsGeneratedAloneFromTheLines(self):
+            """Gherkin DSL step"""
+            self.assertEqual(sorted(self.outputs), sorted(self.stubCodes))
+            for output in self.outputs:
+                expected = cornichon.Generate(self.gherkin, self.outputs[output], output)
+                self.assertEqual(expected, self.stubCodes[output])
+
+    class Buffered(Parsed):
+        """Test class scenario"""
+        def WhenTheFeatureIsParsedFromA(self, source):
+            """Gherkin DSL step"""
+            self.WhenTheFeatureIsParsedOnce()
+            inFileName = os.path.join('../Examples/tests', self.name + '.feature')
+            if source == "path":
+                self.parsed = cornichon.Parse(inFileName, {})
+                return
+            f = open(inFileName, "rb")
+            if source == "bytes":
+                self.parsed = cornichon.Parse(f.read(), {})
+            else:
+                self.parsed = cornichon.Parse(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), {})
+            f.close()
+
+    class Pickled(Buffered):
+        """Test class scenario"""
+        def WhenTheFeatureIsParsedFromAAndPickled(self, source):
+            """Gherkin DSL step"""
+            if source == "lines":
+                self.WhenTheFeatureIsParsedOnce()
+            else:
+                self.WhenTheFeatureIsParsedFromA(source)
+            self.parsed = pickle.loads(pickle.dumps(self.parsed))
+
+    class Lowered(Parsed):
+        """Test class scenario"""
+        def ThenItIsLoweredOnceForEachSettings(self):
+            """Gherkin DSL step"""
+            for output in gherkin.ListModules():
+                settings = cornichon.Settings(output)
+                feature = lowered.Lower(self.parsed, settings)
+                self.assertIs(feature, lowered.Lower(self.parsed, cornichon.Settings(output)))
+                self.assertEqual(len(self.parsed.scenarios), len(feature.scenarios))
+                for scenario in feature.scenarios:
+                    self.assertEqual(len(scenario.uniqueSteps), len(set([step.method for step in scenario.steps])))
+            self.assertLess(len(self.parsed.lowered), len(gherkin.ListModules()))
+
+    class Streamed(Parsed):
+        """Test class scenario"""
+        def ThenEveryGeneratorStreamsTheSameAsItGenerates(self):
+            """Gherkin DSL step"""
+            for output in gherkin.ListModules():
+                settings = cornichon.Settings(output)
+                expected = cornichon.Generate(self.gherkin, settings, output)
+                fp = io.StringIO()
+                cornichon.GenerateTo(self.parsed, settings, output, fp)
+                self.assertEqual(expected, fp.getvalue())
+
+    class Incremental(Parsed):
+        """Test class scenario"""
+        def WhenScenarioIsEdited(self, index):
+            """Gherkin DSL step"""
+            self.incremental = cornichon.Incremental()
+            self.outputs = {}
+            for output in gherkin.ListModules():
+                self.outputs[output] = cornichon.Settings(output)
+                self.incremental.Generate(self.gherkin, self.outputs[output], output)
+            self.before = self.incremental.Parse(self.gherkin, {})
+            self.lowered = [len(scenario.lowered) for scenario in self.before.scenarios]
+            self.index = int(index)
+            self.edited = list(self.gherkin)
+            found = -1
+            for i in range(len(self.edited)):
+                if self.edited[i].startswith("Scenario"):
+                    found += 1
+                    if found == self.index:
+                        self.edited[i] = self.edited[i].rstrip() + " edited\n"
+
+        def ThenRegeneratingIncrementallyIsTheSameAsInFull(self):
+            """Gherkin DSL step"""
+            for output in self.outputs:
+                expected = cornichon.Generate(self.edited, self.outputs[output], output)
+                self.assertEqual(expected, self.incremental.Generate(self.edited, self.outputs[output], output))
+            after = self.incremental.Parse(self.edited, {})
+            self.assertEqual(len(self.before.scenarios), len(after.scenarios))
+            for i in range(len(after.scenarios)):
+                if i == self.index:
+                    self.assertIsNot(self.before.scenarios[i], after.scenarios[i])
+                else:
+                    # Unchanged scenarios are parsed, lowered and rendered once
+                    self.assertIs(self.before.scenarios[i], after.scenarios[i])
+                    self.assertEqual(self.lowered[i], len(after.scenarios[i].lowered))
+
+    class Cached(Scenarios):
+        """Test class scenario"""
+        def WhenTheFeatureIsParsedThroughACache(self):
+            """Gherkin DSL step"""
+            directory = tempfile.TemporaryDirectory()
+            self.addCleanup(directory.cleanup)
+            self.cache = cornichon.Cache(directory.name)
+            self.path = os.path.join('../Examples/tests', self.name + '.feature')
+            self.parsed = cornichon.Parse(self.path, {}, self.cache)
+
+        def ThenItIsLoadedFromTheCacheTheSecondTime(self):
+            """Gherkin DSL step"""
+            self.assertEqual(0, self.cache.hits)
+            loaded = cornichon.Parse(self.path, {}, self.cache)
+            self.assertEqual(1, self.cache.hits)
+            self.assertEqual(1, self.cache.misses)
+            for output in gherkin.ListModules():
+                settings = cornichon.Settings(output)
+                expected = cornichon.Generate(self.path, settings, output)
+                self.assertEqual(expected, cornichon.Generate(self.parsed, settings, output))
+                self.assertEqual(expected, cornichon.Generate(loaded, settings, output))
+
+    class Evicted(Scenarios):
+        """Test class scenario"""
+        def WhenTheFeatureIsParsedThroughACacheOfBytes(self, size):
+            """Gherkin DSL step"""
+            directory = tempfile.TemporaryDirectory()
+            self.addCleanup(directory.cleanup)
+            self.directory = directory.name
+            cache = cornichon.Cache(self.directory, int(size))
+            cornichon.Parse(os.path.join('../Examples/tests', self.name + '.feature'), {}, cache)
+
+        def ThenTheCacheCommandGivesEntries(self, entries):
+            """Gherkin DSL step"""
+            command = [sys.executable, "-m", "cornichon", "cache", "stats", "--directory", self.directory]
+            stats = subprocess.run(command, cwd="..", capture_output=True, text=True, check=True).stdout
+            self.assertIn("entries: %s\n" % entries, stats)
+            command[4] = "clear"
+            subprocess.run(command, cwd="..", capture_output=True, check=True)
+            self.assertEqual(0, cornichon.Cache(self.directory).Stats()["entries"])
+
+    class Scanned(Scenarios):
+        """Test class scenario"""
+        def WhenFeaturesAreParsedThroughACacheOfBytes(self, count, size):
+            """Gherkin DSL step"""
+            directory = tempfile.TemporaryDirectory()
+            self.addCleanup(directory.cleanup)
+            cache = cornichon.Cache(directory.name, size)
+            entries = cache.Entries
+            self.scans = 0
+
+            def Entries():
+                self.scans += 1
+                return entries()
+            cache.Entries = Entries
+            with open(os.path.join('../Examples/tests', self.name + '.feature'), "r") as f:
+                lines = f.readlines()
+            for i in range(count):
+                cornichon.Parse(lines + ["# %d\n" % i], {}, cache)
+            self.count = count
+            self.entries = len(entries())
+
+        def ThenTheCacheDirectoryIsScannedTimes(self, scans):
+            """Gherkin DSL step"""
+            self.assertEqual(scans, self.scans)
+            # A cache too small for any entry is emptied by every store
+            self.assertEqual(self.count if scans == 1 else 0, self.entries)
+
+    class Loaded(Scenarios):
+        """Test class scenario"""
+        def WhenThePluginIsLoadedFromSeveralThreads(self, language, output):
+            """Gherkin DSL step"""
+            self.language = language
+            self.output = language + "/" + output
+            with concurrent.futures.ThreadPoolExecutor(8) as pool:
+                self.mods = list(pool.map(gherkin.Import, [self.output] * 32))
+
+        def ThenEveryThreadGetsTheSamePlugin(self):
+            """Gherkin DSL step"""
+            mod = self.mods[0]
+            for other in self.mods:
+                self.assertIs(mod, other)
+            self.assertEqual("cornichon." + self.output.replace("/", "."), mod.__name__)
+            self.assertEqual(self.language, os.path.basename(os.path.dirname(mod.__file__)))
+            self.assertIs(mod, gherkin.Import(self.output))
+
+    class Registered(Scenarios):
+        """Test class scenario"""
+        def WhenAPackageAddsTheOutputType(self, output):
+            """Gherkin DSL step"""
+            directory = tempfile.TemporaryDirectory()
+            self.addCleanup(directory.cleanup)
+            self.output = output
+            info = os.path.join(directory.name, "acme_checks-1.0.dist-info")
+            os.mkdir(info)
+            with open(os.path.join(info, "METADATA"), "w") as fp:
+                fp.write("Metadata-Version: 2.1\nName: acme_checks\nVersion: 1.0\n")
+            with open(os.path.join(info, "entry_points.txt"), "w") as fp:
+                fp.write("[cornichon.outputs]\n%s = acme_checks\n" % output)
+            with open(os.path.join(directory.name, "acme_checks.py"), "w") as fp:
+                fp.write("def Settings():\n    return {}\n")
+            sys.path.insert(0, directory.name)
+            self.addCleanup(sys.path.remove, directory.name)
+            self.addCleanup(sys.modules.pop, "acme_checks", None)
+            self.addCleanup(gherkin.Plugins.pop, output, None)
+            # Saving the index beside the package would change the directory it was built from
+            index = tempfile.TemporaryDirectory()
+            self.addCleanup(index.cleanup)
+            self.index = os.path.join(index.name, "outputs.json")
+            self.addCleanup(setattr, registry, "Default", registry.Default)
+            registry.Default = registry.Index(self.index)
+
+        def ThenItIsListedAndLoadedFromTheSavedIndex(self):
+            """Gherkin DSL step"""
+            try:
+                self.assertIn(self.output, gherkin.ListModules())
+                self.assertIn("cpp/googletest", gherkin.ListModules())
+                self.assertEqual({}, cornichon.Settings(self.output))
+                self.assertTrue(os.path.isfile(self.index))
+                saved = registry.Index(self.index)
+                self.assertTrue(saved.Load())
+                self.assertEqual(registry.Default.Outputs(), saved.Outputs())
+            finally:
+                # The other scenarios list the output types
+                self.doCleanups()
+
+    class Separated(Scenarios):
+        """Test class scenario"""
+        def WhenTheIndexIsKeptInTheCacheDirectory(self, cache):
+            """Gherkin DSL step"""
+            directory = tempfile.TemporaryDirectory()
+            self.addCleanup(directory.cleanup)
+            self.cache = os.path.join(directory.name, cache)
+            for key in ["CORNICHON_INDEX", "XDG_CACHE_HOME"]:
+                if key in os.environ:
+                    self.addCleanup(os.environ.__setitem__, key, os.environ.pop(key))
+            self.addCleanup(os.environ.pop, "XDG_CACHE_HOME", None)
+            os.environ["XDG_CACHE_HOME"] = self.cache
+
+        def ThenEachSearchPathAndInterpreterHasAnIndexOfItsOwn(self):
+            """Gherkin DSL step"""
+            try:
+                index = registry.Index()
+                path = index.Path()
+                self.assertEqual(os.path.join(self.cache, "cornichon"), os.path.dirname(path))
+                self.assertEqual(path, registry.DefaultPath())
+                sys.path.insert(0, self.cache)
+                try:
+                    self.assertNotEqual(path, index.Path())
+                finally:
+                    sys.path.remove(self.cache)
+                self.assertEqual(path, index.Path())
+                executable = sys.executable
+                sys.executable = executable + "3"
+                try:
+                    self.assertNotEqual(path, index.Path())
+                finally:
+                    sys.executable = executable
+                self.assertEqual(path, index.Path())
+            finally:
+                self.doCleanups()
+
+    class Overridden(Scenarios):
+        """Test class scenario"""
+        def WhenTheTemplateOfIsOverridden(self, template, output):
+            """Gherkin DSL step"""
+            self.output = output
+            self.settings = cornichon.Settings(output)
+            override = "Overridden [[scenario]][[stepName]][[className]]\n"
+            if template == output:
+                # The test body is streamed into the template of the whole file
+                override += "[[TestBody]]"
+            self.settings["templates"][template] = override
+
+        def ThenTheGeneratedStubCodeUsesTheOverride(self):
+            """Gherkin DSL step"""
+            path = os.path.join('../Examples/tests', self.name + '.feature')
+            stubCode = cornichon.Generate(path, self.settings, self.output)
+            self.assertIn("Overridden ", stubCode)
+            self.assertNotEqual(stubCode, cornichon.Generate(path, cornichon.Settings(self.output), self.output))
+
+    class Unmarked(Scenarios):
+        """Test class scenario"""
+        def WhenTheTemplateOfIsOverriddenWithTestBodies(self, output, count):
+            """Gherkin DSL step"""
+            self.output = output
+            self.settings = cornichon.Settings(output)
+            self.settings["templates"][output] = "Overridden\n" + "[[TestBody]]\n" * int(count)
+
+        def ThenGeneratingNamesTheTemplateInTheError(self):
+            """Gherkin DSL step"""
+            path = os.path.join('../Examples/tests', self.name + '.feature')
+            with self.assertRaisesRegex(ValueError, "Template %s has" % self.output):
+                cornichon.Generate(path, self.settings, self.output)
+
+    class Frozen(Scenarios):
+        """Test class scenario"""
+        def WhenTheSettingsForAreFrozen(self, output):
+            """Gherkin DSL step"""
+            self.output = output
+            self.frozen = cornichon.FrozenSettings(output)
+
+        def ThenTheyGenerateTheSameStubCodeAndCanBeHashed(self):
+            """Gherkin DSL step"""
+            path = os.path.join('../Examples/tests', self.name + '.feature')
+            settings = cornichon.Settings(self.output)
+            self.assertEqual(cornichon.Generate(path, settings, self.output), cornichon.Generate(path, self.frozen, self.output))
+            self.assertEqual(settings["cases"]["step"], self.frozen["cases"]["step"])
+            with self.assertRaises(TypeError):
+                self.frozen["cases"]["step"] = "snake"
+            again = cornichon.FrozenSettings(self.output, settings)
+            self.assertEqual(hash(self.frozen), hash(again))
+            self.assertEqual({self.frozen: 1}[again], 1)
+            self.assertEqual(self.frozen.Fingerprint(), pickle.loads(pickle.dumps(again)).Fingerprint())
+            settings["cases"]["step"] = "snake"
+            changed = cornichon.FrozenSettings(self.output, settings)
+            self.assertNotEqual(self.frozen, changed)
+            self.assertNotEqual(self.frozen.Fingerprint(), changed.Fingerprint())
+
+    class Rejected(Scenarios):
+        """Test class scenario"""
+        def WhenTheSettingsForHaveSet(self, output, path):
+            """Gherkin DSL step"""
+            self.output = output
+            self.settings = cornichon.Settings(output)
+            level = self.settings
+            bits = path.split("/")
+            for bit in bits[:-1]:
+                # A string setting replaced by a dict is rejected too
+                if not isinstance(level.get(bit), dict):
+                    level[bit] = {}
+                level = level[bit]
+            level[bits[-1]] = "true"
+
+        def ThenFreezingThemIsRejected(self):
+            """Gherkin DSL step"""
+            with self.assertRaises((KeyError, TypeError)):
+                cornichon.FrozenSettings(self.output, self.settings)
+
+    class Built(Scenarios):
+        """Test class scenario"""
+        def WhenTheExampleFeaturesAndAMalformedOneAreBuiltForWithJobs(self, targets, jobs):
+            """Gherkin DSL step"""
+            directory = tempfile.TemporaryDirectory()
+            self.addCleanup(directory.cleanup)
+            self.targets = targets.split(",")
+            self.sources = os.path.join(directory.name, "features")
+            self.out = os.path.join(directory.name, "out")
+            shutil.copytree('../Examples/tests', os.path.join(self.sources, "examples"))
+            with open(os.path.join(self.sources, "malformed.feature"), "w") as fp:
+                fp.write('Feature: Malformed\nScenario: Examples without an outline\n  Given a "step"\n  Examples:\n')
+            command = [sys.executable, "-m", "cornichon", "build", self.sources, "--out", self.out, "-j", str(jobs)]
+            for target in self.targets:
+                command += ["--target", target]
+            self.result = subprocess.run(command, cwd="..", capture_output=True, text=True)
+
+        def ThenTheStubCodeOfEachFeatureIsWrittenAndTheMalformedOneIsReported(self):
+            """Gherkin DSL step"""
+            try:
+                self.assertEqual(1, self.result.returncode)
+                self.assertIn("malformed.feature: ValueError: Examples have no table", self.result.stderr)
+                for filename in os.listdir('../Examples/tests'):
+                    stub, ext = os.path.splitext(filename)
+                    if ext != ".feature":
+                        continue
+                    for target in self.targets:
+                        mod = gherkin.Import(target)
+                        settings = cornichon.Settings(target)
+                        if hasattr(mod, "ScenariosFile"):
+                            settings["scenarios file"] = mod.ScenariosFile(stub)
+                        expected = cornichon.Generate(os.path.join('../Examples/tests', filename), settings, target)
+                        with open(os.path.join(self.out, "examples", stub + mod.Extension()), encoding="utf-8") as fp:
+                            self.assertEqual(expected, fp.read())
+                self.assertFalse(os.path.exists(os.path.join(self.out, "malformed" + mod.Extension())))
+            finally:
+                self.doCleanups()
+
+    class Rebuilt(Scenarios):
+        """Test class scenario"""
+        def WhenTheExampleFeaturesAreBuiltForWithJobsOneChangedAndBuiltAgain(self, targets, jobs):
+            """Gherkin DSL step"""
+            directory = tempfile.TemporaryDirectory()
+            self.addCleanup(directory.cleanup)
+            sources = os.path.join(directory.name, "features")
+            out = os.path.join(directory.name, "out")
+            manifest = os.path.join(out, batch.Manifest)
+            shutil.copytree('../Examples/tests', sources)
+            features = batch.Discover([sources])
+            settings = batch.Settings(targets.split(","))
+            self.first = batch.Build(features, out, settings, jobs, manifest=manifest)
+            self.second = batch.Build(features, out, settings, jobs, manifest=manifest)
+            self.changed = os.path.join(sources, "example.feature")
+            with open(self.changed, "a") as fp:
+                fp.write("    | 3     | 4      | 5      | 12  |\n")
+            self.third = batch.Build(features, out, settings, jobs, manifest=manifest)
+            self.features = features
+
+        def ThenOnlyTheChangedFeatureIsGeneratedAgain(self):
+            """Gherkin DSL step"""
+            try:
+                paths = [feature[0] for feature in self.features]
+                self.assertEqual(2 * len(paths), len(self.first[0]))
+                self.assertEqual([], self.first[2])
+                self.assertEqual([], self.second[0])
+                self.assertEqual(paths, self.second[2])
+                # The scenarios of an added row are the same so need not be written again
+                self.assertLessEqual(1, len(self.third[0]))
+                for filename in self.third[0]:
+                    self.assertTrue(os.path.basename(filename).startswith(("example.", "example_")))
+                self.assertEqual([path for path in paths if path != self.changed], self.third[2])
+                self.assertEqual([], self.first[1] + self.second[1] + self.third[1])
+            finally:
+                self.doCleanups()
+
+    class Kept(Scenarios):
+        """Test class scenario"""
+        def WhenTheExampleFeaturesAreBuiltForTwiceAndAFileIsEdited(self, targets):
+            """Gherkin DSL step"""
+            directory = tempfile.TemporaryDirectory()
+            self.addCleanup(directory.cleanup)
+            self.out = directory.name
+            features = batch.Discover(['../Examples/tests'])
+            settings = batch.Settings(targets.split(","))
+            self.first = batch.Build(features, self.out, settings, 1)[0]
+            self.times = [os.stat(filename).st_mtime_ns for filename in self.first]
+            self.second = batch.Build(features, self.out, settings, 1)[0]
+            with open(self.first[0], "a") as fp:
+                fp.write("edited\n")
+            self.third = batch.Build(features, self.out, settings, 1)[0]
+
+        def ThenOnlyTheEditedFileIsWrittenAgain(self):
+            """Gherkin DSL step"""
+            try:
+                self.assertEqual([], self.second)
+                self.assertEqual(self.first[:1], self.third)
+                self.assertEqual(self.times[1:], [os.stat(filename).st_mtime_ns for filename in self.first[1:]])
+                self.assertEqual([], [name for name in os.listdir(self.out) if name.endswith(".tmp")])
+                with open(self.first[1], encoding="utf-8") as fp:
+                    self.assertFalse(cornichon.WriteIfChanged(self.first[1], fp.read()))
+            finally:
+                self.doCleanups()
+
+    class Depended(Scenarios):
+        """Test class scenario"""
+        def WhenTheFeatureIsBuiltForWithDepfilesAndANinjaFragment(self, target):
+            """Gherkin DSL step"""
+            directory = tempfile.TemporaryDirectory()
+            self.addCleanup(directory.cleanup)
+            self.target = target
+            self.out = os.path.join(directory.name, "out dir")
+            features = batch.Discover([os.path.join('../Examples/tests', self.name + ".feature")])
+            settings = batch.Settings([target])
+            self.written = batch.Build(features, self.out, settings, 1, depfiles=True)[0]
+            self.fragment = batch.Ninja(features, self.out, [target], ["rootnamespace=$x::"])
+            # A feature and output directory with spaces in their paths built by the command of the fragment
+            sources = os.path.join(directory.name, "features dir")
+            shutil.copytree('../Examples/tests', sources)
+            self.spaced = os.path.join(directory.name, "gen 4")
+            spaced = batch.Discover([os.path.join(sources, self.name + ".feature")])
+            fragment = batch.Ninja(spaced, self.spaced, [target])
+            rule = fragment.split("\n\n")
+            command = rule[0].split("\n  command = ")[1].split("\n")[0]
+            for line in rule[1].strip().split("\n")[1:]:
+                name, value = line.strip().split(" = ", 1)
+                command = command.replace("$" + name, value)
+            self.result = subprocess.run(command.replace("$$", "$"), shell=True, capture_output=True, text=True)
+
+        def ThenTheDepfileListsTheFeatureItsDataAndThePluginAndTheFragmentBuildsIt(self):
+            """Gherkin DSL step"""
+            try:
+                mod = gherkin.Import(self.target)
+                filename = os.path.join(self.out, self.name + mod.Extension())
+                self.assertEqual([filename, filename + ".d"], self.written)
+                with open(filename + ".d", encoding="utf-8") as fp:
+                    depfile = fp.read()
+                self.assertTrue(depfile.startswith(filename.replace(" ", "\\ ") + ": \\\n"))
+                self.assertIn(" " + os.path.join('../Examples/tests', self.name + ".feature") + " \\\n", depfile)
+                self.assertIn(" " + os.path.realpath(mod.__file__) + " \\\n", depfile)
+                self.assertEqual(self.name == "example3", os.path.join('../Examples/tests', "data", "example3.csv") in depfile)
+                self.assertIn("--set 'rootnamespace=$$x::'", self.fragment)
+                self.assertIn("build {}: cornichon ".format(filename.replace(" ", "$ ")), self.fragment)
+                self.assertIn("  target = " + self.target + "\n", self.fragment)
+                self.assertEqual(0, self.result.returncode, self.result.stderr)
+                self.assertTrue(os.path.isfile(os.path.join(self.spaced, self.name + mod.Extension())))
+                self.assertTrue(os.path.isfile(os.path.join(self.spaced, self.name + mod.Extension() + ".d")))
+            finally:
+                self.doCleanups()
+
+    class Unmapped(Scenarios):
+        """Test class scenario"""
+        def WhenFeaturesWithExamplesAreWatched(self, count):
+            """Gherkin DSL step"""
+            directory = tempfile.TemporaryDirectory()
+            self.addCleanup(directory.cleanup)
+            sources = os.path.join(directory.name, "features")
+            os.mkdir(sources)
+            with open(os.path.join('../Examples/tests', self.name + ".feature"), encoding="utf-8") as fp:
+                feature = fp.read()
+            for i in range(int(count)):
+                with open(os.path.join(sources, "feature%d.feature" % i), "w", encoding="utf-8") as fp:
+                    fp.write(feature.replace("Feature: ", "Feature: Copy %d of " % i, 1))
+            settings = batch.Settings(["py/pytests"])
+            self.watcher = watch.Watcher([sources], os.path.join(directory.name, "out"), settings, watch.Poller([sources]))
+            self.watcher.Discover()
+            self.before = len(os.listdir("/proc/self/fd")) if os.path.isdir("/proc/self/fd") else 0
+            self.written, self.errors = self.watcher.Generate(self.watcher.features)
+
+        def ThenNoneOfTheFeaturesIsHeldOpen(self):
+            """Gherkin DSL step"""
+            try:
+                self.assertEqual([], self.errors)
+                self.assertEqual(len(self.watcher.features), len(self.written))
+                after = len(os.listdir("/proc/self/fd")) if os.path.isdir("/proc/self/fd") else 0
+                self.assertLess(after - self.before, 10)
+                for scenarios in self.watcher.incremental.features.values():
+                    for scenario in scenarios.values():
+                        if isinstance(scenario.examples.text, gherkin.Span):
+                            self.assertIsInstance(scenario.examples.text.buffer.data, bytes)
+            finally:
+                self.doCleanups()
+
+    class Watched(Scenarios):
+        """Test class scenario"""
+        def WhenTheExampleFeaturesAreWatchedByAndOneIsEdited(self, monitor):
+            """Gherkin DSL step"""
+            directory = tempfile.TemporaryDirectory()
+            self.addCleanup(directory.cleanup)
+            sources = os.path.join(directory.name, "features")
+            self.out = os.path.join(directory.name, "out")
+            shutil.copytree('../Examples/tests', sources)
+            settings = batch.Settings(["cpp/googletest", "cpp/cppscenarios"])
+            watcher = watch.Watcher([sources], self.out, settings, watch.Monitor([sources], monitor == "polling"))
+            self.monitor = type(watcher.monitor).__name__
+            reports = queue.Queue()
+            stop = threading.Event()
+            thread = threading.Thread(target=watcher.Run, args=(lambda *report: reports.put(report), stop))
+            thread.start()
+            self.addCleanup(thread.join)
+            self.addCleanup(stop.set)
+            self.initial = reports.get(timeout=10)
+            self.time = os.stat(os.path.join(self.out, "example.h")).st_mtime_ns
+            self.feature = os.path.join(sources, "example.feature")
+            with open(self.feature, "a") as fp:
+                fp.write("    | 3     | 4      | 5      | 12  |\n")
+            self.changed = reports.get(timeout=10)
+
+        def ThenOnlyTheEditedFeatureIsGeneratedAgain(self):
+            """Gherkin DSL step"""
+            try:
+                self.assertIn(self.monitor, ["Inotify" if watch.Inotify.Available() else "Poller", "Poller"])
+                self.assertEqual(12, len(self.initial[0]))
+                self.assertEqual([os.path.join(self.out, "example.cpp")], self.changed[0])
+                self.assertEqual([], self.initial[1] + self.changed[1])
+                self.assertEqual(self.time, os.stat(os.path.join(self.out, "example.h")).st_mtime_ns)
+                settings = cornichon.Settings("cpp/googletest")
+                settings["scenarios file"] = "example.h"
+                with open(os.path.join(self.out, "example.cpp"), encoding="utf-8") as fp:
+                    self.assertEqual(cornichon.Generate(self.feature, settings, "cpp/googletest"), fp.read())
+            finally:
+                self.doCleanups()
+
+    class Mixed(Fanned):
+        """Test class scenario"""
+        def WhenTheGeneratorsAreFannedOutSelectingAnd(self, first, second):
+            """Gherkin DSL step"""
+            inFileName = os.path.join('../Examples/tests', self.name + '.feature')
+            with open(inFileName, "r") as f:
+                self.gherkin = f.readlines()
+            # Tag the first scenario so that the two expressions select different scenarios
+            for i in range(len(self.gherkin)):
+                if self.gherkin[i].startswith("Scenario"):
+                    self.gherkin.insert(i, "@smoke\n")
+                    break
+            self.outputs = {"cpp/cppunittest": cornichon.Settings("cpp/cppunittest"), "cpp/cppscenarios": cornichon.Settings("cpp/cppscenarios")}
+            self.outputs["cpp/cppunittest"]["tags"] = first
+            self.outputs["cpp/cppscenarios"]["tags"] = second
+            self.stubCodes = cornichon.GenerateAll(self.gherkin, self.outputs)
+
+    class Bounded(Scenarios):
+        """Test class scenario"""
+        def WhenAnOutlineWithRowsIsStreamedFor(self, rows, output):
+            """Gherkin DSL step"""
+            lines = ["Feature: Bounded\n", "Scenario Outline: Add\n", "  Given an initial <a>\n",
+                     "  Then the result is <b>\n", "  Examples:\n", "    | a | b |\n"]
+            lines += ["    | %d | x%d |\n" % (i, i) for i in range(rows)]
+            settings = cornichon.Settings(output)
+            parsed = cornichon.Parse(lines, settings)
+            written = [0, 0]
+
+            class Sink:
+                def write(self, chunk):
+                    written[0] += len(chunk)
+                    written[1] = max(written[1], len(chunk))
+
+            # Load the plugin and compile its templates before counting
+            cornichon.GenerateTo(cornichon.Parse(lines[:8], settings), settings, output, io.StringIO())
+            tracemalloc.start()
+            try:
+                cornichon.GenerateTo(parsed, settings, output, Sink())
+                self.held, self.peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            self.written, self.largest = written
+
+        def ThenTheMemoryUsedIsBoundedByAScenarioRatherThanTheRows(self):
+            """Gherkin DSL step"""
+            self.assertLess(self.largest * 100, self.written)
+            self.assertLess(self.peak * 20, self.written)
+            self.assertLess(self.held * 100, self.written)
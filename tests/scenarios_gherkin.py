@@ -1,7 +1,14 @@
+import atexit
 import unittest
 import os
 import os.path
 import sys
+import tempfile
+
+# Keep the index of output types out of the user's cache directory
+indexDir = tempfile.TemporaryDirectory()
+atexit.register(indexDir.cleanup)
+os.environ["CORNICHON_INDEX"] = os.path.join(indexDir.name, "outputs.json")
 
 curdir = os.path.dirname(os.path.realpath(__file__))
 subdir = os.path.join(curdir, '../cornichon')
@@ -23,6 +30,21 @@ class Scenarios:
             if conv != type:
                 print("\n{} isn't {}".format(self.value, type))
             self.assertEqual(conv, type)
+            self.assertEqual(gherkin.ValueType(self.value), type)
+
+    class Columns(unittest.TestCase):
+        """Test class scenario"""
+        def GivenAColumn(self, values):
+            """Gherkin DSL step"""
+            self.values = values.split(",")
+
+        def ThenItHasCorresponding(self, type):
+            """Gherkin DSL step"""
+            worst = "none"
+            for value in self.values:
+                worst = gherkin.Worst(worst, gherkin.Type(value))
+            self.assertEqual(worst, type)
+            self.assertEqual(gherkin.ColumnType(self.values), type)
 
     class Worst(unittest.TestCase):
         """Test class scenario"""
@@ -40,3 +62,154 @@ class Scenarios:
             if worst != type:
                 print("\n{} isn't {}".format(worst, type))
             self.assertEqual(worst, type)
+
+    class Lexed(unittest.TestCase):
+        """Test class scenario"""
+        def GivenAFeatureFileCalled(self, name):
+            """Gherkin DSL step"""
+            inFileName = os.path.join('../Examples/tests', name + '.feature')
+            f = open(inFileName, "r")
+            self.gherkin = f.readlines()
+            f.close()
+
+        def ThenItHasSections(self, number):
+            """Gherkin DSL step"""
+            sections = gherkin.GetSections(self.gherkin, {})
+            self.assertEqual(int(number), len(sections))
+            tokens = list(gherkin.Lex(self.gherkin))
+            self.assertEqual(len(sections), len(tokens))
+            end = 0
+            for i in range(len(tokens)):
+                self.assertEqual(sections[i][0], tokens[i][0])
+                self.assertLessEqual(end, tokens[i][2])
+                self.assertLess(tokens[i][2], tokens[i][3])
+                end = tokens[i][3]
+            self.assertEqual(len(self.gherkin), end)
+
+    class Tabulated(Lexed):
+        """Test class scenario"""
+        def ThenScenarioHasColumnsOfTypes(self, index, header, types):
+            """Gherkin DSL step"""
+            scenarios, feature = gherkin.Parse(self.gherkin, {})
+            examples = scenarios[int(index)].examples
+            self.assertEqual(header.split(","), examples.Header())
+            self.assertEqual(types.split(","), examples.types)
+            self.assertEqual(len(examples.header), len(examples.columns))
+            for row in examples.Rows():
+                self.assertEqual(len(examples.header), len(row))
+
+    class Data(Lexed):
+        """Test class scenario"""
+        def GivenAFeatureFileCalled(self, name):
+            """Gherkin DSL step"""
+            self.path = os.path.join('../Examples/tests', name + '.feature')
+
+        def ThenScenarioReadsColumnsOfTypesFromRows(self, index, header, types, rows):
+            """Gherkin DSL step"""
+            scenarios, feature = gherkin.Parse(self.path, {})
+            examples = scenarios[int(index)].examples
+            self.assertEqual(header.split(","), examples.Header())
+            self.assertEqual(types.split(","), examples.types)
+            # Only the types are kept, the rows are read again when needed
+            self.assertEqual([], examples.columns)
+            number = int(rows)
+            rows = list(examples.Rows())
+            self.assertEqual(number, len(rows))
+            for row in rows:
+                self.assertEqual(len(examples.header), len(row))
+
+    class Tagged(Lexed):
+        """Test class scenario"""
+        def ThenTheTagsSelectScenarios(self, expression, selected):
+            """Gherkin DSL step"""
+            every, feature = gherkin.Parse(self.gherkin, {})
+            self.assertEqual(["@calculator"], feature.tags)
+            self.assertEqual(["@smoke", "@slow", "@large"], every[2].tags)
+            scenarios, feature = gherkin.Parse(self.gherkin, {"tags": expression})
+            expected = [every[int(i)].lines for i in selected.split(",")]
+            self.assertEqual(expected, [scenario.lines for scenario in scenarios])
+            for scenario in scenarios:
+                self.assertEqual(1, len(list(scenario.examples.Rows())))
+
+    class Described(unittest.TestCase):
+        """Test class scenario"""
+        def GivenADescriptionLine(self, line):
+            """Gherkin DSL step"""
+            self.line = line
+            # Lines of tags are only those just before a feature, scenario or Examples
+            self.gherkin = ["Feature: Described\n", "  " + line + "\n", "  of the feature\n", "\n",
+                            "@smoke\n", "Scenario: First\n", "  " + line + "\n", "  Given a step\n", "\n",
+                            "Scenario: Second\n", "  " + line + "\n", "  of the scenario\n", "  Given a step\n"]
+
+        def ThenItIsKeptAsADescriptionSelectedByRatherThanReadAsTags(self, expression):
+            """Gherkin DSL step"""
+            scenarios, feature = gherkin.Parse(self.gherkin, {})
+            self.assertEqual([], feature.tags)
+            self.assertIn(self.line, feature)
+            self.assertEqual(["@smoke"], scenarios[0].tags)
+            self.assertIn(self.line, scenarios[0].lines)
+            self.assertEqual([], scenarios[1].tags)
+            self.assertIn(self.line, scenarios[1].lines)
+            scenarios, feature = gherkin.Parse(self.gherkin, {"tags": expression})
+            self.assertEqual(["First\n"], [scenario.lines.partition("\n")[0] + "\n" for scenario in scenarios])
+
+    class Untagged(unittest.TestCase):
+        """Test class scenario"""
+        def ThenTheTagExpressionIsRejected(self, expression):
+            """Gherkin DSL step"""
+            self.assertRaises(ValueError, gherkin.TagExpression, expression)
+
+    class Dialects(Lexed):
+        """Test class scenario"""
+        def ThenScenarioIsWithSteps(self, index, title, steps):
+            """Gherkin DSL step"""
+            scenarios, feature = gherkin.Parse(self.gherkin, {})
+            self.assertEqual(title + "\n", scenarios[int(index)].lines)
+            self.assertEqual(steps.split(","), [step[0] for step in scenarios[int(index)].Steps()])
+            # Read as English there is no feature
+            with self.assertRaisesRegex(ValueError, "no feature section"):
+                gherkin.Parse([line for line in self.gherkin if "language" not in line], {})
+
+    class Synonyms(unittest.TestCase):
+        """Test class scenario"""
+        def WhenTheKeywordIsWrittenAs(self, keyword, synonym):
+            """Gherkin DSL step"""
+            self.gherkin = ["Feature: Synonyms\n", "Scenario: Plain\n", "  Given a step\n",
+                            "Scenario Outline: Outlined\n", "  Given a <value>\n",
+                            "  Examples:\n", "    | value |\n", "    | 1     |\n"]
+            self.synonym = [line.replace(keyword + ":", synonym + ":", 1) if line.lstrip().startswith(keyword + ":") else line
+                            for line in self.gherkin]
+
+        def ThenTheFeatureIsParsedTheSame(self):
+            """Gherkin DSL step"""
+            self.assertNotEqual(self.gherkin, self.synonym)
+            self.assertEqual(gherkin.GetSections(self.gherkin, {}), gherkin.GetSections(self.synonym, {}))
+
+    class Stepped(unittest.TestCase):
+        """Test class scenario"""
+        def GivenAStepWithText(self, keyword, text):
+            """Gherkin DSL step"""
+            self.keyword = keyword
+            self.text = text
+
+        def ThenItIsParsedOnceIntoMethodWithParameters(self, method, number):
+            """Gherkin DSL step"""
+            step = gherkin.GetStep(self.keyword, self.text + "\n")
+            self.assertIs(step, gherkin.GetStep(self.keyword, self.text + "\n  | docstring |\n"))
+            self.assertEqual(method, step.Tokenise("Camel"))
+            self.assertEqual(int(number), len(step.params))
+
+    class Malformed(unittest.TestCase):
+        """Test class scenario"""
+        def GivenAFeatureWith(self, flaw):
+            """Gherkin DSL step"""
+            features = {}
+            features["no feature"] = ["Scenario: Orphan\n", "  Given a step\n"]
+            features["examples first"] = ["Feature: Early\n", "Examples:\n", "  | a |\n", "  | 1 |\n"]
+            features["no table"] = ["Feature: Bare\n", "Scenario: Outline\n", "  Given a <a>\n", "  Examples:\n"]
+            self.gherkin = features[flaw]
+
+        def ThenParsingItIsRejectedWith(self, error):
+            """Gherkin DSL step"""
+            with self.assertRaisesRegex(ValueError, error):
+                gherkin.Parse(self.gherkin, {})
@@ -1,7 +1,14 @@
+import atexit
 import unittest
 import os
 import os.path
 import sys
+import tempfile
+
+# Keep the index of output types out of the user's cache directory
+indexDir = tempfile.TemporaryDirectory()
+atexit.register(indexDir.cleanup)
+os.environ["CORNICHON_INDEX"] = os.path.join(indexDir.name, "outputs.json")
 
 curdir = os.path.dirname(os.path.realpath(__file__))
 subdir = os.path.join(curdir, '../cornichon')
@@ -67,6 +74,24 @@ class Scenarios:
                 print("\n{} isn't {}".format(out, output))
             self.assertEqual(out, output)
 
+    class Cased(unittest.TestCase):
+        """Test class scenario"""
+        def GivenAnArgument(self, arg):
+            """Gherkin DSL step"""
+            self.arg = arg
+
+        def GivenACase(self, case):
+            """Gherkin DSL step"""
+            self.case = case
+
+        def ThenItHasCorresponding(self, output):
+            """Gherkin DSL step"""
+            out = common.Tokenise(self.arg, self.case)
+            self.assertEqual(out, output)
+            hits = common.Tokenise.cache_info().hits
+            self.assertEqual(common.Tokenise(self.arg, self.case), output)
+            self.assertEqual(hits + 1, common.Tokenise.cache_info().hits)
+
     class Argumental(unittest.TestCase):
         """Test class scenario"""
         def GivenArguments(self, args):
@@ -108,3 +133,51 @@ class Scenarios:
             if out != output:
                 print("\n{} isn't {}".format(out, output))
             self.assertEqual(out, output)
+
+    class Rendered(unittest.TestCase):
+        """Test class scenario"""
+        def GivenATemplate(self, template):
+            """Gherkin DSL step"""
+            self.template = template
+
+        def GivenValues(self, values):
+            """Gherkin DSL step"""
+            self.values = dict([value.split("=") for value in values.split(",")])
+
+        def ThenItHasCorresponding(self, output):
+            """Gherkin DSL step"""
+            self.assertEqual(output, common.Render("unit", self.template, self.values))
+            overridden = common.Render("unit", self.template, self.values, {"unit": "overridden [[a]]"})
+            self.assertEqual("overridden " + self.values["a"], overridden)
+            self.assertIs(common.Compile(self.template), common.Compile(self.template))
+
+    class Surrounded(Rendered):
+        """Test class scenario"""
+        def ThenItSurroundsTheTestBodyWithAnd(self, head, tail):
+            """Gherkin DSL step"""
+            self.assertEqual((head, tail), common.Surround("unit", self.template, self.values))
+            for override in ["no test body", "[[TestBody]] twice [[TestBody]]"]:
+                with self.assertRaisesRegex(ValueError, "Template unit has"):
+                    common.Surround("unit", self.template, self.values, {"unit": override})
+
+    class Distinguished(unittest.TestCase):
+        """Test class scenario"""
+        def GivenTwoFunctionsWithTheSameName(self, kind):
+            """Gherkin DSL step"""
+            def Make(value):
+                if kind == "lambda":
+                    return lambda: value
+
+                def Local():
+                    return value
+                return Local
+            self.functions = [Make(1), Make(2)]
+
+        def ThenFreezingThemKeepsThemApart(self):
+            """Gherkin DSL step"""
+            first, second = self.functions
+            self.assertEqual(first.__qualname__, second.__qualname__)
+            self.assertNotEqual(common.Frozen(first), common.Frozen(second))
+            self.assertEqual(common.Frozen({"argModifier": first}), common.Frozen({"argModifier": first}))
+            self.assertNotEqual(common.Frozen({"argModifier": first}), common.Frozen({"argModifier": second}))
+            hash(common.Frozen([first, second]))
@@ -103,6 +103,182 @@ class Cornichon(unittest.TestCase):
         scenario.WhenTheGeneratorIsVbscenarios()
         scenario.ThenTheGeneratedTestIsTheSameAsTheSaved()
 
+    def Parsed(self, name):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Parsed()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheFeatureIsParsedOnce()
+        scenario.ThenEveryGeneratorGivesTheSameAsTheSaved()
+
+    def Fanned(self, name):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Fanned()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenEveryGeneratorIsFannedOut()
+        scenario.ThenEachOutputIsTheSameAsGeneratedAloneFromTheLines()
+
+    def Buffered(self, name, source):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Buffered()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheFeatureIsParsedFromA(source)
+        scenario.ThenEveryGeneratorGivesTheSameAsTheSaved()
+
+    def Pickled(self, name, source):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Pickled()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheFeatureIsParsedFromAAndPickled(source)
+        scenario.ThenEveryGeneratorGivesTheSameAsTheSaved()
+
+    def Lowered(self, name):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Lowered()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheFeatureIsParsedOnce()
+        scenario.ThenItIsLoweredOnceForEachSettings()
+
+    def Streamed(self, name):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Streamed()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheFeatureIsParsedOnce()
+        scenario.ThenEveryGeneratorStreamsTheSameAsItGenerates()
+
+    def Incremental(self, name, index):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Incremental()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheFeatureIsParsedOnce()
+        scenario.WhenScenarioIsEdited(index)
+        scenario.ThenRegeneratingIncrementallyIsTheSameAsInFull()
+
+    def Cached(self, name):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Cached()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheFeatureIsParsedThroughACache()
+        scenario.ThenItIsLoadedFromTheCacheTheSecondTime()
+
+    def Evicted(self, name, size, entries):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Evicted()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheFeatureIsParsedThroughACacheOfBytes(size)
+        scenario.ThenTheCacheCommandGivesEntries(entries)
+
+    def Scanned(self, name, count, size, scans):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Scanned()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenFeaturesAreParsedThroughACacheOfBytes(count, size)
+        scenario.ThenTheCacheDirectoryIsScannedTimes(scans)
+
+    def Loaded(self, name, language, output):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Loaded()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenThePluginIsLoadedFromSeveralThreads(language, output)
+        scenario.ThenEveryThreadGetsTheSamePlugin()
+
+    def Registered(self, name, output):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Registered()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenAPackageAddsTheOutputType(output)
+        scenario.ThenItIsListedAndLoadedFromTheSavedIndex()
+
+    def Separated(self, name, cache):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Separated()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheIndexIsKeptInTheCacheDirectory(cache)
+        scenario.ThenEachSearchPathAndInterpreterHasAnIndexOfItsOwn()
+
+    def Overridden(self, name, output, template):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Overridden()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheTemplateOfIsOverridden(template, output)
+        scenario.ThenTheGeneratedStubCodeUsesTheOverride()
+
+    def Unmarked(self, name, output, count):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Unmarked()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheTemplateOfIsOverriddenWithTestBodies(output, count)
+        scenario.ThenGeneratingNamesTheTemplateInTheError()
+
+    def Frozen(self, name, output):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Frozen()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheSettingsForAreFrozen(output)
+        scenario.ThenTheyGenerateTheSameStubCodeAndCanBeHashed()
+
+    def Rejected(self, name, output, path):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Rejected()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheSettingsForHaveSet(output, path)
+        scenario.ThenFreezingThemIsRejected()
+
+    def Built(self, name, targets, jobs):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Built()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheExampleFeaturesAndAMalformedOneAreBuiltForWithJobs(targets, jobs)
+        scenario.ThenTheStubCodeOfEachFeatureIsWrittenAndTheMalformedOneIsReported()
+
+    def Rebuilt(self, name, targets, jobs):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Rebuilt()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheExampleFeaturesAreBuiltForWithJobsOneChangedAndBuiltAgain(targets, jobs)
+        scenario.ThenOnlyTheChangedFeatureIsGeneratedAgain()
+
+    def Kept(self, name, targets):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Kept()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheExampleFeaturesAreBuiltForTwiceAndAFileIsEdited(targets)
+        scenario.ThenOnlyTheEditedFileIsWrittenAgain()
+
+    def Depended(self, name, target):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Depended()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheFeatureIsBuiltForWithDepfilesAndANinjaFragment(target)
+        scenario.ThenTheDepfileListsTheFeatureItsDataAndThePluginAndTheFragmentBuildsIt()
+
+    def Unmapped(self, name, count):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Unmapped()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenFeaturesWithExamplesAreWatched(count)
+        scenario.ThenNoneOfTheFeaturesIsHeldOpen()
+
+    def Watched(self, name, monitor):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Watched()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheExampleFeaturesAreWatchedByAndOneIsEdited(monitor)
+        scenario.ThenOnlyTheEditedFeatureIsGeneratedAgain()
+
+    def Mixed(self, name, first, second):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Mixed()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenTheGeneratorsAreFannedOutSelectingAnd(first, second)
+        scenario.ThenEachOutputIsTheSameAsGeneratedAloneFromTheLines()
+
+    def Bounded(self, name, rows, output):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Bounded()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.WhenAnOutlineWithRowsIsStreamedFor(rows, output)
+        scenario.ThenTheMemoryUsedIsBoundedByAScenarioRatherThanTheRows()
+
     def test_cppunittest_example(self):
         """Gherkin DSL test"""
         self.Cppunittest("example")
@@ -111,6 +287,10 @@ class Cornichon(unittest.TestCase):
         """Gherkin DSL test"""
         self.Cppunittest("example2")
 
+    def test_cppunittest_example3(self):
+        """Gherkin DSL test"""
+        self.Cppunittest("example3")
+
     def test_cppscenarios_example(self):
         """Gherkin DSL test"""
         self.Cppscenarios("example")
@@ -119,6 +299,10 @@ class Cornichon(unittest.TestCase):
         """Gherkin DSL test"""
         self.Cppscenarios("example2")
 
+    def test_cppscenarios_example3(self):
+        """Gherkin DSL test"""
+        self.Cppscenarios("example3")
+
     def test_unnested_example2_namespace2(self):
         """Gherkin DSL test"""
         self.Unnested("example2", "namespace2")
@@ -131,6 +315,10 @@ class Cornichon(unittest.TestCase):
         """Gherkin DSL test"""
         self.Googletest("example2")
 
+    def test_googletest_example3(self):
+        """Gherkin DSL test"""
+        self.Googletest("example3")
+
     def test_pyunit_tests_example(self):
         """Gherkin DSL test"""
         self.Pyunit_tests("example")
@@ -139,6 +327,10 @@ class Cornichon(unittest.TestCase):
         """Gherkin DSL test"""
         self.Pyunit_tests("example2")
 
+    def test_pyunit_tests_example3(self):
+        """Gherkin DSL test"""
+        self.Pyunit_tests("example3")
+
     def test_pyscenarios_example(self):
         """Gherkin DSL test"""
         self.Pyscenarios("example")
@@ -147,6 +339,10 @@ class Cornichon(unittest.TestCase):
         """Gherkin DSL test"""
         self.Pyscenarios("example2")
 
+    def test_pyscenarios_example3(self):
+        """Gherkin DSL test"""
+        self.Pyscenarios("example3")
+
     def test_pytests_example(self):
         """Gherkin DSL test"""
         self.Pytests("example")
@@ -155,6 +351,10 @@ class Cornichon(unittest.TestCase):
         """Gherkin DSL test"""
         self.Pytests("example2")
 
+    def test_pytests_example3(self):
+        """Gherkin DSL test"""
+        self.Pytests("example3")
+
     def test_pytestscenarios_example(self):
         """Gherkin DSL test"""
         self.Pytestscenarios("example")
@@ -163,6 +363,10 @@ class Cornichon(unittest.TestCase):
         """Gherkin DSL test"""
         self.Pytestscenarios("example2")
 
+    def test_pytestscenarios_example3(self):
+        """Gherkin DSL test"""
+        self.Pytestscenarios("example3")
+
     def test_unittesting_example(self):
         """Gherkin DSL test"""
         self.Unittesting("example")
@@ -171,6 +375,10 @@ class Cornichon(unittest.TestCase):
         """Gherkin DSL test"""
         self.Unittesting("example2")
 
+    def test_unittesting_example3(self):
+        """Gherkin DSL test"""
+        self.Unittesting("example3")
+
     def test_nunit_example(self):
         """Gherkin DSL test"""
         self.Nunit("example")
@@ -179,6 +387,10 @@ class Cornichon(unittest.TestCase):
         """Gherkin DSL test"""
         self.Nunit("example2")
 
+    def test_nunit_example3(self):
+        """Gherkin DSL test"""
+        self.Nunit("example3")
+
     def test_csscenarios_example(self):
         """Gherkin DSL test"""
         self.Csscenarios("example")
@@ -187,6 +399,10 @@ class Cornichon(unittest.TestCase):
         """Gherkin DSL test"""
         self.Csscenarios("example2")
 
+    def test_csscenarios_example3(self):
+        """Gherkin DSL test"""
+        self.Csscenarios("example3")
+
     def test_vbunittesting_example(self):
         """Gherkin DSL test"""
         self.Vbunittesting("example")
@@ -195,6 +411,10 @@ class Cornichon(unittest.TestCase):
         """Gherkin DSL test"""
         self.Vbunittesting("example2")
 
+    def test_vbunittesting_example3(self):
+        """Gherkin DSL test"""
+        self.Vbunittesting("example3")
+
     def test_vbnunit_example(self):
         """Gherkin DSL test"""
         self.Vbnunit("example")
@@ -203,6 +423,10 @@ class Cornichon(unittest.TestCase):
         """Gherkin DSL test"""
         self.Vbnunit("example2")
 
+    def test_vbnunit_example3(self):
+        """Gherkin DSL test"""
+        self.Vbnunit("example3")
+
     def test_vbscenarios_example(self):
         """Gherkin DSL test"""
         self.Vbscenarios("example")
@@ -211,6 +435,250 @@ class Cornichon(unittest.TestCase):
         """Gherkin DSL test"""
         self.Vbscenarios("example2")
 
+    def test_vbscenarios_example3(self):
+        """Gherkin DSL test"""
+        self.Vbscenarios("example3")
+
+    def test_parsed_example(self):
+        """Gherkin DSL test"""
+        self.Parsed("example")
+
+    def test_parsed_example2(self):
+        """Gherkin DSL test"""
+        self.Parsed("example2")
+
+    def test_fanned_example(self):
+        """Gherkin DSL test"""
+        self.Fanned("example")
+
+    def test_fanned_example2(self):
+        """Gherkin DSL test"""
+        self.Fanned("example2")
+
+    def test_buffered_example_path(self):
+        """Gherkin DSL test"""
+        self.Buffered("example", "path")
+
+    def test_buffered_example_bytes(self):
+        """Gherkin DSL test"""
+        self.Buffered("example", "bytes")
+
+    def test_buffered_example_mmap(self):
+        """Gherkin DSL test"""
+        self.Buffered("example", "mmap")
+
+    def test_buffered_example2_path(self):
+        """Gherkin DSL test"""
+        self.Buffered("example2", "path")
+
+    def test_buffered_example2_bytes(self):
+        """Gherkin DSL test"""
+        self.Buffered("example2", "bytes")
+
+    def test_buffered_example2_mmap(self):
+        """Gherkin DSL test"""
+        self.Buffered("example2", "mmap")
+
+    def test_pickled_example_lines(self):
+        """Gherkin DSL test"""
+        self.Pickled("example", "lines")
+
+    def test_pickled_example_mmap(self):
+        """Gherkin DSL test"""
+        self.Pickled("example", "mmap")
+
+    def test_pickled_example2_lines(self):
+        """Gherkin DSL test"""
+        self.Pickled("example2", "lines")
+
+    def test_pickled_example2_mmap(self):
+        """Gherkin DSL test"""
+        self.Pickled("example2", "mmap")
+
+    def test_lowered_example(self):
+        """Gherkin DSL test"""
+        self.Lowered("example")
+
+    def test_lowered_example2(self):
+        """Gherkin DSL test"""
+        self.Lowered("example2")
+
+    def test_streamed_example(self):
+        """Gherkin DSL test"""
+        self.Streamed("example")
+
+    def test_streamed_example2(self):
+        """Gherkin DSL test"""
+        self.Streamed("example2")
+
+    def test_incremental_example_0(self):
+        """Gherkin DSL test"""
+        self.Incremental("example", 0)
+
+    def test_incremental_example_1(self):
+        """Gherkin DSL test"""
+        self.Incremental("example", 1)
+
+    def test_incremental_example2_1(self):
+        """Gherkin DSL test"""
+        self.Incremental("example2", 1)
+
+    def test_cached_example(self):
+        """Gherkin DSL test"""
+        self.Cached("example")
+
+    def test_cached_example2(self):
+        """Gherkin DSL test"""
+        self.Cached("example2")
+
+    def test_evicted_example_10_0(self):
+        """Gherkin DSL test"""
+        self.Evicted("example", 10, 0)
+
+    def test_evicted_example_1000000_1(self):
+        """Gherkin DSL test"""
+        self.Evicted("example", 1000000, 1)
+
+    def test_scanned_example_50_1000000_1(self):
+        """Gherkin DSL test"""
+        self.Scanned("example", 50, 1000000, 1)
+
+    def test_scanned_example_50_10_51(self):
+        """Gherkin DSL test"""
+        self.Scanned("example", 50, 10, 51)
+
+    def test_loaded_example_cs_nunit(self):
+        """Gherkin DSL test"""
+        self.Loaded("example", "cs", "nunit")
+
+    def test_loaded_example_vb_nunit(self):
+        """Gherkin DSL test"""
+        self.Loaded("example", "vb", "nunit")
+
+    def test_registered_example_acmechecks(self):
+        """Gherkin DSL test"""
+        self.Registered("example", "acme/checks")
+
+    def test_separated_example_xdg(self):
+        """Gherkin DSL test"""
+        self.Separated("example", "xdg")
+
+    def test_overridden_example_cppcppunittest_cppexample(self):
+        """Gherkin DSL test"""
+        self.Overridden("example", "cpp/cppunittest", "cpp/example")
+
+    def test_overridden_example_csnunit_csnunit(self):
+        """Gherkin DSL test"""
+        self.Overridden("example", "cs/nunit", "cs/nunit")
+
+    def test_overridden_example_pypyscenarios_pypyscenariosstep(self):
+        """Gherkin DSL test"""
+        self.Overridden("example", "py/pyscenarios", "py/pyscenarios/step")
+
+    def test_unmarked_example_cppgoogletest_0(self):
+        """Gherkin DSL test"""
+        self.Unmarked("example", "cpp/googletest", 0)
+
+    def test_unmarked_example_pypytests_2(self):
+        """Gherkin DSL test"""
+        self.Unmarked("example", "py/pytests", 2)
+
+    def test_unmarked_example_vbunittesting_0(self):
+        """Gherkin DSL test"""
+        self.Unmarked("example", "vb/unittesting", 0)
+
+    def test_frozen_example_cppcppunittest(self):
+        """Gherkin DSL test"""
+        self.Frozen("example", "cpp/cppunittest")
+
+    def test_frozen_example2_csnunit(self):
+        """Gherkin DSL test"""
+        self.Frozen("example2", "cs/nunit")
+
+    def test_frozen_example3_pypytests(self):
+        """Gherkin DSL test"""
+        self.Frozen("example3", "py/pytests")
+
+    def test_rejected_example_cppcppunittest_nested_namespace(self):
+        """Gherkin DSL test"""
+        self.Rejected("example", "cpp/cppunittest", "nested namespace")
+
+    def test_rejected_example_vbnunit_casesstepname(self):
+        """Gherkin DSL test"""
+        self.Rejected("example", "vb/nunit", "cases/stepname")
+
+    def test_rejected_example_pypyscenarios_typesintdefault(self):
+        """Gherkin DSL test"""
+        self.Rejected("example", "py/pyscenarios", "types/int/default")
+
+    def test_built_example_cppgoogletestcppcppscenarios_2(self):
+        """Gherkin DSL test"""
+        self.Built("example", "cpp/googletest,cpp/cppscenarios", 2)
+
+    def test_built_example_pypytestspypyscenarios_1(self):
+        """Gherkin DSL test"""
+        self.Built("example", "py/pytests,py/pyscenarios", 1)
+
+    def test_rebuilt_example_cppgoogletestcppcppscenarios_2(self):
+        """Gherkin DSL test"""
+        self.Rebuilt("example", "cpp/googletest,cpp/cppscenarios", 2)
+
+    def test_rebuilt_example_pypytestspypyscenarios_1(self):
+        """Gherkin DSL test"""
+        self.Rebuilt("example", "py/pytests,py/pyscenarios", 1)
+
+    def test_kept_example_cppgoogletestcppcppscenarios(self):
+        """Gherkin DSL test"""
+        self.Kept("example", "cpp/googletest,cpp/cppscenarios")
+
+    def test_kept_example_csnunitcscsscenarios(self):
+        """Gherkin DSL test"""
+        self.Kept("example", "cs/nunit,cs/csscenarios")
+
+    def test_depended_example_cppgoogletest(self):
+        """Gherkin DSL test"""
+        self.Depended("example", "cpp/googletest")
+
+    def test_depended_example3_cppgoogletest(self):
+        """Gherkin DSL test"""
+        self.Depended("example3", "cpp/googletest")
+
+    def test_depended_example3_pypytests(self):
+        """Gherkin DSL test"""
+        self.Depended("example3", "py/pytests")
+
+    def test_unmapped_example_300(self):
+        """Gherkin DSL test"""
+        self.Unmapped("example", 300)
+
+    def test_watched_example_polling(self):
+        """Gherkin DSL test"""
+        self.Watched("example", "polling")
+
+    def test_watched_example_inotify(self):
+        """Gherkin DSL test"""
+        self.Watched("example", "inotify")
+
+    def test_mixed_example_smoke_not_smoke(self):
+        """Gherkin DSL test"""
+        self.Mixed("example", "@smoke", "not @smoke")
+
+    def test_mixed_example_smoke(self):
+        """Gherkin DSL test"""
+        self.Mixed("example", "", "@smoke")
+
+    def test_bounded_example_20000_cppgoogletest(self):
+        """Gherkin DSL test"""
+        self.Bounded("example", 20000, "cpp/googletest")
+
+    def test_bounded_example_20000_pypytests(self):
+        """Gherkin DSL test"""
+        self.Bounded("example", 20000, "py/pytests")
+
+    def test_bounded_example_20000_csnunit(self):
+        """Gherkin DSL test"""
+        self.Bounded("example", 20000, "cs/nunit")
+
 
 if __name__ == '__main__':
     unittest.main()
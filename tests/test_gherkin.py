@@ -11,6 +11,12 @@ class Gherkin(unittest.TestCase):
         scenario.GivenAnInput(value)
         scenario.ThenItHasCorresponding(type)
 
+    def Columns(self, type, values):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Columns()
+        scenario.GivenAColumn(values)
+        scenario.ThenItHasCorresponding(type)
+
     def Worst(self, type, first, second):
         """Gherkin DSL scenario"""
         scenario = Scenarios.Worst()
@@ -18,6 +24,65 @@ class Gherkin(unittest.TestCase):
         scenario.GivenASecondType(second)
         scenario.ThenItHasCorresponding(type)
 
+    def Lexed(self, name, number):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Lexed()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.ThenItHasSections(number)
+
+    def Tabulated(self, name, index, header, types):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Tabulated()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.ThenScenarioHasColumnsOfTypes(index, header, types)
+
+    def Data(self, name, index, header, types, rows):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Data()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.ThenScenarioReadsColumnsOfTypesFromRows(index, header, types, rows)
+
+    def Stepped(self, keyword, text, method, number):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Stepped()
+        scenario.GivenAStepWithText(keyword, text)
+        scenario.ThenItIsParsedOnceIntoMethodWithParameters(method, number)
+
+    def Tagged(self, name, expression, selected):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Tagged()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.ThenTheTagsSelectScenarios(expression, selected)
+
+    def Described(self, line, expression):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Described()
+        scenario.GivenADescriptionLine(line)
+        scenario.ThenItIsKeptAsADescriptionSelectedByRatherThanReadAsTags(expression)
+
+    def Untagged(self, expression):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Untagged()
+        scenario.ThenTheTagExpressionIsRejected(expression)
+
+    def Dialects(self, name, index, title, steps):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Dialects()
+        scenario.GivenAFeatureFileCalled(name)
+        scenario.ThenScenarioIsWithSteps(index, title, steps)
+
+    def Synonyms(self, keyword, synonym):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Synonyms()
+        scenario.WhenTheKeywordIsWrittenAs(keyword, synonym)
+        scenario.ThenTheFeatureIsParsedTheSame()
+
+    def Malformed(self, flaw, error):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Malformed()
+        scenario.GivenAFeatureWith(flaw)
+        scenario.ThenParsingItIsRejectedWith(error)
+
     def test_types_uint_78(self):
         """Gherkin DSL test"""
         self.Types("uint", "78")
@@ -38,6 +103,50 @@ class Gherkin(unittest.TestCase):
         """Gherkin DSL test"""
         self.Types("string", "is so")
 
+    def test_types_float_00(self):
+        """Gherkin DSL test"""
+        self.Types("float", "00")
+
+    def test_types_float_0(self):
+        """Gherkin DSL test"""
+        self.Types("float", "-0")
+
+    def test_types_float_1e5(self):
+        """Gherkin DSL test"""
+        self.Types("float", "1e5")
+
+    def test_types_float_inf(self):
+        """Gherkin DSL test"""
+        self.Types("float", "-inf")
+
+    def test_types_string_1__0(self):
+        """Gherkin DSL test"""
+        self.Types("string", "1__0")
+
+    def test_columns_uint_1200(self):
+        """Gherkin DSL test"""
+        self.Columns("uint", "1,20,0")
+
+    def test_columns_int_1200(self):
+        """Gherkin DSL test"""
+        self.Columns("int", "1,-20,0")
+
+    def test_columns_float_1250(self):
+        """Gherkin DSL test"""
+        self.Columns("float", "1,-2.5,0")
+
+    def test_columns_string_true1(self):
+        """Gherkin DSL test"""
+        self.Columns("string", "true,1")
+
+    def test_columns_string_1a251(self):
+        """Gherkin DSL test"""
+        self.Columns("string", "1,a,2.5,-1")
+
+    def test_columns_bool_trueFalse(self):
+        """Gherkin DSL test"""
+        self.Columns("bool", "true,False")
+
     def test_worst_int_int_uint(self):
         """Gherkin DSL test"""
         self.Worst("int", "int", "uint")
@@ -62,6 +171,126 @@ class Gherkin(unittest.TestCase):
         """Gherkin DSL test"""
         self.Worst("string", "string", "float")
 
+    def test_lexed_example_11(self):
+        """Gherkin DSL test"""
+        self.Lexed("example", 11)
+
+    def test_lexed_example2_9(self):
+        """Gherkin DSL test"""
+        self.Lexed("example2", 9)
+
+    def test_tabulated_example_0_valuesecondsum_uintuintuint(self):
+        """Gherkin DSL test"""
+        self.Tabulated("example", 0, "value,second,sum", "uint,uint,uint")
+
+    def test_tabulated_example_1_valuesecondthirdsum_uintuintuintuint(self):
+        """Gherkin DSL test"""
+        self.Tabulated("example", 1, "value,second,third,sum", "uint,uint,uint,uint")
+
+    def test_data_example3_0_valuesecondsum_uintuintuint_3(self):
+        """Gherkin DSL test"""
+        self.Data("example3", 0, "value,second,sum", "uint,uint,uint", 3)
+
+    def test_data_example3_1_namepriceavailablestock_stringfloatboolint_2(self):
+        """Gherkin DSL test"""
+        self.Data("example3", 1, "name,price,available,stock", "string,float,bool,int", 2)
+
+    def test_stepped_given_an_initial_value_givenAnInitial_1(self):
+        """Gherkin DSL test"""
+        self.Stepped("Given", "an initial <value>", "GivenAnInitial", 1)
+
+    def test_stepped_when_you_add_5_and_6_whenYouAddAnd_2(self):
+        """Gherkin DSL test"""
+        self.Stepped("When", "you add \"5\" and \"6\"", "WhenYouAddAnd", 2)
+
+    def test_tagged_example4_012(self):
+        """Gherkin DSL test"""
+        self.Tagged("example4", "", "0,1,2")
+
+    def test_tagged_example4_smoke_02(self):
+        """Gherkin DSL test"""
+        self.Tagged("example4", "@smoke", "0,2")
+
+    def test_tagged_example4_smoke_and_not_slow_0(self):
+        """Gherkin DSL test"""
+        self.Tagged("example4", "@smoke and not @slow", "0")
+
+    def test_tagged_example4_calculator_and_wip_or_large_12(self):
+        """Gherkin DSL test"""
+        self.Tagged("example4", "@calculator and (@wip or @large)", "1,2")
+
+    def test_tagged_example4_not_smoke_or_wip_and_slow_1(self):
+        """Gherkin DSL test"""
+        self.Tagged("example4", "not @smoke or @wip and @slow", "1")
+
+    def test_described_everyone_smoke(self):
+        """Gherkin DSL test"""
+        self.Described("@everyone", "@smoke")
+
+    def test_described_home_and_office_smoke_and_not_home(self):
+        """Gherkin DSL test"""
+        self.Described("@home and @office", "@smoke and not @home")
+
+    def test_described_a_b_smoke_and_not_a(self):
+        """Gherkin DSL test"""
+        self.Described("@a @b", "@smoke and not @a")
+
+    def test_untagged_a_and(self):
+        """Gherkin DSL test"""
+        self.Untagged("@a and")
+
+    def test_untagged_a(self):
+        """Gherkin DSL test"""
+        self.Untagged("(@a")
+
+    def test_untagged_a_b(self):
+        """Gherkin DSL test"""
+        self.Untagged("@a @b")
+
+    def test_untagged_or(self):
+        """Gherkin DSL test"""
+        self.Untagged("or")
+
+    def test_dialects_example5_0_ajouter_deux_autres_soitQuandQuandAlors(self):
+        """Gherkin DSL test"""
+        self.Dialects("example5", 0, "Ajouter deux autres", "Soit,Quand,Quand,Alors")
+
+    def test_dialects_example6_0_足し算_前提もしもしならば(self):
+        """Gherkin DSL test"""
+        self.Dialects("example6", 0, "足し算", "前提,もし,もし,ならば")
+
+    def test_synonyms_feature_business_need(self):
+        """Gherkin DSL test"""
+        self.Synonyms("Feature", "Business Need")
+
+    def test_synonyms_feature_ability(self):
+        """Gherkin DSL test"""
+        self.Synonyms("Feature", "Ability")
+
+    def test_synonyms_scenario_example(self):
+        """Gherkin DSL test"""
+        self.Synonyms("Scenario", "Example")
+
+    def test_synonyms_scenario_outline_scenario_template(self):
+        """Gherkin DSL test"""
+        self.Synonyms("Scenario Outline", "Scenario Template")
+
+    def test_synonyms_examples_scenarios(self):
+        """Gherkin DSL test"""
+        self.Synonyms("Examples", "Scenarios")
+
+    def test_malformed_no_feature_there_is_no_feature_section(self):
+        """Gherkin DSL test"""
+        self.Malformed("no feature", "There is no feature section")
+
+    def test_malformed_examples_first_examples_come_before_any_scenario(self):
+        """Gherkin DSL test"""
+        self.Malformed("examples first", "Examples come before any scenario")
+
+    def test_malformed_no_table_examples_have_no_table(self):
+        """Gherkin DSL test"""
+        self.Malformed("no table", "Examples have no table")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,14 @@
+import atexit
 import unittest
 import os
 import os.path
 import sys
+import tempfile
+
+# Keep the index of output types out of the user's cache directory
+indexDir = tempfile.TemporaryDirectory()
+atexit.register(indexDir.cleanup)
+os.environ["CORNICHON_INDEX"] = os.path.join(indexDir.name, "outputs.json")
 
 curdir = os.path.dirname(os.path.realpath(__file__))
 subdir = os.path.join(curdir, '../cornichon')
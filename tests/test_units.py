@@ -25,6 +25,13 @@ class Units(unittest.TestCase):
         scenario.GivenAnArgument(arg)
         scenario.ThenItHasCorresponding(output)
 
+    def Cased(self, arg, case, output):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Cased()
+        scenario.GivenAnArgument(arg)
+        scenario.GivenACase(case)
+        scenario.ThenItHasCorresponding(output)
+
     def Argumental(self, args, types, language, declaration, output):
         """Gherkin DSL scenario"""
         scenario = Scenarios.Argumental()
@@ -34,6 +41,26 @@ class Units(unittest.TestCase):
         scenario.GivenItIsADeclaration(declaration)
         scenario.ThenItHasCorresponding(output)
 
+    def Rendered(self, template, values, output):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Rendered()
+        scenario.GivenATemplate(template)
+        scenario.GivenValues(values)
+        scenario.ThenItHasCorresponding(output)
+
+    def Surrounded(self, template, values, head, tail):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Surrounded()
+        scenario.GivenATemplate(template)
+        scenario.GivenValues(values)
+        scenario.ThenItSurroundsTheTestBodyWithAnd(head, tail)
+
+    def Distinguished(self, kind):
+        """Gherkin DSL scenario"""
+        scenario = Scenarios.Distinguished()
+        scenario.GivenTwoFunctionsWithTheSameName(kind)
+        scenario.ThenFreezingThemKeepsThemApart()
+
     def test_templated_one_int_int_int_one(self):
         """Gherkin DSL test"""
         self.Templated("one", "int", "int {}", "int one")
@@ -62,6 +89,26 @@ class Units(unittest.TestCase):
         """Gherkin DSL test"""
         self.Snaked("1 9", "1_9")
 
+    def test_cased_the_quick_brown_camel_theQuickBrown(self):
+        """Gherkin DSL test"""
+        self.Cased("the  quick,  brown", "Camel", "TheQuickBrown")
+
+    def test_cased_a_lazy_dog_camel_aLazyDog(self):
+        """Gherkin DSL test"""
+        self.Cased("a  lazy,  dog", "camel", "aLazyDog")
+
+    def test_cased_the_quick_brown_snake_the_quick_brown(self):
+        """Gherkin DSL test"""
+        self.Cased("the  quick,  brown", "snake", "the_quick_brown")
+
+    def test_cased_a_lazy_dog_snake_a_lazy_dog(self):
+        """Gherkin DSL test"""
+        self.Cased("a  lazy,  dog", "Snake", "A_lazy_dog")
+
+    def test_cased_the_quick_brown_thequickbrown(self):
+        """Gherkin DSL test"""
+        self.Cased("the  quick,  brown", "", "thequickbrown")
+
     def test_argumental_acdef_intstringuintfloatbool_cpp_true_int_a_const_stdstring_c_unsigned_int_d_double_e_bool_f(self):
         """Gherkin DSL test"""
         self.Argumental("a,c,d,e,f", "int,string,uint,float,bool", "cpp", True, "int a, const std::string& c, unsigned int d, double e, bool f")
@@ -78,6 +125,34 @@ class Units(unittest.TestCase):
         """Gherkin DSL test"""
         self.Argumental("false,False,true,True", "bool,bool,bool,bool", "python", False, "False, False, True, True")
 
+    def test_rendered_a_and_b_a1b2_1_and_2(self):
+        """Gherkin DSL test"""
+        self.Rendered("[[a]] and [[b]]", "a=1,b=2", "1 and 2")
+
+    def test_rendered_ac_ax_xc(self):
+        """Gherkin DSL test"""
+        self.Rendered("[[a]][[c]]", "a=x", "x[[c]]")
+
+    def test_rendered_a_a_b_abby_b_b_y(self):
+        """Gherkin DSL test"""
+        self.Rendered("[[a]] [[a]], [[b]]", "a=[[b]],b=y", "[[b]] [[b]], y")
+
+    def test_surrounded_aTestBodyb_a1b2_1_2(self):
+        """Gherkin DSL test"""
+        self.Surrounded("[[a]]-[[TestBody]]-[[b]]", "a=1,b=2", "1-", "-2")
+
+    def test_surrounded_aTestBodyc_aTestBody_testBody_c(self):
+        """Gherkin DSL test"""
+        self.Surrounded("[[a]][[TestBody]][[c]]", "a=[[TestBody]]", "[[TestBody]]", "[[c]]")
+
+    def test_distinguished_lambda(self):
+        """Gherkin DSL test"""
+        self.Distinguished("lambda")
+
+    def test_distinguished_local(self):
+        """Gherkin DSL test"""
+        self.Distinguished("local")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -27,6 +27,18 @@ Scenario Outline: snaked
     | 1.9    | 19     |
     | 1 9    | 1_9    |
 
+Scenario Outline: cased
+  Given an argument <arg>
+  And a case <case>
+  Then it has corresponding <output>
+  Examples:
+    | arg                 | case  | output          |
+    | the  quick,  brown  | Camel | TheQuickBrown   |
+    | a  lazy,  dog       | camel | aLazyDog        |
+    | the  quick,  brown  | snake | the_quick_brown |
+    | a  lazy,  dog       | Snake | A_lazy_dog      |
+    | the  quick,  brown  |       | thequickbrown   |
+
 Scenario Outline: argumental
   Given arguments <args>
   And types <types>
@@ -39,3 +51,30 @@ Scenario Outline: argumental
     | -9,as is,10,1.75,False | int,string,uint,float,bool | cpp | False | -9, "as is", 10, 1.75, false |
     | true,True,false,False | bool,bool,bool,bool | cpp | False | true, true, false, false |
     | false,False,true,True | bool,bool,bool,bool | python | False | False, False, True, True |
+
+Scenario Outline: rendered
+  Given a template <template>
+  And values <values>
+  Then it has corresponding <output>
+  Examples:
+    | template             | values       | output         |
+    | [[a]] and [[b]]      | a=1,b=2      | 1 and 2        |
+    | [[a]][[c]]           | a=x          | x[[c]]         |
+    | [[a]] [[a]], [[b]]   | a=[[b]],b=y  | [[b]] [[b]], y |
+
+Scenario Outline: surrounded
+  Given a template <template>
+  And values <values>
+  Then it surrounds the test body with <head> and <tail>
+  Examples:
+    | template                  | values         | head         | tail  |
+    | [[a]]-[[TestBody]]-[[b]]  | a=1,b=2        | 1-           | -2    |
+    | [[a]][[TestBody]][[c]]    | a=[[TestBody]] | [[TestBody]] | [[c]] |
+
+Scenario Outline: distinguished
+  Given two <kind> functions with the same name
+  Then freezing them keeps them apart
+  Examples:
+    | kind   |
+    | lambda |
+    | local  |